@@ -0,0 +1,205 @@
+"""
+Compare the two-call analysis (insights + common ground chains) with the
+combined single-call mode (`LLM_COMBINED_ANALYSIS`).
+
+For each example profile in `data/` both paths run sequentially, and the
+script reports prompt tokens (counted locally with the model's tokenizer),
+the token usage reported by the API, and latency percentiles per path. Set
+`LLM_OUTPUT_MODE` to compare the structured output modes as well.
+
+Offline against the fake OpenAI endpoint, with latency proportional to tokens:
+
+    python -m benchmarks.combined_analysis --repeat 5 \\
+        --openai-latency 0.3 --openai-prompt-token-latency 0.0002 --openai-token-latency 0.01
+
+Against the real API (uses OPENAI_API_KEY / OPENAI_MODEL_NAME from the environment):
+
+    python -m benchmarks.combined_analysis --live --repeat 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.fake_services import DATA_DIR, FakeLatencies
+from benchmarks.run_benchmark import _free_port, percentile, start_fake_upstreams
+
+USER_INFORMATION = (
+    "I studied data science in Germany, work as a machine learning engineer "
+    "and mentor students in applied AI."
+)
+
+
+def _configure_env(live: bool, fake_port: Optional[int]) -> None:
+    """Settings are read on first use, so the environment must be ready before that."""
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("PROXYCURL_API_KEY", "benchmark")
+    os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+    os.environ.setdefault("LINKEDIN_USERNAME", "benchmark")
+    os.environ.setdefault("LINKEDIN_PASSWORD", "benchmark")
+    if not live:
+        os.environ["OPENAI_API_KEY"] = "benchmark"
+        os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{fake_port}/v1"
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+
+def _reported_tokens(model_name: str) -> Dict[str, float]:
+    from prometheus_client import REGISTRY
+
+    return {
+        token_type: REGISTRY.get_sample_value(
+            "connect_pro_llm_tokens_total", {"model": model_name, "type": token_type}
+        ) or 0.0
+        for token_type in ("prompt", "completion")
+    }
+
+
+async def _run_paths(profiles: List[Dict], repeat: int) -> Dict[str, Dict]:
+    from connect_pro.config.settings import settings
+    from connect_pro.llm.tokens import count_tokens
+    from connect_pro.main import (
+        agenerate_combined_analysis,
+        agenerate_common_ground_from_profile,
+        agenerate_insights_from_profile,
+        prepare_profile_information,
+    )
+    from connect_pro.prompts.combined_analysis import (
+        combined_analysis_prompt,
+        combined_analysis_structured_prompt,
+    )
+    from connect_pro.prompts.common_ground import common_ground_prompt
+    from connect_pro.prompts.profile_analysis import (
+        profile_analysis_prompt,
+        profile_analysis_structured_prompt,
+    )
+
+    model_name = settings.OPENAI_MODEL_NAME
+    # Native structured output modes send the schema as a parameter, not in the prompt
+    if settings.LLM_OUTPUT_MODE.lower() != "prompt":
+        profile_analysis_prompt = profile_analysis_structured_prompt
+        combined_analysis_prompt = combined_analysis_structured_prompt
+
+    async def two_calls(profile_information):
+        await asyncio.gather(
+            agenerate_insights_from_profile(profile_information),
+            agenerate_common_ground_from_profile(profile_information, USER_INFORMATION),
+        )
+
+    async def combined(profile_information):
+        await agenerate_combined_analysis(profile_information, USER_INFORMATION)
+
+    def two_call_prompt_tokens(profile_information) -> int:
+        inputs = {"profile_information": profile_information, "user_information": USER_INFORMATION}
+        return count_tokens(
+            profile_analysis_prompt.format(profile_information=profile_information), model_name
+        ) + count_tokens(common_ground_prompt.format(**inputs), model_name)
+
+    def combined_prompt_tokens(profile_information) -> int:
+        return count_tokens(
+            combined_analysis_prompt.format(
+                profile_information=profile_information, user_information=USER_INFORMATION
+            ),
+            model_name,
+        )
+
+    paths = {
+        "two_calls": (two_calls, two_call_prompt_tokens, 2),
+        "combined": (combined, combined_prompt_tokens, 1),
+    }
+    results = {}
+    for name, (run, prompt_tokens, calls) in paths.items():
+        # Untimed first run, so client setup and connection pooling are not measured
+        await run(prepare_profile_information(profiles[0]))
+        latencies, local_tokens = [], []
+        before = _reported_tokens(model_name)
+        for _ in range(repeat):
+            for profile in profiles:
+                profile_information = prepare_profile_information(profile)
+                local_tokens.append(prompt_tokens(profile_information))
+                started_at = time.perf_counter()
+                await run(profile_information)
+                latencies.append(time.perf_counter() - started_at)
+        after = _reported_tokens(model_name)
+
+        runs = len(latencies)
+        results[name] = {
+            "runs": runs,
+            "llm_calls_per_run": calls,
+            "prompt_tokens_per_run": statistics.mean(local_tokens),
+            "reported_prompt_tokens_per_run": (after["prompt"] - before["prompt"]) / runs,
+            "reported_completion_tokens_per_run": (
+                after["completion"] - before["completion"]
+            ) / runs,
+            "latency_p50": percentile(latencies, 50),
+            "latency_p95": percentile(latencies, 95),
+            "latency_mean": statistics.mean(latencies),
+        }
+    return results
+
+
+def format_report(results: Dict[str, Dict]) -> str:
+    lines = [
+        f"{'path':<12}{'calls':>6}{'prompt tok':>12}{'reported in':>13}{'reported out':>14}"
+        f"{'p50 ms':>9}{'p95 ms':>9}"
+    ]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<12}{result['llm_calls_per_run']:>6}{result['prompt_tokens_per_run']:>12.0f}"
+            f"{result['reported_prompt_tokens_per_run']:>13.0f}"
+            f"{result['reported_completion_tokens_per_run']:>14.0f}"
+            f"{result['latency_p50'] * 1000:>9.0f}{result['latency_p95'] * 1000:>9.0f}"
+        )
+    two_calls, combined = results["two_calls"], results["combined"]
+    if two_calls["prompt_tokens_per_run"]:
+        saved = 1 - combined["prompt_tokens_per_run"] / two_calls["prompt_tokens_per_run"]
+        lines.append(f"\nCombined mode sends {saved:.0%} fewer prompt tokens per analysis.")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare two-call and combined single-call profile analysis."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per profile and path")
+    parser.add_argument("--live", action="store_true", help="Call the real OpenAI API")
+    parser.add_argument("--openai-latency", type=float, default=0.3)
+    parser.add_argument("--openai-prompt-token-latency", type=float, default=0.0002)
+    parser.add_argument("--openai-token-latency", type=float, default=0.01)
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    fake_port = None
+    if not args.live:
+        fake_port = _free_port()
+        start_fake_upstreams(
+            FakeLatencies(
+                openai=args.openai_latency,
+                openai_per_token=args.openai_token_latency,
+                openai_per_prompt_token=args.openai_prompt_token_latency,
+            ),
+            fake_port,
+        )
+    _configure_env(args.live, fake_port)
+
+    profiles = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(DATA_DIR.glob("example_linkedin_profile_*.json"))
+    ]
+    results = asyncio.run(_run_paths(profiles, args.repeat))
+
+    print(format_report(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Local stand-ins for the OpenAI, Tavily and Proxycurl APIs.
+
+One FastAPI app serves all three so the analyzer can run end to end without
+network access or API keys:
+
+    POST /v1/chat/completions     OpenAI-compatible chat completions (incl. streaming,
+                                  json_schema response formats and tool calls)
+    POST /search                  Tavily search
+    GET  /proxycurl/api/v2/linkedin   Proxycurl profile lookup
+
+Each endpoint sleeps for a configurable latency before answering, so upstream
+delays can be modelled. Run standalone with:
+
+    python -m benchmarks.fake_services --port 8100 --openai-latency 0.8
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+CANNED_INSIGHTS = {
+    "professional_summary": (
+        "A data scientist building machine learning solutions for enterprise clients, "
+        "with a track record of shipping models to production."
+    ),
+    "personal_background": (
+        "Studied data science and moved from research internships into industry roles."
+    ),
+    "interesting_facts": [
+        "Has worked across three countries.",
+        "Mentors students in applied machine learning.",
+    ],
+}
+
+CANNED_COMMON_GROUND = (
+    "You and Ruslan both studied data science and work on applied machine learning, "
+    "so his path from research into industry could be a good conversation starter."
+)
+
+_SEARCH_QUERY = re.compile(r"search query (.+?), find this person")
+_PROFILE_URL = re.compile(r"https://www\.linkedin\.com/in/[\w-]+")
+
+
+@dataclass
+class FakeLatencies:
+    """Simulated upstream latencies in seconds."""
+
+    openai: float = 0.5
+    openai_per_token: float = 0.0
+    openai_per_prompt_token: float = 0.0
+    tavily: float = 0.2
+    proxycurl: float = 0.5
+
+
+def _load_profiles() -> List[Dict]:
+    paths = sorted(DATA_DIR.glob("example_linkedin_profile_*.json"))
+    return [json.loads(path.read_text(encoding="utf-8")) for path in paths]
+
+
+def _slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _chat_reply(prompt: str) -> str:
+    """Pick the canned answer for whichever chain sent the prompt."""
+    if "Final Answer:" in prompt:
+        # ReAct agent: search once, then answer with the first profile URL seen
+        observed = _PROFILE_URL.findall(prompt.split("Begin!", 1)[-1])
+        if observed:
+            return f"I now know the final answer\nFinal Answer: {observed[0]}"
+        match = _SEARCH_QUERY.search(prompt)
+        query = match.group(1) if match else "profile"
+        return f"I should search for the profile\nAction: LinkedIn Profile Search\nAction Input: {query}"
+    if "professional_summary" in prompt:
+        if '"common_ground"' in prompt:
+            # Combined analysis schema
+            return json.dumps({**CANNED_INSIGHTS, "common_ground": CANNED_COMMON_GROUND})
+        return json.dumps(CANNED_INSIGHTS)
+    return CANNED_COMMON_GROUND
+
+
+def _usage(prompt: str, completion: str) -> Dict[str, int]:
+    # Roughly four characters per token, enough for token accounting in benchmarks
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(completion) // 4)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def create_fake_app(latencies: FakeLatencies, failing_models: Sequence[str] = ()) -> FastAPI:
+    """Create the fake upstream app; chat calls to `failing_models` answer 503 (an outage)."""
+    app = FastAPI(title="Connect Pro fake upstreams")
+    profiles = _load_profiles()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if body.get("model") in failing_models:
+            await asyncio.sleep(latencies.openai)
+            return JSONResponse(
+                {"error": {"message": "The model is overloaded", "type": "server_error"}},
+                status_code=503,
+            )
+        prompt = "\n".join(str(message.get("content", "")) for message in body["messages"])
+        # Native structured output sends the schema as response_format or a forced tool;
+        # like the real API, it is matched on and counted as prompt tokens
+        tools = body.get("tools") or []
+        schemas = "".join(json.dumps(item) for item in [body.get("response_format"), *tools] if item)
+        reply = _chat_reply(prompt + schemas)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = body.get("model", "gpt-4o-mini")
+
+        usage = _usage(prompt + schemas, reply)
+        # Fixed overhead plus prompt processing; generation time is added per token below
+        await asyncio.sleep(
+            latencies.openai + latencies.openai_per_prompt_token * usage["prompt_tokens"]
+        )
+
+        if not body.get("stream"):
+            await asyncio.sleep(latencies.openai_per_token * usage["completion_tokens"])
+            message = {"role": "assistant", "content": reply}
+            finish_reason = "stop"
+            if tools:
+                # Function calling: answer with a call to the (forced) first tool
+                tool_call = {
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {"name": tools[0]["function"]["name"], "arguments": reply},
+                }
+                message = {"role": "assistant", "content": None, "tool_calls": [tool_call]}
+                finish_reason = "tool_calls"
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                "usage": usage,
+            }
+
+        async def chunks():
+            def chunk(delta: Dict, finish_reason=None, usage=None) -> str:
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": (
+                        [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                        if usage is None
+                        else []
+                    ),
+                    "usage": usage,
+                }
+                return f"data: {json.dumps(payload)}\n\n"
+
+            if tools:
+                # Function calling: stream the arguments of a call to the (forced) first tool
+                yield chunk({"role": "assistant", "content": None, "tool_calls": [{
+                    "index": 0,
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {"name": tools[0]["function"]["name"], "arguments": ""},
+                }]})
+            else:
+                yield chunk({"role": "assistant", "content": ""})
+            for token in re.findall(r"\S+\s*", reply):
+                if latencies.openai_per_token:
+                    await asyncio.sleep(latencies.openai_per_token)
+                if tools:
+                    yield chunk({"tool_calls": [{"index": 0, "function": {"arguments": token}}]})
+                else:
+                    yield chunk({"content": token})
+            yield chunk({}, finish_reason="tool_calls" if tools else "stop")
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield chunk({}, usage=usage)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.post("/search")
+    async def tavily_search(request: Request):
+        body = await request.json()
+        query = body.get("query", "")
+        name = re.sub(r"\s+linkedin profile$", "", query, flags=re.IGNORECASE).strip()
+
+        await asyncio.sleep(latencies.tavily)
+
+        results = [
+            {
+                "url": f"https://www.linkedin.com/in/{_slugify(name)}",
+                "title": f"{name.title()} - Data Scientist | LinkedIn",
+                "content": f"{name.title()} works on machine learning.",
+                "score": 0.95,
+            },
+            {
+                "url": "https://www.linkedin.com/company/example",
+                "title": "Example Company | LinkedIn",
+                "content": "Company page",
+                "score": 0.4,
+            },
+        ]
+        return {"query": query, "results": results, "response_time": latencies.tavily}
+
+    @app.get("/proxycurl/api/v2/linkedin")
+    async def proxycurl_profile(url: str):
+        await asyncio.sleep(latencies.proxycurl)
+        if not profiles:
+            return JSONResponse({"description": "No example profiles found"}, status_code=404)
+        # Same URL, same profile
+        return profiles[sum(url.encode()) % len(profiles)]
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake OpenAI, Tavily and Proxycurl APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--openai-latency", type=float, default=0.5)
+    parser.add_argument("--openai-token-latency", type=float, default=0.0)
+    parser.add_argument("--openai-prompt-token-latency", type=float, default=0.0)
+    parser.add_argument("--tavily-latency", type=float, default=0.2)
+    parser.add_argument("--proxycurl-latency", type=float, default=0.5)
+    parser.add_argument(
+        "--openai-failing-model", action="append", default=[], help="Model answering 503"
+    )
+    args = parser.parse_args()
+
+    import uvicorn
+
+    latencies = FakeLatencies(
+        openai=args.openai_latency,
+        openai_per_token=args.openai_token_latency,
+        openai_per_prompt_token=args.openai_prompt_token_latency,
+        tavily=args.tavily_latency,
+        proxycurl=args.proxycurl_latency,
+    )
+    uvicorn.run(
+        create_fake_app(latencies, args.openai_failing_model),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Import-time benchmark for the API module (cold start of a worker).
+
+Imports `connect_pro.app` in fresh interpreters, reports the median wall time
+and the slowest imported packages from `python -X importtime`, and optionally
+fails when the median exceeds a budget, so regressions show up in CI:
+
+    python -m benchmarks.import_time --runs 5 --max-ms 1500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Settings are required but never used for network calls during import
+_DUMMY_ENV = {
+    "OPENAI_API_KEY": "benchmark",
+    "PROXYCURL_API_KEY": "benchmark",
+    "TAVILY_API_KEY": "benchmark",
+    "LINKEDIN_USERNAME": "benchmark",
+    "LINKEDIN_PASSWORD": "benchmark",
+}
+
+
+def _env() -> Dict[str, str]:
+    env = {**_DUMMY_ENV, **os.environ}
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH")])
+    )
+    return env
+
+
+def measure_import(module: str) -> float:
+    """Wall time in seconds to start an interpreter and import the module."""
+    started_at = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], env=_env(), check=True)
+    return time.perf_counter() - started_at
+
+
+def slowest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """Packages ranked by the time spent importing their modules (seconds), from `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_env(),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(self_us) / 1e6
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of the API.")
+    parser.add_argument("--module", default="connect_pro.app", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median exceeds this budget")
+    args = parser.parse_args(argv)
+
+    # Baseline: interpreter startup alone, to report the module's own share
+    baseline = statistics.median(measure_import("sys") for _ in range(args.runs))
+    timings = [measure_import(args.module) for _ in range(args.runs)]
+    median = statistics.median(timings)
+
+    print(f"import {args.module}: median {median * 1000:.0f}ms over {args.runs} runs "
+          f"(min {min(timings) * 1000:.0f}ms, max {max(timings) * 1000:.0f}ms, "
+          f"interpreter startup {baseline * 1000:.0f}ms)")
+    print("\nSlowest packages:")
+    for package, seconds in slowest_imports(args.module, args.top):
+        print(f"  {package:<30}{seconds * 1000:>8.0f}ms")
+
+    if args.max_ms is not None and median * 1000 > args.max_ms:
+        print(f"\nFAIL: median import time exceeds the {args.max_ms:.0f}ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
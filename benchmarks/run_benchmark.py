@@ -0,0 +1,336 @@
+"""
+Offline load benchmark for the analyze API.
+
+Starts the fake upstreams (see `benchmarks.fake_services`) in this process,
+runs the API with uvicorn in a subprocess pointed at them, drives
+`POST /api/analyze` at a fixed concurrency and reports latency percentiles,
+throughput and a per-stage breakdown taken from the `Server-Timing` headers.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmark --requests 200 --concurrency 20
+    python -m benchmarks.run_benchmark --openai-latency 1.5 --json results.json
+
+Profile, LLM and search caches are disabled unless `--warm-caches` is given,
+and every request asks for a different person, so each run exercises the
+full pipeline.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+import uvicorn
+
+from benchmarks.fake_services import FakeLatencies, create_fake_app
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_FIRST_NAMES = [
+    "Anna", "Ben", "Chloe", "David", "Elena", "Felix", "Grace", "Hugo", "Ines", "Jonas",
+    "Klara", "Liam", "Maya", "Noah", "Olga", "Paul", "Rosa", "Samir", "Tara", "Viktor",
+]
+_LAST_NAMES = [
+    "Albrecht", "Brennan", "Castillo", "Dimitrov", "Eriksen", "Fischer", "Gallagher",
+    "Horvath", "Ivanova", "Jansen", "Kowalski", "Lindqvist", "Moreau", "Novak",
+    "Okafor", "Petrov", "Quintero", "Rossi", "Schneider", "Tanaka",
+]
+
+
+@dataclass
+class RequestResult:
+    """Outcome of one benchmark request."""
+
+    latency: float
+    status: int
+    stages: Dict[str, float] = field(default_factory=dict)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _queries(count: int) -> List[str]:
+    """Distinct people, so no request is served by another one's cache or in-flight call."""
+    people = [f"{first} {last}" for last in _LAST_NAMES for first in _FIRST_NAMES]
+    return [
+        f"{people[index % len(people)]} Data Scientist {index // len(people) or ''}".strip()
+        for index in range(count)
+    ]
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """Parse a Server-Timing header into stage durations in seconds."""
+    stages = {}
+    for entry in filter(None, (part.strip() for part in header.split(","))):
+        name, *params = [item.strip() for item in entry.split(";")]
+        for param in params:
+            if param.startswith("dur="):
+                stages[name] = float(param[4:]) / 1000
+    return stages
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def start_fake_upstreams(
+    latencies: FakeLatencies, port: int, failing_models: Sequence[str] = ()
+) -> uvicorn.Server:
+    """Serve the fake upstreams on a background thread."""
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_fake_app(latencies, failing_models),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+        )
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def start_api(port: int, fake_port: int, cache_dir: str, warm_caches: bool) -> subprocess.Popen:
+    """Run the API with uvicorn, configured to talk to the fake upstreams only."""
+    fake_url = f"http://127.0.0.1:{fake_port}"
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH")])
+        ),
+        "OPENAI_API_KEY": "benchmark",
+        "PROXYCURL_API_KEY": "benchmark",
+        "TAVILY_API_KEY": "benchmark",
+        "LINKEDIN_USERNAME": os.environ.get("LINKEDIN_USERNAME", "benchmark"),
+        "LINKEDIN_PASSWORD": os.environ.get("LINKEDIN_PASSWORD", "benchmark"),
+        "OPENAI_BASE_URL": f"{fake_url}/v1",
+        "TAVILY_API_BASE_URL": fake_url,
+        "PROXYCURL_API_ENDPOINT": f"{fake_url}/proxycurl/api/v2/linkedin",
+        "LANGSMITH_TRACING": "false",
+        "JOB_WORKERS": "0",
+        "CACHE_DIR": cache_dir,
+    }
+    if not warm_caches:
+        env.update(
+            PROFILE_CACHE_ENABLED="false",
+            LLM_CACHE_ENABLED="false",
+            TAVILY_CACHE_TTL_SEC="0",
+        )
+
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "connect_pro.app:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=cache_dir,
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout_sec: float = 60) -> None:
+    deadline = time.monotonic() + timeout_sec
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                response = await client.get(f"{base_url}/metrics")
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"API did not start within {timeout_sec}s")
+            await asyncio.sleep(0.2)
+
+
+async def run_load(
+    base_url: str,
+    queries: List[str],
+    concurrency: int,
+    user_information: str,
+    timeout_sec: float,
+) -> List[RequestResult]:
+    """Send one analyze request per query with at most `concurrency` in flight."""
+    slots = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout_sec) as client:
+
+        async def one(query: str) -> RequestResult:
+            async with slots:
+                started_at = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/analyze",
+                        json={"query": query, "user_information": user_information},
+                    )
+                except httpx.HTTPError:
+                    return RequestResult(time.perf_counter() - started_at, status=0)
+                return RequestResult(
+                    latency=time.perf_counter() - started_at,
+                    status=response.status_code,
+                    stages=parse_server_timing(response.headers.get("server-timing", "")),
+                )
+
+        return await asyncio.gather(*(one(query) for query in queries))
+
+
+def summarize(results: List[RequestResult], wall_time: float) -> Dict:
+    """Latency percentiles, throughput and per-stage breakdown of successful requests."""
+    succeeded = [result for result in results if result.status == 200]
+    latencies = [result.latency for result in succeeded]
+
+    stage_names: List[str] = []
+    for result in succeeded:
+        stage_names.extend(name for name in result.stages if name not in stage_names)
+
+    stages = {}
+    for name in stage_names:
+        durations = [result.stages[name] for result in succeeded if name in result.stages]
+        stages[name] = {
+            "count": len(durations),
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "p99": percentile(durations, 99),
+        }
+
+    errors: Dict[str, int] = {}
+    for result in results:
+        if result.status != 200:
+            key = str(result.status or "transport_error")
+            errors[key] = errors.get(key, 0) + 1
+
+    return {
+        "requests": len(results),
+        "succeeded": len(succeeded),
+        "errors": errors,
+        "wall_time_sec": wall_time,
+        "throughput_rps": len(succeeded) / wall_time if wall_time else 0.0,
+        "latency": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=0.0),
+        },
+        "stages": stages,
+    }
+
+
+def format_report(summary: Dict) -> str:
+    latency = summary["latency"]
+    lines = [
+        f"Requests:   {summary['succeeded']}/{summary['requests']} succeeded"
+        + (f" (errors: {summary['errors']})" if summary["errors"] else ""),
+        f"Throughput: {summary['throughput_rps']:.2f} req/s over {summary['wall_time_sec']:.1f}s",
+        f"Latency:    p50={latency['p50'] * 1000:.0f}ms  p95={latency['p95'] * 1000:.0f}ms  "
+        f"p99={latency['p99'] * 1000:.0f}ms  max={latency['max'] * 1000:.0f}ms",
+        "",
+        f"{'stage':<20}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+    ]
+    for name, stage in summary["stages"].items():
+        lines.append(
+            f"{name:<20}{stage['count']:>7}{stage['p50'] * 1000:>10.0f}"
+            f"{stage['p95'] * 1000:>10.0f}{stage['p99'] * 1000:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark /api/analyze against local fake upstream APIs."
+    )
+    parser.add_argument("--requests", type=int, default=100, help="Measured requests")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests sent first")
+    parser.add_argument("--openai-latency", type=float, default=0.5, help="Seconds per LLM call")
+    parser.add_argument(
+        "--openai-token-latency", type=float, default=0.0, help="Seconds per generated token"
+    )
+    parser.add_argument(
+        "--openai-prompt-token-latency", type=float, default=0.0, help="Seconds per prompt token"
+    )
+    parser.add_argument(
+        "--openai-failing-model",
+        action="append",
+        default=[],
+        help="Model the fake OpenAI answers with 503 (to exercise LLM route fallbacks)",
+    )
+    parser.add_argument("--tavily-latency", type=float, default=0.2, help="Seconds per search")
+    parser.add_argument(
+        "--proxycurl-latency", type=float, default=0.5, help="Seconds per profile lookup"
+    )
+    parser.add_argument(
+        "--user-information",
+        default="I studied data science and work on machine learning in Berlin.",
+        help="Sent with every request (empty skips the common ground chain)",
+    )
+    parser.add_argument(
+        "--warm-caches", action="store_true", help="Keep profile, LLM and search caches enabled"
+    )
+    parser.add_argument("--timeout", type=float, default=120, help="Per-request timeout")
+    parser.add_argument("--json", type=Path, help="Also write the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    latencies = FakeLatencies(
+        openai=args.openai_latency,
+        openai_per_token=args.openai_token_latency,
+        openai_per_prompt_token=args.openai_prompt_token_latency,
+        tavily=args.tavily_latency,
+        proxycurl=args.proxycurl_latency,
+    )
+    fake_port, api_port = _free_port(), _free_port()
+    fake_server = start_fake_upstreams(latencies, fake_port, args.openai_failing_model)
+
+    with tempfile.TemporaryDirectory(prefix="connect_pro_bench_") as cache_dir:
+        api = start_api(api_port, fake_port, cache_dir, args.warm_caches)
+        base_url = f"http://127.0.0.1:{api_port}"
+        try:
+            asyncio.run(wait_until_ready(base_url))
+
+            queries = _queries(args.warmup + args.requests)
+            if args.warmup:
+                asyncio.run(
+                    run_load(base_url, queries[: args.warmup], args.concurrency,
+                             args.user_information, args.timeout)
+                )
+
+            started_at = time.perf_counter()
+            results = asyncio.run(
+                run_load(base_url, queries[args.warmup:], args.concurrency,
+                         args.user_information, args.timeout)
+            )
+            summary = summarize(results, time.perf_counter() - started_at)
+        finally:
+            api.terminate()
+            api.wait(timeout=30)
+            fake_server.should_exit = True
+
+    summary["config"] = vars(args) | {"json": str(args.json) if args.json else None}
+    print(format_report(summary))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+    return 0 if summary["succeeded"] == summary["requests"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ function App() {
   const [result, setResult] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
+  const [status, setStatus] = useState('');
   const textAreaRef = useRef(null);
 
   // Auto-resize textarea
@@ -23,15 +24,45 @@ function App() {
     adjustTextAreaHeight();
   }, [userInfo]);
 
+  // Read Server-Sent Events from a fetch response and hand each one to onEvent
+  const readEvents = async (response, onEvent) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // Events are separated by a blank line
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const rawEvent = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let eventName = 'message';
+        let data = '';
+        rawEvent.split('\n').forEach((line) => {
+          if (line.startsWith('event:')) eventName = line.slice(6).trim();
+          else if (line.startsWith('data:')) data += line.slice(5).trim();
+        });
+        onEvent(eventName, data ? JSON.parse(data) : {});
+      }
+    }
+  };
+
   // API Call Logic
   const handleSubmit = async (e) => {
     e.preventDefault();               // Prevents page refresh on form submit
     setLoading(true);                 // Start loading
     setError('');                     // Clear any previous errors
+    setResult(null);
+    setStatus('Finding profile...');
 
     try {
-      // Make API call to backend
-      const response = await fetch('http://localhost:8000/api/analyze', {
+      // Stream progress and partial results from the backend
+      const response = await fetch('http://localhost:8000/api/analyze/stream', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -45,13 +76,44 @@ function App() {
       if (!response.ok) {
         throw new Error('Failed to analyze Linkedin profile');
       }
-      
-      const data = await response.json();
-      setResult(data);
+
+      await readEvents(response, (eventName, data) => {
+        switch (eventName) {
+          case 'stage':
+            if (data.stage === 'url_resolved') {
+              setStatus('Fetching profile...');
+              setResult({ profile_url: data.profile_url, insights: {}, common_ground: '' });
+            } else if (data.stage === 'generating') {
+              setStatus('Analyzing...');
+            }
+            break;
+          case 'insights_partial':
+          case 'insights':
+            setResult((prev) => ({ ...prev, insights: data.insights }));
+            break;
+          case 'common_ground_delta':
+            setResult((prev) => ({ ...prev, common_ground: prev.common_ground + data.text }));
+            break;
+          case 'common_ground':
+            setResult((prev) => ({ ...prev, common_ground: data.text }));
+            break;
+          case 'done':
+            setResult(data);
+            break;
+          case 'not_found':
+            throw new Error('Linkedin profile not found');
+          case 'error':
+            throw new Error(data.detail || 'Failed to analyze Linkedin profile');
+          default:
+            break;
+        }
+      });
     } catch (err) {
+      setResult(null);
       setError(err.message);
     } finally {
       setLoading(false);
+      setStatus('');
     }
   };
 
@@ -81,7 +143,7 @@ function App() {
             {loading ? (
               <>
                 <span className="spinner"></span>
-                Analyzing...
+                {status || 'Analyzing...'}
               </>
             ) : (
               'Analyze'
@@ -102,7 +164,7 @@ function App() {
           
           <h2>Interesting Facts</h2>
           <ul>
-            {result.insights.interesting_facts.map((fact, index) => (
+            {(result.insights.interesting_facts || []).map((fact, index) => (
               <li key={index}>{fact}</li>
             ))}
           </ul>
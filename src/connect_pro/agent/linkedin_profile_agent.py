@@ -1,29 +1,51 @@
-from typing import Optional
+import logging
+from typing import Dict, List, Optional
 
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.prompts import PromptTemplate
 from langchain_core.tools import Tool
 from langchain_openai import ChatOpenAI
 
+from connect_pro.agent.profile_resolver import resolve_profile_url, resolver_stats
 from connect_pro.config.settings import settings
-from connect_pro.search.tavily_search import get_profile_data_search_tavily
+from connect_pro.llm.models import get_openai_llm
+from connect_pro.search.tavily_search import (
+    aget_profile_data_search_tavily,
+    get_profile_data_search_tavily,
+)
+from connect_pro.utils.metrics import timed, track_stage
+
+logger = logging.getLogger(__name__)
 
 
 class LinkedInProfileAgent:
     """Agent for retrieving LinkedIn profile URLs based on search criteria."""
 
-    def __init__(self, llm: Optional[ChatOpenAI] = None, verbose: bool = False):
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        verbose: bool = False,
+        resolver_mode: Optional[str] = None,
+        confidence_threshold: Optional[float] = None,
+    ):
         """Initialize the LinkedIn Profile Agent.
 
         Args:
-            llm: Language model to use (defaults to ChatOpenAI with specific settings)
+            llm: Language model to use (defaults to a new ChatOpenAI; see
+                 `connect_pro.llm.registry.get_profile_agent` for the shared agent)
             verbose: Whether to print detailed execution information
+            resolver_mode: "hybrid" tries local candidate scoring before the agent,
+                           "agent" always runs the ReAct agent (defaults to settings)
+            confidence_threshold: Minimum fast-path confidence (defaults to settings)
         """
-        self.llm = llm or ChatOpenAI(
-            temperature=0,
-            model_name=settings.OPENAI_MODEL_NAME,
-        )
+        self.llm = llm or get_openai_llm(temperature=0)
         self.verbose = verbose
+        self.resolver_mode = (resolver_mode or settings.PROFILE_RESOLVER_MODE).lower()
+        self.confidence_threshold = (
+            confidence_threshold
+            if confidence_threshold is not None
+            else settings.PROFILE_RESOLVER_CONFIDENCE_THRESHOLD
+        )
         self._setup_prompt()
         self._setup_tools()
         self._setup_agent()
@@ -43,6 +65,7 @@ class LinkedInProfileAgent:
             Tool(
                 name="LinkedIn Profile Search",
                 func=get_profile_data_search_tavily,
+                coroutine=aget_profile_data_search_tavily,
                 description="Searches for LinkedIn profile URLs based on name, company, position, or other identifying information",
             )
         ]
@@ -81,7 +104,8 @@ class LinkedInProfileAgent:
             agent=agent, tools=self.tools, verbose=self.verbose
         )
 
-    def find_profile(self, search_query: str) -> str:
+    @timed("find_profile")
+    def find_profile(self, search_query: str) -> Optional[str]:
         """
         Find a LinkedIn profile URL based on search criteria.
         
@@ -90,18 +114,65 @@ class LinkedInProfileAgent:
                           or other identifying information (e.g., "John Smith Software Engineer, Google, London") 
             
         Returns:
-            str: LinkedIn profile URL
+            str: LinkedIn profile URL, or None if the agent found no LinkedIn URL
+        """
+        if self.resolver_mode == "hybrid":
+            candidates = get_profile_data_search_tavily(search_query)
+            profile_url = self._resolve_fast_path(search_query, candidates)
+            if profile_url:
+                return profile_url
+
+        with track_stage("react_agent"):
+            result = self.agent_executor.invoke(
+                input={"input": self.prompt_template.format_prompt(search_query=search_query)}
+            )
+        return self._parse_output(result)
+
+    @timed("find_profile")
+    async def afind_profile(self, search_query: str) -> Optional[str]:
+        """
+        Async variant of `find_profile`, running the agent with `ainvoke`.
+        
+        Args:
+            search_query: Search string that can include name, company, position,
+                          or other identifying information
             
-        Raises:
-            ValueError: If no valid LinkedIn profile URL is found
+        Returns:
+            str: LinkedIn profile URL, or None if the agent found no LinkedIn URL
         """
-        result = self.agent_executor.invoke(
-            input={"input": self.prompt_template.format_prompt(search_query=search_query)}
+        if self.resolver_mode == "hybrid":
+            candidates = await aget_profile_data_search_tavily(search_query)
+            profile_url = self._resolve_fast_path(search_query, candidates)
+            if profile_url:
+                return profile_url
+
+        with track_stage("react_agent"):
+            result = await self.agent_executor.ainvoke(
+                input={"input": self.prompt_template.format_prompt(search_query=search_query)}
+            )
+        return self._parse_output(result)
+
+    def _resolve_fast_path(
+        self, search_query: str, candidates: Optional[List[Dict]]
+    ) -> Optional[str]:
+        """Score search results locally and return a URL if the match is confident."""
+        profile_url, confidence = resolve_profile_url(
+            search_query, candidates or [], self.confidence_threshold
         )
+        resolver_stats.record(hit=profile_url is not None)
+        if self.verbose:
+            outcome = "hit" if profile_url else "fallback to agent"
+            logger.info(
+                f"Fast-path resolver {outcome} (confidence={confidence:.2f}, "
+                f"hit_rate={resolver_stats.hit_rate:.2f})"
+            )
+        return profile_url
 
+    @staticmethod
+    def _parse_output(result: dict) -> Optional[str]:
+        """Extract the profile URL from the agent executor output."""
         profile_url = result.get("output", "").strip()
         if not profile_url or "linkedin.com" not in profile_url:
             return None
 
         return profile_url
-
@@ -0,0 +1,221 @@
+"""Deterministic scoring of LinkedIn search results, used to skip the ReAct agent."""
+
+import re
+import threading
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+
+from connect_pro.scrapers.linkedin.cache import canonicalize_profile_url
+from connect_pro.utils.metrics import record_cache_lookup
+
+# Query words that never identify a person
+_STOPWORDS = {
+    "a", "an", "and", "at", "by", "for", "from", "in", "of", "on", "the", "to",
+    "linkedin", "profile", "www", "com",
+}
+
+# Two candidates closer than this are treated as ambiguous
+AMBIGUITY_MARGIN = 0.1
+
+# Score cap for candidates missing part of the queried name, or all of the
+# queried company/position words (below any sensible acceptance threshold)
+MISMATCH_MAX_SCORE = 0.5
+
+# Min similarity for a query word to count as part of the candidate's name
+# (spelling variants like 'muller'/'mueller'; prefixes like 'smith'/'smithson' do not count)
+NAME_MATCH_MIN_SIMILARITY = 0.85
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase, strip accents and split text into word tokens."""
+    normalized = unicodedata.normalize("NFKD", text)
+    ascii_text = normalized.encode("ascii", "ignore").decode("ascii").lower()
+    return [
+        token
+        for token in re.split(r"[^a-z0-9]+", ascii_text)
+        if token and token not in _STOPWORDS
+    ]
+
+
+def _token_similarity(a: str, b: str) -> float:
+    """Similarity of two tokens: exact, prefix (e.g. 'Yermak'/'Yermakov') or fuzzy."""
+    if a == b:
+        return 1.0
+    if min(len(a), len(b)) >= 3 and (a.startswith(b) or b.startswith(a)):
+        return 0.8
+    ratio = SequenceMatcher(None, a, b).ratio()
+    return ratio if ratio >= 0.8 else 0.0
+
+
+def _best_match(token: str, candidates: List[str]) -> float:
+    return max((_token_similarity(token, c) for c in candidates), default=0.0)
+
+
+def _is_name_match(token: str, candidates: List[str]) -> bool:
+    """Whether a query word is (a spelling variant of) one of the candidate's name words."""
+    return any(
+        token == c or SequenceMatcher(None, token, c).ratio() >= NAME_MATCH_MIN_SIMILARITY
+        for c in candidates
+    )
+
+
+def _split_title(title: str) -> Tuple[str, str]:
+    """Split a result title like 'Jane Doe - Engineer - Acme | LinkedIn' into name and rest."""
+    title = title.split("|")[0]
+    parts = re.split(r"\s+[-–—]\s+", title, maxsplit=1)
+    name = parts[0]
+    rest = parts[1] if len(parts) > 1 else ""
+    return name, rest
+
+
+def _slug_tokens(url: str) -> List[str]:
+    """Extract the name-like tokens from a profile URL slug."""
+    slug = canonicalize_profile_url(url).rsplit("/in/", 1)[-1]
+    return [token for token in _tokenize(slug.replace("-", " ")) if not token.isdigit()]
+
+
+def score_candidate(search_query: str, candidate: Dict) -> float:
+    """
+    Score how well a search result matches the query.
+
+    Combines name-token overlap with the result title, company/position matches
+    for the remaining query words, and similarity of the URL slug. The score is
+    capped at `MISMATCH_MAX_SCORE` unless every name token of the query (the
+    leading words before the first company/position word found in the result)
+    matches a word of the candidate's name or slug exactly or as a close
+    spelling variant (a prefix such as 'Smith'/'Smithson' is not enough), and,
+    when the query has company/position words, at least one of them appears
+    in the result.
+
+    Args:
+        search_query: Original search query (name, company, position, ...)
+        candidate: Search result dict with `url` and `title`
+
+    Returns:
+        Confidence score between 0 and 1
+    """
+    query_tokens = _tokenize(search_query)
+    if not query_tokens:
+        return 0.0
+
+    name_text, context_text = _split_title(candidate.get("title", ""))
+    slug_tokens = _slug_tokens(candidate.get("url", ""))
+    name_tokens = _tokenize(name_text) or slug_tokens
+    if not name_tokens:
+        return 0.0
+
+    # Every part of the candidate's name should appear in the query
+    name_score = sum(_best_match(token, query_tokens) for token in name_tokens) / len(
+        name_tokens
+    )
+
+    # Query words that are not part of the name should describe company/position
+    matched_name_tokens: Set[str] = {
+        q for q in query_tokens if _best_match(q, name_tokens) > 0
+    }
+    context_query_tokens = [q for q in query_tokens if q not in matched_name_tokens]
+    context_tokens = _tokenize(context_text)
+
+    # ...and every part of the queried name should appear in the candidate's name or slug
+    candidate_name_tokens = name_tokens + slug_tokens
+    name_covered = True
+    for q in query_tokens:
+        is_name_token = _is_name_match(q, candidate_name_tokens)
+        if not is_name_token and _best_match(q, context_tokens) > 0:
+            break  # company/position words start here
+        if not is_name_token:
+            name_covered = False
+            break
+
+    slug_score = (
+        sum(_best_match(token, query_tokens) for token in slug_tokens) / len(slug_tokens)
+        if slug_tokens
+        else 0.0
+    )
+
+    if not context_query_tokens:
+        score = 0.8 * name_score + 0.2 * slug_score
+        return score if name_covered else min(score, MISMATCH_MAX_SCORE)
+
+    context_score = sum(
+        1.0 for q in context_query_tokens if _best_match(q, context_tokens) > 0
+    ) / len(context_query_tokens)
+    score = 0.6 * name_score + 0.25 * context_score + 0.15 * slug_score
+    if not name_covered or context_score == 0:
+        return min(score, MISMATCH_MAX_SCORE)
+    return score
+
+
+def resolve_profile_url(
+    search_query: str, candidates: List[Dict], threshold: float
+) -> Tuple[Optional[str], float]:
+    """
+    Pick the best matching profile URL if the choice is unambiguous.
+
+    Args:
+        search_query: Original search query
+        candidates: Search results with `url` and `title`
+        threshold: Minimum confidence required to accept a candidate
+
+    Returns:
+        Tuple of (profile URL or None, confidence of the best candidate)
+    """
+    best_by_url: Dict[str, Tuple[float, str]] = {}
+    for candidate in candidates:
+        url = candidate.get("url", "")
+        if "linkedin.com/in/" not in url:
+            continue
+        key = canonicalize_profile_url(url)
+        score = score_candidate(search_query, candidate)
+        if key not in best_by_url or score > best_by_url[key][0]:
+            best_by_url[key] = (score, url)
+
+    if not best_by_url:
+        return None, 0.0
+
+    ranked = sorted(best_by_url.values(), reverse=True)
+    best_score, best_url = ranked[0]
+    if best_score < threshold:
+        return None, best_score
+    if len(ranked) > 1 and ranked[1][0] >= best_score - AMBIGUITY_MARGIN:
+        return None, best_score
+
+    return best_url, best_score
+
+
+class ResolverStats:
+    """Thread-safe counters for fast-path hits versus agent fallbacks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.fast_path_hits = 0
+        self.agent_fallbacks = 0
+
+    def record(self, hit: bool) -> None:
+        record_cache_lookup("resolver_fast_path", hit)
+        with self._lock:
+            if hit:
+                self.fast_path_hits += 1
+            else:
+                self.agent_fallbacks += 1
+
+    @property
+    def hit_rate(self) -> float:
+        with self._lock:
+            return self._hit_rate()
+
+    def _hit_rate(self) -> float:
+        total = self.fast_path_hits + self.agent_fallbacks
+        return self.fast_path_hits / total if total else 0.0
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "fast_path_hits": self.fast_path_hits,
+                "agent_fallbacks": self.agent_fallbacks,
+                "hit_rate": self._hit_rate(),
+            }
+
+
+resolver_stats = ResolverStats()
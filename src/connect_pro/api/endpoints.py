@@ -1,9 +1,30 @@
 
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict
+
+import httpx
 from dotenv import load_dotenv
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
-from connect_pro.api.schemas import SearchQuery, ProfileResponse
-from connect_pro.main import generate_profile_insights, generate_common_ground
+from connect_pro.agent.profile_resolver import resolver_stats
+from connect_pro.api.schemas import (
+    BatchQuery,
+    JobRequest,
+    JobResponse,
+    ProfileResponse,
+    RefreshRequest,
+    RefreshResponse,
+    SearchQuery,
+)
+from connect_pro.batch import aanalyze_batch
+from connect_pro.config.settings import settings
+from connect_pro.jobs.queue import SUCCEEDED, get_job_queue
+from connect_pro.jobs.webhooks import deliver_webhook
+from connect_pro.jobs.worker import get_job_worker_pool
+from connect_pro.main import aanalyze_profile, analysis_key, arefresh_profile_insights
+from connect_pro.streaming import astream_analysis, format_sse
 
 load_dotenv()
 
@@ -13,24 +34,120 @@ router = APIRouter()
 async def analyze_profile(search_query: SearchQuery):
     """Analyze a LinkedIn profile based on search query."""
     try:
-        result = generate_profile_insights(
+        result = await aanalyze_profile(
             search_query=search_query.query,
+            user_information=search_query.user_information,
             verbose=True
         )
         
         if not result:
             raise HTTPException(status_code=404, detail="Profile not found")
         
-        # Add common_ground to result if user_information is provided
-        if search_query.user_information:            
-            result["common_ground"] = generate_common_ground(
-                profile_url=result["profile_url"],
-                user_information=search_query.user_information,
-                verbose=True
-            )
-        
         return ProfileResponse(**result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.post("/analyze/stream")
+async def analyze_profile_stream(search_query: SearchQuery) -> StreamingResponse:
+    """Analyze a LinkedIn profile, streaming progress and partial results as Server-Sent Events."""
+
+    async def _events() -> AsyncIterator[str]:
+        async for event, data in astream_analysis(
+            search_query.query, user_information=search_query.user_information
+        ):
+            yield format_sse(event, data)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/analyze/batch")
+async def analyze_batch(batch_query: BatchQuery) -> StreamingResponse:
+    """Analyze many search queries; results stream back as JSON lines as they complete."""
+    if len(batch_query.queries) > settings.BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.BATCH_MAX_QUERIES} queries per batch",
+        )
+
+    async def _results() -> AsyncIterator[str]:
+        async for row in aanalyze_batch(
+            batch_query.queries, user_information=batch_query.user_information
+        ):
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_results(), media_type="application/x-ndjson")
+
+
+async def _deliver_finished_job_webhook(webhook_url: str, job: Dict[str, Any]) -> None:
+    async with httpx.AsyncClient(timeout=settings.JOB_WEBHOOK_TIMEOUT_SEC) as client:
+        await deliver_webhook(client, webhook_url, job)
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(
+    job_request: JobRequest, response: Response, background_tasks: BackgroundTasks
+) -> JobResponse:
+    """Queue an analysis and return its job id right away.
+
+    Submitting the same query and user information while an equivalent job is
+    pending (or recently succeeded) returns the existing job; the new
+    submitter's webhook is notified as well.
+    """
+    normalized_query, user_information_hash = analysis_key(
+        job_request.query, job_request.user_information
+    )
+    webhook_url = str(job_request.webhook_url) if job_request.webhook_url else None
+    job, created = await asyncio.to_thread(
+        get_job_queue().submit,
+        dedup_key=f"{normalized_query}:{user_information_hash}",
+        payload={
+            "query": job_request.query,
+            "user_information": job_request.user_information,
+        },
+        webhook_url=webhook_url,
+    )
+
+    worker_pool = get_job_worker_pool()
+    if created and worker_pool is not None:
+        worker_pool.notify()
+    if webhook_url and job.status == SUCCEEDED:
+        # The job finished before this submission, so no worker will call the webhook
+        background_tasks.add_task(_deliver_finished_job_webhook, webhook_url, job.to_dict())
+
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return JobResponse(**job.to_dict())
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str) -> JobResponse:
+    """Status of a background analysis job, with its result once it succeeded."""
+    job = await asyncio.to_thread(get_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(**job.to_dict())
+
+
+@router.post("/refresh", response_model=RefreshResponse)
+async def refresh_profile(request: RefreshRequest) -> RefreshResponse:
+    """Re-scrape a profile and regenerate insights only if it materially changed."""
+    try:
+        result = await arefresh_profile_insights(
+            profile_url=request.profile_url, force=request.force, verbose=True
+        )
+        return RefreshResponse(**result)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/metrics/resolver")
+async def resolver_metrics() -> Dict:
+    """Fast-path URL resolver hit rate, for tuning the confidence threshold."""
+    return resolver_stats.snapshot()
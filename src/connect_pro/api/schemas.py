@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, HttpUrl, field_validator
+
+from connect_pro.jobs.webhooks import check_webhook_host
 
 
 class SearchQuery(BaseModel):
@@ -8,9 +11,65 @@ class SearchQuery(BaseModel):
     user_information: str = ""  
 
 
+class BatchQuery(BaseModel):
+    """Input schema for analyzing many search queries at once."""
+    queries: List[str]
+    user_information: str = ""
+
+    @field_validator("queries")
+    @classmethod
+    def _strip_queries(cls, queries: List[str]) -> List[str]:
+        """Strip surrounding whitespace; blank queries are rejected."""
+        stripped = [query.strip() for query in queries]
+        blank = [index for index, query in enumerate(stripped) if not query]
+        if blank:
+            raise ValueError(f"queries must not be empty (index {', '.join(map(str, blank))})")
+        return stripped
+
+
 class ProfileResponse(BaseModel):
     """Response schema for profile analysis."""
     profile_url: str
     insights: Dict
     common_ground: Optional[str] = None
 
+
+
+class RefreshRequest(BaseModel):
+    """Input schema for re-analyzing a known profile."""
+    profile_url: str
+    force: bool = False
+
+
+class RefreshResponse(BaseModel):
+    """Response schema for an incremental profile re-analysis."""
+    profile_url: str
+    insights: Dict
+    regenerated: bool
+    changed_sections: List[str]
+
+
+class JobRequest(BaseModel):
+    """Input schema for submitting a background analysis job."""
+    query: str
+    user_information: str = ""
+    webhook_url: Optional[HttpUrl] = None
+
+    @field_validator("webhook_url")
+    @classmethod
+    def _check_webhook_host(cls, webhook_url: Optional[HttpUrl]) -> Optional[HttpUrl]:
+        """Keep the server from posting results to hosts it should not reach."""
+        if webhook_url is not None:
+            check_webhook_host(webhook_url.host or "")
+        return webhook_url
+
+
+class JobResponse(BaseModel):
+    """Status (and, once finished, result) of a background analysis job."""
+    job_id: str
+    status: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: float
+    updated_at: float
@@ -1,7 +1,29 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from connect_pro.api.endpoints import router as api_router
+from connect_pro.config.settings import settings
+from connect_pro.jobs.queue import get_job_queue
+from connect_pro.jobs.worker import start_job_workers, stop_job_workers
+from connect_pro.utils.metrics import ServerTimingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up (if enabled) and run the background job workers for the lifetime of the app."""
+    if settings.STARTUP_WARMUP:
+        from connect_pro.warmup import awarm_up
+
+        await awarm_up()
+    await start_job_workers(get_job_queue())
+    try:
+        yield
+    finally:
+        await stop_job_workers()
 
 
 def create_app() -> FastAPI:
@@ -10,7 +32,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="LinkedIn Profile Analyzer API",
         description="API for analyzing LinkedIn profiles",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan,
     )
     
     # Configure CORS
@@ -21,9 +44,17 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+
+    # Per-request stage breakdown in the Server-Timing header
+    app.add_middleware(ServerTimingMiddleware)
     
     # Include API routes
     app.include_router(api_router, prefix="/api")
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> Response:
+        """Prometheus metrics of this process."""
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
     
     return app
 
@@ -0,0 +1,115 @@
+"""Batch analysis of many search queries with bounded per-stage concurrency."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional, Sequence
+
+from connect_pro.config.settings import settings
+from connect_pro.main import (
+    afetch_profile,
+    afind_profile_url,
+    agenerate_analysis,
+    analysis_key,
+    prepare_profile_information,
+)
+from connect_pro.utils.singleflight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageLimits:
+    """Max concurrent calls per pipeline stage."""
+
+    search: int = field(default_factory=lambda: settings.BATCH_SEARCH_CONCURRENCY)
+    scrape: int = field(default_factory=lambda: settings.BATCH_SCRAPE_CONCURRENCY)
+    # Rows in the LLM stage at once (one or two LLM calls each, see `agenerate_analysis`)
+    llm: int = field(default_factory=lambda: settings.BATCH_LLM_CONCURRENCY)
+
+
+class _Stages:
+    """Semaphores shared by all rows of one batch."""
+
+    def __init__(self, limits: StageLimits) -> None:
+        self.search = asyncio.Semaphore(limits.search)
+        self.scrape = asyncio.Semaphore(limits.scrape)
+        self.llm = asyncio.Semaphore(limits.llm)
+
+
+async def _analyze_row(
+    stages: _Stages, search_query: str, user_information: str
+) -> Optional[Dict]:
+    """Run the analysis pipeline for one query, holding each stage's slot only while in it."""
+    async with stages.search:
+        profile_url = await afind_profile_url(search_query)
+    if not profile_url:
+        return None
+
+    async with stages.scrape:
+        profile_data = await afetch_profile(profile_url)
+    profile_information = prepare_profile_information(profile_data)
+
+    async with stages.llm:
+        insights, common_ground = await agenerate_analysis(profile_information, user_information)
+
+    result: Dict = {
+        "profile_url": profile_url,
+        "insights": insights.to_dict(),
+    }
+    if common_ground is not None:
+        result["common_ground"] = common_ground
+    return result
+
+
+async def aanalyze_batch(
+    queries: Sequence[str],
+    user_information: str = "",
+    limits: Optional[StageLimits] = None,
+) -> AsyncIterator[Dict]:
+    """
+    Analyze many search queries and yield each row's outcome as soon as it completes.
+
+    Tavily searches, profile scrapes and OpenAI calls each have their own
+    concurrency limit, so a slow stage does not starve the others. Duplicate
+    queries in the batch are analyzed once. A failing row is reported with its
+    error and does not abort the batch.
+
+    Args:
+        queries: Search queries (name, company, position, etc.)
+        user_information: Optional information about the user, shared by all rows
+        limits: Per-stage concurrency limits (defaults from settings)
+
+    Yields:
+        Dicts with index, query, status ("ok", "not_found" or "error") and
+        either result or error
+    """
+    stages = _Stages(limits or StageLimits())
+    flight = AsyncSingleFlight()
+
+    async def _run(index: int, search_query: str) -> Dict:
+        row = {"index": index, "query": search_query}
+        try:
+            result = await flight.do(
+                analysis_key(search_query, user_information),
+                _analyze_row,
+                stages,
+                search_query,
+                user_information,
+            )
+        except Exception as e:
+            logger.warning(f"Batch row {index} failed: {e}")
+            return {**row, "status": "error", "error": str(e)}
+
+        if result is None:
+            return {**row, "status": "not_found"}
+        return {**row, "status": "ok", "result": result}
+
+    tasks = [asyncio.create_task(_run(index, query)) for index, query in enumerate(queries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop outstanding rows if the consumer goes away (e.g. client disconnect)
+        for task in tasks:
+            task.cancel()
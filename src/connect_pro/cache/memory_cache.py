@@ -0,0 +1,53 @@
+"""In-process cache with TTL expiry and size-bounded LRU eviction."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe in-memory cache for short-lived results."""
+
+    def __init__(self, ttl_sec: float, max_entries: int = 1000):
+        """Initialize the cache.
+
+        Args:
+            ttl_sec: Seconds an entry stays valid
+            max_entries: Max entries kept before evicting the least recently used
+        """
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value and evict least recently used entries above the size bound."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_sec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,157 @@
+"""Persistent key-value cache backed by a local SQLite database."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """Key-value cache with TTL expiry and size-bounded LRU eviction.
+
+    Entries are stored as JSON (optionally zlib-compressed) in a single table,
+    partitioned by namespace so several caches can share one database file.
+    The database runs in WAL mode, so several processes can share it safely.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str = "default",
+        ttl_sec: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        compress: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            namespace: Logical partition of the cache within the database
+            ttl_sec: Seconds an entry stays valid (None disables expiry)
+            max_entries: Max entries kept in this namespace (None disables eviction)
+            compress: Whether to zlib-compress stored values
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.compress = compress
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                compressed INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_lru "
+            "ON cache_entries (namespace, accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, compressed, created_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, compressed, created_at = row
+            if self.ttl_sec is not None and now - created_at > self.ttl_sec:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                return None
+
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+
+        try:
+            return self._deserialize(value, bool(compressed))
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value and evict least recently used entries."""
+        now = time.time()
+        payload = self._serialize(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, compressed, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, int(self.compress), now, now),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    """
+                    DELETE FROM cache_entries
+                    WHERE namespace = ? AND key IN (
+                        SELECT key FROM cache_entries
+                        WHERE namespace = ?
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.namespace, self.namespace, self.max_entries),
+                )
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries of this namespace."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        return count
+
+    def _serialize(self, value: Any) -> bytes:
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        return zlib.compress(data) if self.compress else data
+
+    @staticmethod
+    def _deserialize(payload: bytes, compressed: bool) -> Any:
+        data = zlib.decompress(payload) if compressed else payload
+        return json.loads(data)
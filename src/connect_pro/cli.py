@@ -0,0 +1,137 @@
+"""
+Command line batch analysis of search queries from a CSV or JSONL file.
+
+Usage:
+    python -m connect_pro.cli attendees.csv --user-information "I work on ML infra" > results.jsonl
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional, TextIO
+
+from dotenv import load_dotenv
+
+from connect_pro.batch import StageLimits, aanalyze_batch
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_jsonl_query(line: str) -> Optional[str]:
+    """Return the query of a JSONL line, or None if the line holds no query."""
+    try:
+        item = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(item, dict):
+        item = item.get("query")
+    return item if isinstance(item, str) else None
+
+
+def read_queries(path: str) -> List[str]:
+    """
+    Read search queries from a CSV or JSONL file.
+
+    CSV files use the `query` column if present, otherwise the first column.
+    JSONL lines are either JSON strings or objects with a string `query`
+    field; other lines are skipped with a warning naming their line number.
+
+    Args:
+        path: Input file (`.csv`, `.jsonl`/`.ndjson`), or "-" for JSONL on stdin
+
+    Returns:
+        Non-empty queries in file order
+    """
+    if path != "-" and Path(path).suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        if not rows:
+            return []
+        header = [column.strip().lower() for column in rows[0]]
+        if "query" in header:
+            column, rows = header.index("query"), rows[1:]
+        else:
+            column = 0
+        queries = [row[column] for row in rows if len(row) > column]
+    else:
+        stream: TextIO = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            queries = []
+            for line_number, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                query = _parse_jsonl_query(line)
+                if query is None:
+                    logger.warning(
+                        f"Skipping line {line_number}: expected a JSON string "
+                        "or an object with a string 'query'"
+                    )
+                    continue
+                queries.append(query)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    return [query.strip() for query in queries if query and query.strip()]
+
+
+async def run_batch(
+    queries: List[str], user_information: str, limits: StageLimits, output: TextIO
+) -> int:
+    """Analyze the queries and write one JSON line per row; returns the failed row count."""
+    failed = 0
+    async for row in aanalyze_batch(queries, user_information=user_information, limits=limits):
+        if row["status"] == "error":
+            failed += 1
+        output.write(json.dumps(row, ensure_ascii=False) + "\n")
+        output.flush()
+    return failed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the batch analysis CLI."""
+    defaults = StageLimits()
+    parser = argparse.ArgumentParser(
+        description="Analyze LinkedIn profiles for a list of search queries."
+    )
+    parser.add_argument("input", help="CSV or JSONL file with queries ('-' reads JSONL from stdin)")
+    parser.add_argument("-o", "--output", help="Write JSONL results here instead of stdout")
+    parser.add_argument("--user-information", default="", help="Information about you, for common ground")
+    parser.add_argument("--user-information-file", help="Read the user information from a file")
+    parser.add_argument("--search-concurrency", type=int, default=defaults.search)
+    parser.add_argument("--scrape-concurrency", type=int, default=defaults.scrape)
+    parser.add_argument("--llm-concurrency", type=int, default=defaults.llm)
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+    user_information = args.user_information
+    if args.user_information_file:
+        user_information = Path(args.user_information_file).read_text(encoding="utf-8")
+
+    queries = read_queries(args.input)
+    logger.info(f"Analyzing {len(queries)} queries")
+
+    limits = StageLimits(
+        search=args.search_concurrency,
+        scrape=args.scrape_concurrency,
+        llm=args.llm_concurrency,
+    )
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        failed = asyncio.run(run_batch(queries, user_information, limits, output))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    logger.info(f"Done: {len(queries) - failed} succeeded or not found, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -12,9 +14,142 @@ class Settings(BaseSettings):
     # Other settings with defaults
     OPENAI_MODEL_NAME: str = "gpt-4o-mini"
 
+    # LinkedIn data source: "proxycurl" (API) or "selenium" (browser scraping)
+    LINKEDIN_SCRAPER_TYPE: str = "proxycurl"
+
+    # Upstream API locations (override to point at local stand-ins, e.g. in benchmarks)
+    OPENAI_BASE_URL: Optional[str] = None
+    # Requires tavily-python >= 0.7.10; unset, the client's default endpoint is used
+    TAVILY_API_BASE_URL: Optional[str] = None
+    PROXYCURL_API_ENDPOINT: str = "https://nubela.co/proxycurl/api/v2/linkedin"
+
+    # Connections in the pooled HTTP client shared by all OpenAI calls (per event loop)
+    OPENAI_MAX_CONNECTIONS: int = 100
+
     # Linkedin Credentials (for Selenium)
     LINKEDIN_USERNAME: str
     LINKEDIN_PASSWORD: str
+    # Optional extra accounts to spread scrapes across, as a JSON list of
+    # {"username", "password", "cooldown_period_sec"} objects
+    LINKEDIN_ACCOUNTS: List[Dict[str, Any]] = []
+
+    # Per-account scrape budget (token bucket shared by all workers on the node);
+    # a cooldown <= 0 disables the limit
+    LINKEDIN_COOLDOWN_PERIOD_SEC: float = 120
+    LINKEDIN_RATE_LIMIT_BURST: int = 1
+    LINKEDIN_RATE_LIMIT_MAX_WAIT_SEC: float = 600
+
+    # ProxyCurl HTTP client: concurrency cap (match the plan), timeouts and retries
+    PROXYCURL_MAX_CONCURRENCY: int = 5
+    PROXYCURL_TIMEOUT_SEC: float = 10
+    PROXYCURL_DEADLINE_SEC: float = 30
+    PROXYCURL_MAX_RETRIES: int = 3
+    PROXYCURL_BACKOFF_BASE_SEC: float = 0.5
+    PROXYCURL_BACKOFF_MAX_SEC: float = 8
+
+    # Max number of blocking Selenium scrapes running at once in async code paths
+    SELENIUM_MAX_WORKERS: int = 2
+
+    # Pool of warm, logged-in browsers per LinkedIn account
+    SELENIUM_POOL_SIZE: int = 1
+    SELENIUM_MAX_PAGES_PER_DRIVER: int = 50
+    SELENIUM_PERSIST_COOKIES: bool = True
+
+    # Explicit wait budgets (seconds) for page loads and each extracted field
+    SELENIUM_PAGE_LOAD_TIMEOUT_SEC: float = 15
+    SELENIUM_FIELD_TIMEOUT_SEC: float = 2
+
+    # Lightweight browser: skip images, fonts, media and trackers; return on DOM ready
+    SELENIUM_BLOCK_RESOURCES: bool = True
+    SELENIUM_EXTRA_BLOCKED_URLS: List[str] = []
+    SELENIUM_PAGE_LOAD_STRATEGY: str = "eager"
+    # Optional fixed chromedriver binary (skips webdriver_manager)
+    CHROMEDRIVER_PATH: Optional[str] = None
+
+    # "html" parses one page_source snapshot with lxml, "webdriver" looks up each field
+    SELENIUM_EXTRACTION_MODE: str = "html"
+    # Optional directory to save profile HTML snapshots for offline re-parsing
+    SELENIUM_SNAPSHOT_DIR: Optional[str] = None
+
+    # Batch analysis: max concurrent calls per pipeline stage, and rows per request
+    BATCH_SEARCH_CONCURRENCY: int = 5
+    BATCH_SCRAPE_CONCURRENCY: int = 5
+    BATCH_LLM_CONCURRENCY: int = 8
+    BATCH_MAX_QUERIES: int = 1000
+
+    # Background analysis jobs (POST /api/jobs); JOB_WORKERS=0 only enqueues
+    JOB_WORKERS: int = 2
+    JOB_TIMEOUT_SEC: float = 300
+    JOB_MAX_ATTEMPTS: int = 3
+    # Backoff before retrying a job that failed with a transient error (429/5xx/timeout)
+    JOB_RETRY_BACKOFF_BASE_SEC: float = 5
+    JOB_RETRY_BACKOFF_MAX_SEC: float = 120
+    JOB_POLL_INTERVAL_SEC: float = 2
+    JOB_DEDUP_TTL_SEC: int = 3600
+    JOB_RETENTION_SEC: int = 7 * 24 * 3600
+    # Hosts (and their subdomains) job webhooks may point to; empty allows any
+    # public host, but never localhost or hosts resolving to private/link-local addresses
+    JOB_WEBHOOK_ALLOWED_HOSTS: List[str] = []
+    JOB_WEBHOOK_TIMEOUT_SEC: float = 10
+
+    # Profile URL resolution: "hybrid" scores search results locally and only
+    # falls back to the ReAct agent for ambiguous cases, "agent" always uses it
+    PROFILE_RESOLVER_MODE: str = "hybrid"
+    PROFILE_RESOLVER_CONFIDENCE_THRESHOLD: float = 0.75
+
+    # Compact profile text sent to the LLM chains (token budget for the profile only)
+    PROFILE_COMPACTION_ENABLED: bool = True
+    PROFILE_TOKEN_BUDGET: int = 1500
+    PROFILE_MAX_DESCRIPTION_CHARS: int = 400
+
+    # Tavily search result cache
+    TAVILY_CACHE_TTL_SEC: int = 600
+    TAVILY_CACHE_MAX_ENTRIES: int = 1000
+
+    # Local cache storage
+    CACHE_DIR: str = ".connect_pro_cache"
+
+    # Scraped profile cache (shared by all LinkedIn clients)
+    PROFILE_CACHE_ENABLED: bool = True
+    PROFILE_CACHE_TTL_SEC: int = 7 * 24 * 3600
+    PROFILE_CACHE_MAX_ENTRIES: int = 5000
+    PROFILE_CACHE_COMPRESS: bool = True
+
+    # LLM chain result cache (keyed by model, temperature, prompt version and inputs)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SEC: int = 30 * 24 * 3600
+    LLM_CACHE_MAX_ENTRIES: int = 10000
+
+    # Generate insights and common ground in one LLM call (one profile in the prompt)
+    # instead of two concurrent chains
+    LLM_COMBINED_ANALYSIS: bool = False
+
+    # How structured insights are requested: "prompt" (format instructions in the
+    # prompt), "json_schema" (native structured outputs) or "function_calling";
+    # output that fails even after local repair is retried up to the attempt limit
+    LLM_OUTPUT_MODE: str = "prompt"
+    LLM_OUTPUT_MAX_ATTEMPTS: int = 2
+
+    # Model routing per LLM call (see connect_pro.llm.routing): routes are tried in
+    # order, as a JSON list of {"name", "model", "fallback_model", "tasks",
+    # "min_profile_tokens", "max_profile_tokens", "latency_slo_sec"} objects; calls
+    # matching no route use OPENAI_MODEL_NAME with the fallback and SLO below
+    LLM_ROUTES: List[Dict[str, Any]] = []
+    LLM_FALLBACK_MODEL_NAME: Optional[str] = None
+    LLM_LATENCY_SLO_SEC: Optional[float] = None
+    # A route switches to its fallback model for a cooldown when the primary's error
+    # rate or p95 latency over its recent calls exceeds the limit (or the route's SLO)
+    LLM_ROUTE_MAX_ERROR_RATE: float = 0.5
+    LLM_ROUTE_HEALTH_WINDOW: int = 20
+    LLM_ROUTE_MIN_SAMPLES: int = 5
+    LLM_ROUTE_COOLDOWN_SEC: float = 60
+
+    # Latest insights and content fingerprint per profile (for incremental refreshes)
+    INSIGHTS_STORE_MAX_ENTRIES: int = 100000
+
+    # Build LLM clients, the agent, HTTP pools and tokenizers at startup instead
+    # of on the first request
+    STARTUP_WARMUP: bool = False
     
     # Configure .env file loading
     model_config = SettingsConfigDict(
@@ -30,5 +165,12 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Create a settings instance to import
-settings = get_settings()
+class _LazySettings:
+    """Proxy that loads the settings on first attribute access rather than at import."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+
+# Settings instance to import
+settings = _LazySettings()
@@ -0,0 +1,311 @@
+"""Durable work queue for analysis jobs, backed by a local SQLite database."""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from connect_pro.config.settings import settings
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A queued analysis job and its outcome."""
+
+    id: str
+    dedup_key: str
+    status: str
+    payload: Dict[str, Any]
+    result: Optional[Any]
+    error: Optional[str]
+    webhook_urls: List[str]
+    attempts: int
+    created_at: float
+    updated_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public view of the job (without internal bookkeeping)."""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+_COLUMNS = "id, dedup_key, status, payload, result, error, attempts, created_at, updated_at"
+
+
+class JobQueue:
+    """Persistent FIFO job queue with leases, retries and deduplication.
+
+    A claimed job is leased to a worker for `lease_sec`. If the worker's
+    process dies, the lease runs out and another worker picks the job up
+    again, so jobs survive restarts. A job that failed with a transient error
+    can be put back with a delay (`retry`). Submitting a job whose dedup key
+    matches a queued, running or recently succeeded job returns that job
+    instead, and adds the new submitter's webhook to it. Updates run in
+    `BEGIN IMMEDIATE` transactions, so several processes can share one
+    database file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_sec: float = 300,
+        max_attempts: int = 3,
+        dedup_ttl_sec: float = 3600,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            lease_sec: Seconds a claimed job is reserved for its worker
+            max_attempts: Claims per job before it is marked failed
+            dedup_ttl_sec: Seconds a succeeded job answers duplicate submissions
+        """
+        self.path = Path(path)
+        self.lease_sec = lease_sec
+        self.max_attempts = max_attempts
+        self.dedup_ttl_sec = dedup_ttl_sec
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                dedup_key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                -- Lease expiry of a running job, or earliest retry of a queued one
+                lease_until REAL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_dedup ON jobs (dedup_key, updated_at)"
+        )
+        # Every submitter of a deduplicated job gets notified
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_webhooks (
+                job_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (job_id, url)
+            )
+            """
+        )
+
+    def submit(
+        self,
+        dedup_key: str,
+        payload: Dict[str, Any],
+        webhook_url: Optional[str] = None,
+    ) -> Tuple[Job, bool]:
+        """Enqueue a job unless an equivalent one is pending or recently succeeded.
+
+        Args:
+            dedup_key: Identity of the work (equal keys mean duplicate submissions)
+            payload: JSON-serializable job arguments
+            webhook_url: Optional URL notified when the job finishes (also
+                         added to an existing equivalent job)
+
+        Returns:
+            The job and whether it was newly created
+        """
+        now = time.time()
+        with self._transaction():
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE dedup_key = ? "
+                "AND (status IN (?, ?) OR (status = ? AND updated_at > ?)) "
+                "ORDER BY created_at DESC LIMIT 1",
+                (dedup_key, QUEUED, RUNNING, SUCCEEDED, now - self.dedup_ttl_sec),
+            ).fetchone()
+            created = row is None
+            if row is None:
+                job_id = uuid.uuid4().hex
+                row = (job_id, dedup_key, QUEUED, json.dumps(payload), None, None, 0, now, now)
+                self._conn.execute(
+                    f"INSERT INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row
+                )
+
+            if webhook_url:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO job_webhooks (job_id, url) VALUES (?, ?)",
+                    (row[0], webhook_url),
+                )
+            return self._with_webhooks(row), created
+
+    def claim(self) -> Optional[Job]:
+        """Lease the oldest runnable job (queued and due, or running with an expired lease)."""
+        now = time.time()
+        with self._transaction():
+            while True:
+                row = self._conn.execute(
+                    "SELECT id, attempts FROM jobs "
+                    "WHERE (status = ? AND (lease_until IS NULL OR lease_until <= ?)) "
+                    "OR (status = ? AND lease_until < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (QUEUED, now, RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                job_id, attempts = row
+                if attempts >= self.max_attempts:
+                    # Crashed or timed out on every attempt
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, error = ?, lease_until = NULL, "
+                        "updated_at = ? WHERE id = ?",
+                        (FAILED, f"Gave up after {attempts} attempts", now, job_id),
+                    )
+                    continue
+
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, "
+                    "lease_until = ?, updated_at = ? WHERE id = ?",
+                    (RUNNING, now + self.lease_sec, now, job_id),
+                )
+                return self._load(job_id)
+
+    def complete(self, job_id: str, result: Any) -> None:
+        """Mark a job succeeded with its JSON-serializable result."""
+        self._finish(job_id, SUCCEEDED, result=json.dumps(result))
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark a job failed."""
+        self._finish(job_id, FAILED, error=error)
+
+    def retry(self, job_id: str, error: str, delay_sec: float) -> None:
+        """Put a running job back in the queue, to be claimed again after `delay_sec`.
+
+        The attempt still counts, so the job fails for good after `max_attempts`.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_until = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (QUEUED, error, now + delay_sec, now, job_id, RUNNING),
+            )
+
+    def release(self, job_id: str) -> None:
+        """Put a running job back in the queue without counting the attempt."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), "
+                "lease_until = NULL, updated_at = ? WHERE id = ? AND status = ?",
+                (QUEUED, time.time(), job_id, RUNNING),
+            )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None."""
+        with self._lock:
+            return self._load(job_id)
+
+    def purge(self, older_than_sec: float) -> int:
+        """Delete finished jobs last updated more than `older_than_sec` ago."""
+        with self._transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (SUCCEEDED, FAILED, time.time() - older_than_sec),
+            )
+            self._conn.execute(
+                "DELETE FROM job_webhooks WHERE job_id NOT IN (SELECT id FROM jobs)"
+            )
+        return cursor.rowcount
+
+    def _finish(
+        self, job_id: str, status: str, result: Optional[str] = None, error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, lease_until = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (status, result, error, time.time(), job_id),
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the block in a `BEGIN IMMEDIATE` write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _load(self, job_id: str) -> Optional[Job]:
+        """Read a job with its webhooks; the caller holds the lock."""
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._with_webhooks(row) if row is not None else None
+
+    def _with_webhooks(self, row: Tuple[Any, ...]) -> Job:
+        """Build a job from its row plus its webhooks; the caller holds the lock."""
+        webhook_urls = [
+            url
+            for (url,) in self._conn.execute(
+                "SELECT url FROM job_webhooks WHERE job_id = ? ORDER BY rowid", (row[0],)
+            )
+        ]
+        return self._to_job(row, webhook_urls)
+
+    @staticmethod
+    def _to_job(row: Tuple[Any, ...], webhook_urls: List[str]) -> Job:
+        (job_id, dedup_key, status, payload, result, error,
+         attempts, created_at, updated_at) = row
+        return Job(
+            id=job_id,
+            dedup_key=dedup_key,
+            status=status,
+            payload=json.loads(payload),
+            result=json.loads(result) if result is not None else None,
+            error=error,
+            webhook_urls=webhook_urls,
+            attempts=attempts,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+
+@lru_cache()
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue."""
+    return JobQueue(
+        path=str(Path(settings.CACHE_DIR) / "jobs.sqlite3"),
+        # Outlive the worker-side timeout so only crashed workers lose their jobs
+        lease_sec=settings.JOB_TIMEOUT_SEC + 60,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        dedup_ttl_sec=settings.JOB_DEDUP_TTL_SEC,
+    )
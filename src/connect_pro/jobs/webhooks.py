@@ -0,0 +1,97 @@
+"""Validation and delivery of job completion webhooks.
+
+Without `JOB_WEBHOOK_ALLOWED_HOSTS`, webhooks may only reach public
+addresses. The host is checked when the job is submitted and resolved again
+right before each delivery, so a name that points to a private address is
+refused as well.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+from typing import Any, Dict, List, Union
+
+import httpx
+
+from connect_pro.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+
+def _allowed_hosts() -> List[str]:
+    return [allowed.lower().rstrip(".") for allowed in settings.JOB_WEBHOOK_ALLOWED_HOSTS]
+
+
+def _is_public(address: IPAddress) -> bool:
+    # Judge IPv4-mapped IPv6 addresses (e.g. ::ffff:127.0.0.1) by their IPv4 address
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        return address.ipv4_mapped.is_global
+    return address.is_global
+
+
+def check_webhook_host(host: str) -> None:
+    """
+    Check a webhook host against the allow-list, or refuse local and private hosts.
+
+    Args:
+        host: Host name or IP literal of the webhook URL
+
+    Raises:
+        ValueError: If the server must not post to the host
+    """
+    host = host.lower().rstrip(".")
+    allowed_hosts = _allowed_hosts()
+    if allowed_hosts:
+        if not any(host == allowed or host.endswith(f".{allowed}") for allowed in allowed_hosts):
+            raise ValueError(f"webhook host {host} is not allowed")
+        return
+
+    if host == "localhost" or host.endswith(".localhost"):
+        raise ValueError("webhook_url must not point to localhost")
+    try:
+        address = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return
+    if not _is_public(address):
+        raise ValueError(f"webhook_url must not point to a non-public address ({address})")
+
+
+async def acheck_webhook_address(host: str, port: int) -> None:
+    """
+    Resolve a webhook host and refuse it if any of its addresses is not public.
+
+    Allow-listed hosts are trusted and not resolved.
+
+    Raises:
+        ValueError: If the host is not allowed or resolves to a non-public address
+        OSError: If the host cannot be resolved
+    """
+    check_webhook_host(host)
+    if _allowed_hosts():
+        return
+
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host.strip("[]"), port, type=socket.SOCK_STREAM
+    )
+    for *_, sockaddr in infos:
+        # Drop the zone of scoped IPv6 addresses (e.g. fe80::1%eth0)
+        address = ipaddress.ip_address(str(sockaddr[0]).split("%", 1)[0])
+        if not _is_public(address):
+            raise ValueError(f"webhook host {host} resolves to a non-public address ({address})")
+
+
+async def deliver_webhook(client: httpx.AsyncClient, url: str, payload: Dict[str, Any]) -> None:
+    """POST a finished job to a webhook; failures are logged, not retried."""
+    webhook_url = httpx.URL(url)
+    try:
+        await acheck_webhook_address(
+            webhook_url.host, webhook_url.port or (443 if webhook_url.scheme == "https" else 80)
+        )
+        # Redirects are not followed, so the checked host is the one that is called
+        response = await client.post(webhook_url, json=payload, follow_redirects=False)
+        response.raise_for_status()
+    except (ValueError, OSError, httpx.HTTPError) as e:
+        logger.warning(f"Webhook for job {payload.get('job_id')} failed: {e}")
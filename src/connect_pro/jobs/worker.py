@@ -0,0 +1,186 @@
+"""Async worker pool that drains the analysis job queue."""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+import httpx
+
+from connect_pro.config.settings import settings
+from connect_pro.jobs.queue import Job, JobQueue
+from connect_pro.jobs.webhooks import deliver_webhook
+from connect_pro.main import aanalyze_profile
+from connect_pro.utils.retry import backoff_delay, is_retryable_error
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorkerPool:
+    """Runs queued analysis jobs on a fixed number of asyncio workers.
+
+    Workers are woken up immediately when a job is submitted in this process
+    and otherwise poll the queue, so jobs submitted by other processes (or left
+    over from a previous run) are picked up as well. Jobs failing with a
+    transient error go back to the queue with a backoff until the queue's
+    `max_attempts` are used up.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        size: int = 2,
+        poll_interval_sec: float = 2.0,
+        job_timeout_sec: float = 300,
+        webhook_timeout_sec: float = 10,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            queue: Job queue to drain
+            size: Number of concurrent workers
+            poll_interval_sec: Max seconds between queue polls when idle
+            job_timeout_sec: Max seconds a single job may run
+            webhook_timeout_sec: Timeout of the completion webhook request
+        """
+        self.queue = queue
+        self.size = size
+        self.poll_interval_sec = poll_interval_sec
+        self.job_timeout_sec = job_timeout_sec
+        self.webhook_timeout_sec = webhook_timeout_sec
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        """Start the workers on the running event loop."""
+        self._wakeup = asyncio.Event()
+        self._http_client = httpx.AsyncClient(timeout=self.webhook_timeout_sec)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"job-worker-{index}")
+            for index in range(self.size)
+        ]
+        logger.info(f"Started {self.size} job workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers; interrupted jobs go back to the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def notify(self) -> None:
+        """Wake up idle workers after a job was submitted."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim)
+            except Exception as e:
+                logger.error(f"Could not claim job: {e}")
+                job = None
+
+            if job is None:
+                await self._wait_for_jobs()
+                continue
+
+            try:
+                await self._run(job)
+            except Exception as e:
+                logger.error(f"Job worker error on {job.id}: {e}")
+
+    async def _wait_for_jobs(self) -> None:
+        if self._wakeup is None:
+            await asyncio.sleep(self.poll_interval_sec)
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_sec)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run(self, job: Job) -> None:
+        logger.info(f"Running job {job.id} (attempt {job.attempts})")
+        try:
+            result = await asyncio.wait_for(
+                aanalyze_profile(
+                    search_query=job.payload["query"],
+                    user_information=job.payload.get("user_information", ""),
+                ),
+                timeout=self.job_timeout_sec,
+            )
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back so the next worker starts it right away
+            # (inline, since the task is being cancelled)
+            self.queue.release(job.id)
+            raise
+        except Exception as e:
+            # Empty message when the job itself ran out of time
+            error = str(e) or f"Timed out after {self.job_timeout_sec}s"
+            if is_retryable_error(e) and job.attempts < self.queue.max_attempts:
+                delay = backoff_delay(
+                    job.attempts,
+                    base_sec=settings.JOB_RETRY_BACKOFF_BASE_SEC,
+                    max_sec=settings.JOB_RETRY_BACKOFF_MAX_SEC,
+                )
+                logger.warning(f"Job {job.id} failed ({error}), retrying in {delay:.1f}s")
+                await asyncio.to_thread(self.queue.retry, job.id, error, delay)
+                return
+            logger.warning(f"Job {job.id} failed: {error}")
+            await asyncio.to_thread(self.queue.fail, job.id, error)
+        else:
+            if result is None:
+                await asyncio.to_thread(self.queue.fail, job.id, "Profile not found")
+            else:
+                await asyncio.to_thread(self.queue.complete, job.id, result)
+
+        await self._notify_webhooks(job.id)
+
+    async def _notify_webhooks(self, job_id: str) -> None:
+        """POST the finished job to every webhook registered for it."""
+        finished = await asyncio.to_thread(self.queue.get, job_id)
+        if finished is None or not finished.webhook_urls or self._http_client is None:
+            return
+        payload = finished.to_dict()
+        await asyncio.gather(
+            *(deliver_webhook(self._http_client, url, payload) for url in finished.webhook_urls)
+        )
+
+
+_pool: Optional[JobWorkerPool] = None
+
+
+def get_job_worker_pool() -> Optional[JobWorkerPool]:
+    """Get the running worker pool of this process, if any."""
+    return _pool
+
+
+async def start_job_workers(queue: JobQueue) -> Optional[JobWorkerPool]:
+    """Start the process-wide worker pool (no-op if `JOB_WORKERS` is 0)."""
+    global _pool
+    if settings.JOB_WORKERS <= 0:
+        return None
+
+    await asyncio.to_thread(queue.purge, settings.JOB_RETENTION_SEC)
+    _pool = JobWorkerPool(
+        queue,
+        size=settings.JOB_WORKERS,
+        poll_interval_sec=settings.JOB_POLL_INTERVAL_SEC,
+        job_timeout_sec=settings.JOB_TIMEOUT_SEC,
+        webhook_timeout_sec=settings.JOB_WEBHOOK_TIMEOUT_SEC,
+    )
+    await _pool.start()
+    return _pool
+
+
+async def stop_job_workers() -> None:
+    """Stop the process-wide worker pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.stop()
+        _pool = None
@@ -0,0 +1,81 @@
+"""LangChain callbacks that feed LLM latency, errors and token usage into metrics."""
+
+import time
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from connect_pro.utils.metrics import LLM_TOKENS, STAGE_ERRORS, observe_stage
+
+_STAGE = "openai"
+
+
+def token_usage(response: LLMResult) -> Tuple[int, int]:
+    """Prompt and completion tokens reported for an LLM call."""
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+
+    if not (prompt_tokens or completion_tokens):
+        reported = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = reported.get("prompt_tokens", 0)
+        completion_tokens = reported.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """Records each OpenAI call's latency, failures and token usage."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._started_at: Dict[UUID, float] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        self._started_at[run_id] = time.perf_counter()
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._started_at[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._observe(run_id)
+        prompt_tokens, completion_tokens = token_usage(response)
+        LLM_TOKENS.labels(self.model_name, "prompt").inc(prompt_tokens)
+        LLM_TOKENS.labels(self.model_name, "completion").inc(completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._observe(run_id)
+        STAGE_ERRORS.labels(_STAGE).inc()
+
+    def _observe(self, run_id: UUID) -> None:
+        started_at = self._started_at.pop(run_id, None)
+        if started_at is not None:
+            observe_stage(_STAGE, time.perf_counter() - started_at)
+
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """Sums the token usage of the LLM calls of one run (pass it in the run's config)."""
+
+    def __init__(self) -> None:
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        prompt_tokens, completion_tokens = token_usage(response)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
@@ -0,0 +1,109 @@
+"""Stored insights per profile with content fingerprints for incremental refreshes."""
+
+import hashlib
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from connect_pro.cache.sqlite_cache import SQLiteCache
+from connect_pro.config.settings import settings
+from connect_pro.llm.profile_compaction import render_profile_sections
+from connect_pro.scrapers.linkedin.cache import canonicalize_profile_url
+
+logger = logging.getLogger(__name__)
+
+# Sections that change without saying anything new about the person
+_VOLATILE_SECTIONS = {"activities"}
+_VOLATILE_LINE_PREFIXES = ("Followers:",)
+
+
+def fingerprint_profile(profile_data: Dict) -> Dict[str, str]:
+    """
+    Hash each profile section as the analysis prompt sees it.
+
+    Fingerprints are computed over the rendered prompt text of each section
+    (headline, summary, experiences, education, ...), so only changes that
+    would alter the prompt are detected. Follower counts and recent activity
+    are ignored.
+
+    Args:
+        profile_data: Scraped LinkedIn profile data
+
+    Returns:
+        Mapping of section name to content hash (empty sections are omitted)
+    """
+    fingerprint = {}
+    for name, _, lines in render_profile_sections(
+        profile_data, settings.PROFILE_MAX_DESCRIPTION_CHARS
+    ):
+        if name in _VOLATILE_SECTIONS:
+            continue
+        lines = [line for line in lines if not line.startswith(_VOLATILE_LINE_PREFIXES)]
+        if lines:
+            content = "\n".join(lines).encode("utf-8")
+            fingerprint[name] = hashlib.sha256(content).hexdigest()[:16]
+    return fingerprint
+
+
+def diff_fingerprints(previous: Dict[str, str], current: Dict[str, str]) -> List[str]:
+    """Return the sections that were added, removed or changed, in stable order."""
+    return sorted(
+        name
+        for name in previous.keys() | current.keys()
+        if previous.get(name) != current.get(name)
+    )
+
+
+@dataclass
+class StoredInsights:
+    """Last generated insights of a profile and what they were generated from."""
+
+    insights: Dict
+    fingerprint: Dict[str, str]
+    model_name: str
+    prompt_version: str
+    updated_at: float = field(default_factory=time.time)
+    changed_sections: List[str] = field(default_factory=list)
+
+
+class InsightsStore:
+    """Persists the latest insights and content fingerprint per profile URL."""
+
+    def __init__(self, cache: SQLiteCache):
+        """Initialize the store.
+
+        Args:
+            cache: Backing key-value store
+        """
+        self.cache = cache
+
+    def get(self, profile_url: str) -> Optional[StoredInsights]:
+        """Return the stored insights of a profile, or None."""
+        record = self.cache.get(canonicalize_profile_url(profile_url))
+        if record is None:
+            return None
+        try:
+            return StoredInsights(**record)
+        except TypeError as e:
+            logger.warning(f"Ignoring unreadable insights record for {profile_url}: {e}")
+            return None
+
+    def set(self, profile_url: str, stored: StoredInsights) -> None:
+        """Store the latest insights of a profile."""
+        self.cache.set(canonicalize_profile_url(profile_url), asdict(stored))
+
+
+@lru_cache()
+def get_insights_store() -> InsightsStore:
+    """Get the process-wide insights store."""
+    return InsightsStore(
+        SQLiteCache(
+            path=str(Path(settings.CACHE_DIR) / "insights.sqlite3"),
+            namespace="profile_insights",
+            max_entries=settings.INSIGHTS_STORE_MAX_ENTRIES,
+            compress=True,
+        )
+    )
@@ -1,18 +1,47 @@
 """LLM model configurations for the application."""
 
-from langchain_openai import ChatOpenAI
+from typing import TYPE_CHECKING, Optional
 
 from connect_pro.config.settings import settings
+from connect_pro.llm.callbacks import LLMMetricsCallbackHandler
 
+if TYPE_CHECKING:
+    import httpx
+    from langchain_openai import ChatOpenAI
 
-def get_openai_llm(temperature: float = 0) -> ChatOpenAI:
+
+def get_openai_llm(
+    temperature: float = 0,
+    model_name: Optional[str] = None,
+    http_client: Optional["httpx.Client"] = None,
+    http_async_client: Optional["httpx.AsyncClient"] = None,
+) -> "ChatOpenAI":
     """
     Get configured OpenAI LLM instance.
 
+    Prefer the shared instances of `connect_pro.llm.registry`, which reuse
+    pooled connections across requests.
+
     Args:
         temperature: Controls randomness in the output (0.0 to 1.0)
+        model_name: OpenAI model (defaults to settings)
+        http_client: Optional shared HTTP client for sync calls
+        http_async_client: Optional shared HTTP client for async calls
 
     Returns:
         Configured ChatOpenAI instance
     """
-    return ChatOpenAI(model=settings.OPENAI_MODEL_NAME, temperature=temperature)
+    # langchain_openai (and the openai SDK) take a while to import; defer until first use
+    from langchain_openai import ChatOpenAI
+
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        base_url=settings.OPENAI_BASE_URL,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        # Report token usage for streamed responses too
+        stream_usage=True,
+        callbacks=[LLMMetricsCallbackHandler(model_name)],
+    )
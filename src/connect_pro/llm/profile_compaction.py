@@ -0,0 +1,395 @@
+"""Compact, token-budgeted rendering of scraped profiles for LLM prompts.
+
+Renders a profile (ProxyCurl or Selenium shape) as dense, stable text, e.g.
+one line per role: "- Data Scientist, IBM (2023-09–present; Berlin)". Sections
+are filled in priority order until the token budget is used up.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from connect_pro.llm.tokens import count_tokens
+
+_EMPTY_VALUES = ("", "None", None)
+
+
+@dataclass
+class CompactProfile:
+    """Compacted profile text with its token accounting."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    truncated_sections: List[str] = field(default_factory=list)
+
+
+def _clean(value: Any) -> str:
+    """Collapse whitespace and drop placeholder values."""
+    if value in _EMPTY_VALUES or isinstance(value, (dict, list)):
+        return ""
+    return " ".join(str(value).split())
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[: max_chars - 1].rstrip() + "…"
+
+
+def _date(value: Any) -> str:
+    """Render a ProxyCurl date dict as 'YYYY-MM' (or pass through a scraped date string)."""
+    if isinstance(value, dict):
+        year, month = value.get("year"), value.get("month")
+        if not year:
+            return ""
+        return f"{year}-{month:02d}" if month else str(year)
+    return _clean(value)
+
+
+def _date_range(start: Any, end: Any, ongoing: Optional[str] = "present") -> str:
+    start_text, end_text = _date(start), _date(end)
+    if start_text and end_text:
+        return f"{start_text}–{end_text}"
+    if start_text:
+        return f"{start_text}–{ongoing}" if ongoing else start_text
+    return end_text
+
+
+def _join(*parts: str, sep: str = ", ") -> str:
+    return sep.join(part for part in parts if part)
+
+
+def _line(main: str, details: str = "", description: str = "") -> str:
+    text = f"- {main}"
+    if details:
+        text += f" ({details})"
+    if description:
+        text += f": {description}"
+    return text
+
+
+class _Renderer:
+    """Renders profile sections as lists of lines, in priority order."""
+
+    def __init__(self, profile_data: Dict, max_description_chars: int) -> None:
+        self.profile = profile_data
+        self.max_chars = max_description_chars
+
+    def _desc(self, value: Any) -> str:
+        return _truncate(_clean(value), self.max_chars)
+
+    def _items(self, key: str) -> List[Dict]:
+        return [item for item in self.profile.get(key) or [] if isinstance(item, dict)]
+
+    def sections(self) -> List[Tuple[str, Optional[str], List[str]]]:
+        """Return (section name, heading, lines) tuples, most important first."""
+        renderers: List[Tuple[str, Optional[str], Callable[[], List[str]]]] = [
+            ("basics", None, self._basics),
+            ("summary", None, self._summary),
+            ("experiences", "Experience:", self._experiences),
+            ("education", "Education:", self._education),
+            ("certifications", "Certifications:", self._certifications),
+            ("accomplishment_projects", "Projects:", self._projects),
+            ("accomplishment_publications", "Publications:", self._publications),
+            ("accomplishment_honors_awards", "Honors & awards:", self._honors),
+            ("volunteer_work", "Volunteering:", self._volunteering),
+            ("accomplishment_test_scores", "Test scores:", self._test_scores),
+            ("accomplishment_courses", "Courses:", self._courses),
+            ("languages", None, self._languages),
+            ("skills", None, lambda: self._inline("Skills", "skills")),
+            ("interests", None, lambda: self._inline("Interests", "interests")),
+            ("groups", None, self._groups),
+            ("recommendations", "Recommendations:", self._recommendations),
+            ("activities", "Recent activity:", self._activities),
+        ]
+        return [(name, heading, render()) for name, heading, render in renderers]
+
+    def _basics(self) -> List[str]:
+        p = self.profile
+        location = _join(
+            _clean(p.get("city")),
+            _clean(p.get("state")),
+            _clean(p.get("country_full_name")) or _clean(p.get("country")),
+        ) or _clean(p.get("location"))
+
+        followers = p.get("follower_count")
+        lines = [
+            f"Name: {_clean(p.get('full_name'))}",
+            f"Headline: {_clean(p.get('headline'))}",
+            f"Occupation: {_clean(p.get('occupation'))}",
+            f"Industry: {_clean(p.get('industry'))}",
+            f"Location: {location}",
+            f"Followers: {followers}" if isinstance(followers, int) else "",
+        ]
+        return [line for line in lines if line and not line.endswith(": ")]
+
+    def _summary(self) -> List[str]:
+        summary = _truncate(_clean(self.profile.get("summary")), self.max_chars * 3)
+        return [f"Summary: {summary}"] if summary else []
+
+    def _experiences(self) -> List[str]:
+        lines = []
+        for exp in self._items("experiences"):
+            main = _join(_clean(exp.get("title")), _clean(exp.get("company")))
+            if not main:
+                continue
+            dates = _date_range(
+                exp.get("starts_at") or exp.get("start_date"),
+                exp.get("ends_at") or exp.get("end_date"),
+            )
+            details = _join(dates, _clean(exp.get("location")), sep="; ")
+            lines.append(_line(main, details, self._desc(exp.get("description"))))
+        return lines
+
+    def _education(self) -> List[str]:
+        lines = []
+        for edu in self._items("education"):
+            degree = _join(
+                _clean(edu.get("degree_name")) or _clean(edu.get("degree")),
+                _clean(edu.get("field_of_study")),
+            )
+            main = _join(degree, _clean(edu.get("school")))
+            if not main:
+                continue
+            dates = _date_range(
+                edu.get("starts_at") or edu.get("start_date"),
+                edu.get("ends_at") or edu.get("end_date"),
+                ongoing=None,
+            )
+            lines.append(_line(main, dates, self._desc(edu.get("description"))))
+        return lines
+
+    def _certifications(self) -> List[str]:
+        return [
+            _line(_clean(cert.get("name")), _join(_clean(cert.get("authority")), _date(cert.get("starts_at"))))
+            for cert in self._items("certifications")
+            if _clean(cert.get("name"))
+        ]
+
+    def _projects(self) -> List[str]:
+        return [
+            _line(
+                _clean(project.get("title")),
+                _date_range(project.get("starts_at"), project.get("ends_at"), ongoing=None),
+                self._desc(project.get("description")),
+            )
+            for project in self._items("accomplishment_projects")
+            if _clean(project.get("title"))
+        ]
+
+    def _publications(self) -> List[str]:
+        return [
+            _line(
+                _clean(pub.get("name")),
+                _join(_clean(pub.get("publisher")), _date(pub.get("published_on"))),
+                self._desc(pub.get("description")),
+            )
+            for pub in self._items("accomplishment_publications")
+            if _clean(pub.get("name"))
+        ]
+
+    def _honors(self) -> List[str]:
+        return [
+            _line(
+                _clean(honor.get("title")),
+                _join(_clean(honor.get("issuer")), _date(honor.get("issued_on"))),
+                self._desc(honor.get("description")),
+            )
+            for honor in self._items("accomplishment_honors_awards")
+            if _clean(honor.get("title"))
+        ]
+
+    def _volunteering(self) -> List[str]:
+        lines = []
+        for work in self._items("volunteer_work"):
+            main = _join(_clean(work.get("title")), _clean(work.get("company")))
+            if not main:
+                continue
+            details = _join(
+                _date_range(work.get("starts_at"), work.get("ends_at")),
+                _clean(work.get("cause")),
+                sep="; ",
+            )
+            lines.append(_line(main, details, self._desc(work.get("description"))))
+        return lines
+
+    def _test_scores(self) -> List[str]:
+        return [
+            _line(
+                _join(_clean(test.get("name")), _clean(test.get("score")), sep=": "),
+                _date(test.get("date_on")),
+            )
+            for test in self._items("accomplishment_test_scores")
+            if _clean(test.get("name"))
+        ]
+
+    def _courses(self) -> List[str]:
+        return [
+            _line(_clean(course.get("name")), _clean(course.get("number")))
+            for course in self._items("accomplishment_courses")
+            if _clean(course.get("name"))
+        ]
+
+    def _languages(self) -> List[str]:
+        proficiencies = self._items("languages_and_proficiencies")
+        if proficiencies:
+            languages = [
+                _join(
+                    _clean(lang.get("name")),
+                    f"({_clean(lang.get('proficiency')).replace('_', ' ').lower()})"
+                    if _clean(lang.get("proficiency"))
+                    else "",
+                    sep=" ",
+                )
+                for lang in proficiencies
+            ]
+        else:
+            languages = [_clean(lang) for lang in self.profile.get("languages") or []]
+        languages = [lang for lang in languages if lang]
+        return [f"Languages: {', '.join(languages)}"] if languages else []
+
+    def _inline(self, label: str, key: str) -> List[str]:
+        values = [_clean(value) for value in self.profile.get(key) or []]
+        values = [value for value in values if value]
+        return [f"{label}: {', '.join(values)}"] if values else []
+
+    def _groups(self) -> List[str]:
+        names = [_clean(group.get("name")) for group in self._items("groups")]
+        names = [name for name in names if name]
+        return [f"Groups: {'; '.join(names)}"] if names else []
+
+    def _recommendations(self) -> List[str]:
+        return [
+            f"- {self._desc(text)}"
+            for text in self.profile.get("recommendations") or []
+            if isinstance(text, str) and _clean(text)
+        ]
+
+    def _activities(self) -> List[str]:
+        return [
+            f"- {_truncate(_clean(activity.get('title')), self.max_chars // 2)}"
+            for activity in self._items("activities")
+            if _clean(activity.get("title"))
+        ]
+
+
+def render_profile_sections(
+    profile_data: Dict, max_description_chars: int = 400
+) -> List[Tuple[str, Optional[str], List[str]]]:
+    """
+    Render each profile section as text lines, without applying a token budget.
+
+    Args:
+        profile_data: Scraped profile (ProxyCurl or Selenium shape)
+        max_description_chars: Max characters kept per free-text description
+
+    Returns:
+        (section name, heading, lines) tuples, most important section first
+    """
+    return _Renderer(profile_data, max_description_chars).sections()
+
+
+def compact_profile(
+    profile_data: Dict,
+    token_budget: Optional[int] = None,
+    max_description_chars: int = 400,
+    model_name: Optional[str] = None,
+) -> CompactProfile:
+    """
+    Render a profile as compact text that fits a token budget.
+
+    Sections are added in priority order (basics, summary, experience,
+    education, ...); within a section, entries keep their original (most
+    recent first) order. Entries that would exceed the budget (newlines
+    included) are dropped; only the basics are always kept.
+
+    Args:
+        profile_data: Scraped profile (ProxyCurl or Selenium shape)
+        token_budget: Max tokens of the rendered profile (None = unlimited)
+        max_description_chars: Max characters kept per free-text description
+        model_name: Model whose tokenizer is used for counting
+
+    Returns:
+        CompactProfile with the text and token counts before/after compaction
+    """
+    # Before compaction the prompt received the dict's repr
+    tokens_before = count_tokens(str(profile_data), model_name)
+    # Lines are joined with newlines, which cost tokens too
+    separator_tokens = count_tokens("\n", model_name)
+
+    # (section name, line, is heading) in output order
+    rendered: List[Tuple[str, str, bool]] = []
+    truncated_sections: List[str] = []
+    used_tokens = 0
+
+    for name, heading, lines in render_profile_sections(profile_data, max_description_chars):
+        if not lines:
+            continue
+
+        section_lines = []
+        section_tokens = count_tokens(heading, model_name) + separator_tokens if heading else 0
+        for line in lines:
+            line_tokens = count_tokens(line, model_name) + separator_tokens
+            fits = (
+                token_budget is None
+                or name == "basics"
+                or used_tokens + section_tokens + line_tokens <= token_budget
+            )
+            if fits:
+                section_lines.append(line)
+                section_tokens += line_tokens
+            elif name not in truncated_sections:
+                truncated_sections.append(name)
+
+        if section_lines:
+            if heading:
+                rendered.append((name, heading, True))
+            rendered.extend((name, line, False) for line in section_lines)
+            used_tokens += section_tokens
+
+    text = "\n".join(line for _, line, _ in rendered)
+    tokens_after = count_tokens(text, model_name)
+
+    # Per-line counts can be off where the tokenizer merges across lines; drop
+    # the lowest-priority entries until the joined text fits
+    while token_budget is not None and tokens_after > token_budget:
+        name, _, _ = rendered[-1]
+        if name == "basics":
+            break
+        rendered.pop()
+        if rendered and rendered[-1][2]:
+            rendered.pop()  # heading left without entries
+        if name not in truncated_sections:
+            truncated_sections.append(name)
+        text = "\n".join(line for _, line, _ in rendered)
+        tokens_after = count_tokens(text, model_name)
+
+    return CompactProfile(
+        text=text,
+        tokens_before=tokens_before,
+        tokens_after=tokens_after,
+        truncated_sections=truncated_sections,
+    )
+
+
+if __name__ == "__main__":
+    """
+    Show the compacted form of saved profiles and their token savings.
+
+    Usage:
+        python -m connect_pro.llm.profile_compaction data/example_linkedin_profile_1.json
+    """
+    import sys
+
+    from connect_pro.scrapers.linkedin.proxycurl import ProxyCurlClient
+
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            profile = ProxyCurlClient._clean_response(json.load(f))
+        compact = compact_profile(profile, token_budget=1500)
+        print(compact.text)
+        print(
+            f"\n[{path}] tokens: {compact.tokens_before} -> {compact.tokens_after}, "
+            f"truncated: {compact.truncated_sections or 'none'}\n"
+        )
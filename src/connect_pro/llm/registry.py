@@ -0,0 +1,245 @@
+"""
+Process-wide registry of long-lived LLM clients, chains and the profile agent.
+
+Building a `ChatOpenAI` creates a new OpenAI client with its own connection
+pool, and building the ReAct agent assembles prompts, tools and an executor.
+Both are stateless once built, so they are created once per (model,
+temperature) and shared by all requests, threads and tasks. All of them talk
+to OpenAI through one pooled HTTP client, which keeps connections alive
+between requests.
+
+httpx async clients are bound to the event loop they are used on, so objects
+requested from inside a running loop are kept per loop (like the Tavily and
+ProxyCurl clients); sync callers share a process-wide set.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+import httpx
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import BasePromptTemplate
+from langchain_core.runnables import Runnable
+
+from connect_pro.config.settings import settings
+from connect_pro.llm.models import get_openai_llm
+from connect_pro.llm.structured_output import (
+    bind_structured_output,
+    with_structured_output,
+)
+from connect_pro.prompts.combined_analysis import (
+    combined_analysis_prompt,
+    combined_analysis_structured_prompt,
+)
+from connect_pro.prompts.common_ground import common_ground_prompt
+from connect_pro.prompts.profile_analysis import (
+    profile_analysis_prompt,
+    profile_analysis_structured_prompt,
+)
+from connect_pro.schemas.profile_insights import ProfileAnalysis, ProfileInsights
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+    from connect_pro.agent.linkedin_profile_agent import LinkedInProfileAgent
+
+# Objects shared by sync callers, and per event loop for async callers
+_sync_objects: Dict[Hashable, Any] = {}
+_loop_objects: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.RLock()
+
+_http_client: Optional[httpx.Client] = None
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+    )
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the process-wide pooled client for sync OpenAI calls."""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(limits=_http_limits())
+        return _http_client
+
+
+def _scope() -> Dict[Hashable, Any]:
+    """Objects of the running event loop, or the sync ones outside of a loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _sync_objects
+    with _lock:
+        objects = _loop_objects.get(loop)
+        if objects is None:
+            objects = {"http_async_client": httpx.AsyncClient(limits=_http_limits())}
+            _loop_objects[loop] = objects
+        return objects
+
+
+def _get_or_create(key: Hashable, factory: Callable[[Dict[Hashable, Any]], Any]) -> Any:
+    objects = _scope()
+    with _lock:
+        value = objects.get(key)
+        if value is None:
+            value = factory(objects)
+            objects[key] = value
+        return value
+
+
+def get_llm(temperature: float = 0, model_name: Optional[str] = None) -> "ChatOpenAI":
+    """
+    Get the shared chat model for a model and temperature.
+
+    Args:
+        temperature: Sampling temperature
+        model_name: OpenAI model (defaults to settings)
+
+    Returns:
+        Shared ChatOpenAI instance
+    """
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    return _get_or_create(
+        ("llm", model_name, temperature),
+        lambda objects: get_openai_llm(
+            temperature=temperature,
+            model_name=model_name,
+            http_client=_get_http_client(),
+            http_async_client=objects.get("http_async_client"),
+        ),
+    )
+
+
+def _structured_chain(
+    prompt: BasePromptTemplate,
+    structured_prompt: BasePromptTemplate,
+    schema: type,
+    temperature: float,
+    model_name: str,
+    mode: str,
+) -> Runnable:
+    """Prompt, model and repairing parser for `mode`, retrying unrepairable output."""
+    chain = (prompt if mode == "prompt" else structured_prompt) | with_structured_output(
+        get_llm(temperature, model_name), schema, mode
+    )
+    return chain.with_retry(
+        retry_if_exception_type=(OutputParserException,),
+        stop_after_attempt=max(1, settings.LLM_OUTPUT_MAX_ATTEMPTS),
+        wait_exponential_jitter=False,
+    )
+
+
+def _structured_stream_chain(
+    prompt: BasePromptTemplate,
+    structured_prompt: BasePromptTemplate,
+    schema: type,
+    temperature: float,
+    model_name: str,
+    mode: str,
+) -> Runnable:
+    """Prompt and model for `mode`, streaming raw message chunks (see `astream_structured_output`)."""
+    return (prompt if mode == "prompt" else structured_prompt) | bind_structured_output(
+        get_llm(temperature, model_name), schema, mode
+    )
+
+
+def get_insights_chain(temperature: float = 0, model_name: Optional[str] = None) -> Runnable:
+    """Profile analysis chain returning `ProfileInsights` (see `LLM_OUTPUT_MODE`)."""
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    mode = settings.LLM_OUTPUT_MODE.lower()
+    return _get_or_create(
+        ("insights_chain", model_name, temperature, mode),
+        lambda _: _structured_chain(
+            profile_analysis_prompt,
+            profile_analysis_structured_prompt,
+            ProfileInsights,
+            temperature,
+            model_name,
+            mode,
+        ),
+    )
+
+
+def get_insights_stream_chain(
+    temperature: float = 0, model_name: Optional[str] = None
+) -> Runnable:
+    """Profile analysis chain streaming message chunks of `ProfileInsights` JSON."""
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    mode = settings.LLM_OUTPUT_MODE.lower()
+    return _get_or_create(
+        ("insights_stream_chain", model_name, temperature, mode),
+        lambda _: _structured_stream_chain(
+            profile_analysis_prompt,
+            profile_analysis_structured_prompt,
+            ProfileInsights,
+            temperature,
+            model_name,
+            mode,
+        ),
+    )
+
+
+def get_common_ground_chain(temperature: float = 0, model_name: Optional[str] = None) -> Runnable:
+    """Common ground chain returning (or streaming) plain text."""
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    return _get_or_create(
+        ("common_ground_chain", model_name, temperature),
+        lambda _: common_ground_prompt | get_llm(temperature, model_name) | StrOutputParser(),
+    )
+
+
+def get_combined_analysis_chain(
+    temperature: float = 0, model_name: Optional[str] = None
+) -> Runnable:
+    """Single-call chain returning `ProfileAnalysis` (insights plus common ground)."""
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    mode = settings.LLM_OUTPUT_MODE.lower()
+    return _get_or_create(
+        ("combined_analysis_chain", model_name, temperature, mode),
+        lambda _: _structured_chain(
+            combined_analysis_prompt,
+            combined_analysis_structured_prompt,
+            ProfileAnalysis,
+            temperature,
+            model_name,
+            mode,
+        ),
+    )
+
+
+def get_combined_analysis_stream_chain(
+    temperature: float = 0, model_name: Optional[str] = None
+) -> Runnable:
+    """Single-call chain streaming message chunks of `ProfileAnalysis` JSON."""
+    model_name = model_name or settings.OPENAI_MODEL_NAME
+    mode = settings.LLM_OUTPUT_MODE.lower()
+    return _get_or_create(
+        ("combined_analysis_stream_chain", model_name, temperature, mode),
+        lambda _: _structured_stream_chain(
+            combined_analysis_prompt,
+            combined_analysis_structured_prompt,
+            ProfileAnalysis,
+            temperature,
+            model_name,
+            mode,
+        ),
+    )
+
+
+def get_profile_agent(verbose: bool = False) -> "LinkedInProfileAgent":
+    """Get the shared URL-resolving agent (imports the LangChain agent stack on first use)."""
+    from connect_pro.agent.linkedin_profile_agent import LinkedInProfileAgent
+
+    return _get_or_create(
+        ("profile_agent", verbose),
+        lambda _: LinkedInProfileAgent(llm=get_llm(temperature=0), verbose=verbose),
+    )
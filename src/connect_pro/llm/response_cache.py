@@ -0,0 +1,98 @@
+"""Persistent cache of LLM chain results keyed by prompt content."""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from connect_pro.cache.sqlite_cache import SQLiteCache
+from connect_pro.config.settings import settings
+from connect_pro.utils.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """Stores chain results under a hash of everything that determines them.
+
+    The key covers the model name, temperature, prompt template version, the
+    structured output mode and analysis mode settings, and the prompt inputs
+    (e.g. compacted profile and user information), so a changed profile,
+    prompt, model or output setting never returns a stale answer.
+    """
+
+    def __init__(self, cache: SQLiteCache) -> None:
+        """Initialize the response cache.
+
+        Args:
+            cache: Backing key-value store
+        """
+        self.cache = cache
+
+    @staticmethod
+    def make_key(
+        task: str,
+        model_name: str,
+        temperature: float,
+        prompt_version: str,
+        **inputs: Any,
+    ) -> str:
+        """
+        Build the cache key for one chain call.
+
+        Args:
+            task: Chain name (e.g. "profile_insights")
+            model_name: OpenAI model name
+            temperature: Sampling temperature
+            prompt_version: Version of the prompt template
+            **inputs: Prompt input variables
+
+        Returns:
+            Hex digest identifying the call
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "temperature": float(temperature),
+                "prompt_version": prompt_version,
+                "output_mode": settings.LLM_OUTPUT_MODE.lower(),
+                "combined_analysis": settings.LLM_COMBINED_ANALYSIS,
+                "inputs": inputs,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{task}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for a key, or None."""
+        result = self.cache.get(key)
+        record_cache_lookup("llm_response", result is not None)
+        if result is not None:
+            logger.info(f"LLM response cache hit: {key.split(':', 1)[0]}")
+        return result
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a JSON-serializable chain result."""
+        self.cache.set(key, result)
+
+
+@lru_cache()
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Get the process-wide LLM response cache, or None if caching is disabled."""
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+
+    return LLMResponseCache(
+        SQLiteCache(
+            path=str(Path(settings.CACHE_DIR) / "llm_responses.sqlite3"),
+            namespace="llm_responses",
+            ttl_sec=settings.LLM_CACHE_TTL_SEC,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            compress=True,
+        )
+    )
@@ -0,0 +1,360 @@
+"""
+Model routing for the LLM chains.
+
+Each call (insights, common ground or combined analysis) is matched against
+the configured routes (`LLM_ROUTES`) by task and by the token count of the
+prompt-ready profile, so sparse profiles or the short common ground task can
+go to a smaller, faster model than rich profiles. The first matching route
+wins; calls matching none use the default route (`OPENAI_MODEL_NAME`).
+
+A route can name a fallback model. Calls go to it:
+
+- while the route is degraded: the primary's error rate or p95 latency over
+  its recent calls exceeded `LLM_ROUTE_MAX_ERROR_RATE` or the route's latency
+  SLO. The primary is tried again after `LLM_ROUTE_COOLDOWN_SEC`.
+- when a call on the primary fails (one retry on the fallback).
+
+Per-route call counts, latencies, tokens and fallbacks are exported as metrics.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from langchain_core.runnables import RunnableConfig
+
+from connect_pro.config.settings import settings
+from connect_pro.llm.callbacks import TokenUsageCallbackHandler
+from connect_pro.llm.tokens import count_tokens
+from connect_pro.utils.metrics import (
+    LLM_ROUTE_CALLS,
+    LLM_ROUTE_DURATION,
+    LLM_ROUTE_FALLBACKS,
+    LLM_ROUTE_TOKENS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tasks routes can be restricted to
+TASK_INSIGHTS = "insights"
+TASK_COMMON_GROUND = "common_ground"
+TASK_COMBINED_ANALYSIS = "combined_analysis"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Route:
+    """A model choice for the calls matching a task and profile size."""
+
+    name: str
+    model: str
+    fallback_model: Optional[str] = None
+    tasks: Tuple[str, ...] = ()  # empty: any task
+    min_profile_tokens: Optional[int] = None
+    max_profile_tokens: Optional[int] = None
+    latency_slo_sec: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Route":
+        """Build a route from an `LLM_ROUTES` entry."""
+        try:
+            return cls(**{**config, "tasks": tuple(config.get("tasks") or ())})
+        except TypeError as e:
+            raise ValueError(f"Invalid LLM route {config!r}: {e}") from e
+
+    @property
+    def uses_profile_tokens(self) -> bool:
+        return self.min_profile_tokens is not None or self.max_profile_tokens is not None
+
+    def matches(self, task: str, profile_tokens: Optional[int]) -> bool:
+        if self.tasks and task not in self.tasks:
+            return False
+        if not self.uses_profile_tokens:
+            return True
+        # The router measures profiles whenever a route depends on their size
+        if profile_tokens is None:
+            return False
+        if self.min_profile_tokens is not None and profile_tokens < self.min_profile_tokens:
+            return False
+        if self.max_profile_tokens is not None and profile_tokens > self.max_profile_tokens:
+            return False
+        return True
+
+
+@dataclass
+class _RouteHealth:
+    """Recent (latency, ok) samples of a route's primary model."""
+
+    samples: Deque[Tuple[float, bool]]
+    degraded_until: float = 0.0
+
+    def is_degraded(self) -> bool:
+        return time.monotonic() < self.degraded_until
+
+    def record(
+        self,
+        duration: float,
+        ok: bool,
+        latency_slo_sec: Optional[float],
+        max_error_rate: float,
+        min_samples: int,
+        cooldown_sec: float,
+    ) -> Optional[str]:
+        """Add a sample; returns why the route was degraded, if it just was."""
+        self.samples.append((duration, ok))
+        if len(self.samples) < min_samples:
+            return None
+
+        error_rate = sum(1 for _, sample_ok in self.samples if not sample_ok) / len(self.samples)
+        latencies = sorted(sample_duration for sample_duration, _ in self.samples)
+        p95 = latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+        if error_rate >= max_error_rate:
+            reason = f"error rate {error_rate:.0%}"
+        elif latency_slo_sec is not None and p95 > latency_slo_sec:
+            reason = f"p95 latency {p95:.2f}s over the {latency_slo_sec:.2f}s SLO"
+        else:
+            return None
+
+        # Start over after the cooldown, so the primary is judged on fresh calls
+        self.degraded_until = time.monotonic() + cooldown_sec
+        self.samples.clear()
+        return reason
+
+
+@dataclass
+class RoutedCall:
+    """The route and model chosen for one LLM call."""
+
+    router: "ModelRouter"
+    route: Route
+    model: str
+    profile_tokens: Optional[int] = None
+    _fell_back: bool = field(default=False, repr=False)
+
+    @property
+    def primary_model(self) -> str:
+        """
+        The route's own model, whichever model ends up answering.
+
+        Cached and stored results are keyed on it, so a call served by the
+        fallback model does not invalidate them.
+        """
+        return self.route.model
+
+    @contextmanager
+    def track(self) -> Iterator[RunnableConfig]:
+        """
+        Record the enclosed LLM run in the route's metrics and health.
+
+        Yields the run config to pass to the chain (collects token usage).
+        Runs cancelled or closed early (e.g. a client disconnecting from a
+        stream) are not recorded.
+        """
+        usage = TokenUsageCallbackHandler()
+        started_at = time.perf_counter()
+        try:
+            yield {"callbacks": [usage]}
+        except Exception:
+            self.router.record(self, time.perf_counter() - started_at, False, usage)
+            raise
+        self.router.record(self, time.perf_counter() - started_at, True, usage)
+
+    def _fall_back(self) -> bool:
+        """Switch to the fallback model after a failed call, if there is one to try."""
+        fallback_model = self.route.fallback_model
+        if self._fell_back or not fallback_model or fallback_model == self.model:
+            return False
+        logger.warning(
+            f"LLM call on {self.model} failed (route {self.route.name}), "
+            f"retrying on {fallback_model}"
+        )
+        LLM_ROUTE_FALLBACKS.labels(self.route.name, "error").inc()
+        self.model, self._fell_back = fallback_model, True
+        return True
+
+    def invoke(self, call: Callable[[str, RunnableConfig], T]) -> T:
+        """
+        Run `call(model_name, config)`, retrying once on the fallback model if it fails.
+
+        `model` is the model that produced the result afterwards.
+        """
+        try:
+            with self.track() as config:
+                return call(self.model, config)
+        except Exception:
+            if not self._fall_back():
+                raise
+        with self.track() as config:
+            return call(self.model, config)
+
+    async def ainvoke(self, call: Callable[[str, RunnableConfig], Awaitable[T]]) -> T:
+        """Async variant of `invoke`."""
+        try:
+            with self.track() as config:
+                return await call(self.model, config)
+        except Exception:
+            if not self._fall_back():
+                raise
+        with self.track() as config:
+            return await call(self.model, config)
+
+
+class ModelRouter:
+    """Chooses the model of each LLM call and tracks the health of each route."""
+
+    def __init__(
+        self,
+        routes: List[Route],
+        default_route: Route,
+        max_error_rate: float = 0.5,
+        health_window: int = 20,
+        min_samples: int = 5,
+        cooldown_sec: float = 60,
+        token_model_name: Optional[str] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            routes: Routes in priority order
+            default_route: Route of calls matching no other route
+            max_error_rate: Error rate of a primary model that degrades its route
+            health_window: Recent calls per route the error rate and p95 are computed over
+            min_samples: Calls needed before a route can be degraded
+            cooldown_sec: How long a degraded route uses its fallback model
+            token_model_name: Model whose tokenizer measures profiles
+        """
+        self.routes = routes
+        self.default_route = default_route
+        self.max_error_rate = max_error_rate
+        self.health_window = max(1, health_window)
+        self.min_samples = max(1, min_samples)
+        self.cooldown_sec = cooldown_sec
+        self.token_model_name = token_model_name
+        self._uses_profile_tokens = any(route.uses_profile_tokens for route in routes)
+        self._health: Dict[str, _RouteHealth] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "ModelRouter":
+        return cls(
+            routes=[Route.from_config(config) for config in settings.LLM_ROUTES],
+            default_route=Route(
+                name="default",
+                model=settings.OPENAI_MODEL_NAME,
+                fallback_model=settings.LLM_FALLBACK_MODEL_NAME,
+                latency_slo_sec=settings.LLM_LATENCY_SLO_SEC,
+            ),
+            max_error_rate=settings.LLM_ROUTE_MAX_ERROR_RATE,
+            health_window=settings.LLM_ROUTE_HEALTH_WINDOW,
+            min_samples=settings.LLM_ROUTE_MIN_SAMPLES,
+            cooldown_sec=settings.LLM_ROUTE_COOLDOWN_SEC,
+            token_model_name=settings.OPENAI_MODEL_NAME,
+        )
+
+    def model_names(self) -> List[str]:
+        """All primary and fallback models the routes can send calls to."""
+        names: List[str] = []
+        for route in [*self.routes, self.default_route]:
+            for name in (route.model, route.fallback_model):
+                if name and name not in names:
+                    names.append(name)
+        return names
+
+    def _route_health(self, route: Route) -> _RouteHealth:
+        health = self._health.get(route.name)
+        if health is None:
+            health = _RouteHealth(samples=deque(maxlen=self.health_window))
+            self._health[route.name] = health
+        return health
+
+    def select(self, task: str, profile_information: Union[str, Dict]) -> RoutedCall:
+        """
+        Choose the route and model for an LLM call.
+
+        Args:
+            task: One of the `TASK_*` names
+            profile_information: Prompt-ready profile (see `prepare_profile_information`)
+
+        Returns:
+            The routed call (run it with `invoke`/`ainvoke`, or `track` for streams)
+        """
+        # Only measure the profile when a route depends on its size
+        profile_tokens = (
+            count_tokens(str(profile_information), self.token_model_name)
+            if self._uses_profile_tokens
+            else None
+        )
+        route = next(
+            (route for route in self.routes if route.matches(task, profile_tokens)),
+            self.default_route,
+        )
+
+        model = route.model
+        if route.fallback_model:
+            with self._lock:
+                degraded = self._route_health(route).is_degraded()
+            if degraded:
+                model = route.fallback_model
+                LLM_ROUTE_FALLBACKS.labels(route.name, "degraded").inc()
+        return RoutedCall(self, route, model, profile_tokens)
+
+    def record(
+        self, call: RoutedCall, duration: float, ok: bool, usage: TokenUsageCallbackHandler
+    ) -> None:
+        """Record an LLM run in the route metrics, and in the health of its primary model."""
+        route, model = call.route, call.model
+        LLM_ROUTE_CALLS.labels(route.name, model, "ok" if ok else "error").inc()
+        LLM_ROUTE_DURATION.labels(route.name, model).observe(duration)
+        LLM_ROUTE_TOKENS.labels(route.name, model, "prompt").inc(usage.prompt_tokens)
+        LLM_ROUTE_TOKENS.labels(route.name, model, "completion").inc(usage.completion_tokens)
+
+        # Only a route with somewhere to fall back to needs health tracking
+        if model != route.model or not route.fallback_model:
+            return
+        with self._lock:
+            reason = self._route_health(route).record(
+                duration,
+                ok,
+                route.latency_slo_sec,
+                self.max_error_rate,
+                self.min_samples,
+                self.cooldown_sec,
+            )
+        if reason:
+            logger.warning(
+                f"LLM route {route.name} degraded ({reason}): using {route.fallback_model} "
+                f"instead of {route.model} for {self.cooldown_sec:.0f}s"
+            )
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Get the process-wide router configured from settings."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter.from_settings()
+        return _router
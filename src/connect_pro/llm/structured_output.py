@@ -0,0 +1,250 @@
+"""
+Structured LLM outputs with a local repair pass.
+
+`LLM_OUTPUT_MODE` selects how the model is asked for a schema:
+
+- "prompt": JSON format instructions in the prompt, parsed from the reply text
+- "json_schema": OpenAI native structured outputs (response_format json_schema)
+- "function_calling": the schema as a forced tool call
+
+The native modes send the compact JSON schema as a request parameter instead of
+the format instructions blurb, and the model is constrained to produce it. In
+every mode, output that does not validate goes through a cheap local repair
+(code fences, surrounding prose, trailing commas, truncated JSON, common type
+drift) before it counts as a failure; only failures trigger a retry. Streamed
+output is parsed as it arrives and gets the same repair once complete.
+"""
+
+import json
+import re
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Type, TypeVar, cast
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_function
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, ValidationError
+
+from connect_pro.utils.metrics import record_structured_output
+
+LLM_OUTPUT_MODES = ("prompt", "json_schema", "function_calling")
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def _message_text(message: AIMessage) -> str:
+    """The model's answer: tool call arguments if it called the tool, else its content."""
+    if message.tool_calls:
+        return json.dumps(message.tool_calls[0]["args"])
+    if message.invalid_tool_calls:
+        return message.invalid_tool_calls[0].get("args") or ""
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(
+        part.get("text", "") if isinstance(part, dict) else str(part) for part in message.content
+    )
+
+
+def repair_json(text: str) -> Any:
+    """
+    Best-effort JSON from model output.
+
+    Handles markdown code fences, prose around the object, trailing commas and
+    output cut off mid-object (unclosed strings and brackets are closed).
+
+    Raises:
+        ValueError: If no JSON can be recovered
+    """
+    text = text.strip()
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object in the output")
+    end = text.rfind("}")
+    # Without a closing brace the output was cut off; keep everything after the opening one
+    text = text[start:end + 1] if end > start else text[start:]
+    return parse_json_markdown(_TRAILING_COMMA.sub(r"\1", text))
+
+
+def coerce_to_schema(data: Any, schema: Type[Model]) -> Model:
+    """
+    Validate data against the schema after fixing common type drift.
+
+    Unwraps a single enclosing key, turns a lone string into a one-item list
+    (and a list into a string) where the schema expects it, and drops list
+    items beyond the schema's `maxItems`.
+
+    Raises:
+        ValidationError: If the data still does not match the schema
+    """
+    properties = schema.model_json_schema().get("properties", {})
+    if isinstance(data, dict) and len(data) == 1 and properties.keys() - data.keys():
+        inner = next(iter(data.values()))
+        if isinstance(inner, dict):
+            data = inner
+
+    if isinstance(data, dict):
+        data = dict(data)
+        for name, spec in properties.items():
+            value = data.get(name)
+            if spec.get("type") == "array":
+                if isinstance(value, str):
+                    value = [value]
+                if isinstance(value, list) and spec.get("maxItems") is not None:
+                    value = value[:spec["maxItems"]]
+            elif spec.get("type") == "string" and isinstance(value, list):
+                value = " ".join(str(item) for item in value)
+            if value is not None:
+                data[name] = value
+    return schema.model_validate(data)
+
+
+def parse_structured_output(output: Any, schema: Type[Model]) -> Model:
+    """
+    Turn a chat model output into the schema, repairing it locally if needed.
+
+    Args:
+        output: An AIMessage, or the `include_raw` dict of `with_structured_output`
+        schema: Pydantic model to validate against
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        OutputParserException: If the output can not be repaired (retryable)
+    """
+    parsed: Optional[Any] = None
+    if isinstance(output, dict):
+        message, parsed = output["raw"], output.get("parsed")
+    else:
+        message = output
+
+    text = _message_text(message)
+    if parsed is None:
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            pass
+    if parsed is not None:
+        try:
+            result = schema.model_validate(parsed)
+            record_structured_output(schema.__name__, "parsed")
+            return result
+        except ValidationError:
+            pass
+
+    try:
+        result = coerce_to_schema(repair_json(text), schema)
+    except (ValueError, ValidationError) as e:
+        record_structured_output(schema.__name__, "failed")
+        raise OutputParserException(
+            f"Could not parse {schema.__name__} from the model output: {e}", llm_output=text
+        ) from e
+    record_structured_output(schema.__name__, "repaired")
+    return result
+
+
+def structured_output_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Strict OpenAI function definition of the schema (all fields required, no extras)."""
+    return convert_to_openai_function(schema, strict=True)
+
+
+def _response_format(function: Dict[str, Any]) -> Dict[str, Any]:
+    # A JSON schema dict rather than the model class: the OpenAI SDK would otherwise
+    # validate inside the request and fail before the raw output can be repaired
+    return {
+        "name": function["name"],
+        "description": function.get("description", ""),
+        "schema": function["parameters"],
+        "strict": True,
+    }
+
+
+def with_structured_output(llm: Any, schema: Type[Model], mode: str) -> Runnable:
+    """
+    Runnable from prompt value to validated schema instance.
+
+    Args:
+        llm: Chat model (ChatOpenAI)
+        schema: Pydantic model of the output
+        mode: One of `LLM_OUTPUT_MODES`
+
+    Returns:
+        Runnable producing `schema` instances, raising `OutputParserException`
+        on output that can not be repaired
+    """
+    parse = RunnableLambda(partial(parse_structured_output, schema=schema))
+    if mode == "prompt":
+        return llm | parse
+
+    function = structured_output_schema(schema)
+    if mode == "json_schema":
+        structured = llm.with_structured_output(
+            _response_format(function), method="json_schema", include_raw=True
+        )
+    elif mode == "function_calling":
+        structured = llm.with_structured_output(
+            function, method="function_calling", include_raw=True, strict=True
+        )
+    else:
+        raise ValueError(f"Unknown LLM output mode {mode!r}, expected one of {LLM_OUTPUT_MODES}")
+    return structured | parse
+
+
+def bind_structured_output(llm: Any, schema: Type[BaseModel], mode: str) -> Runnable:
+    """
+    Chat model asked for the schema as `mode` does, returning the raw message.
+
+    For streaming: the messages are parsed with `astream_structured_output`.
+    """
+    if mode == "prompt":
+        return llm
+
+    function = structured_output_schema(schema)
+    if mode == "json_schema":
+        return llm.bind(
+            response_format={"type": "json_schema", "json_schema": _response_format(function)}
+        )
+    if mode == "function_calling":
+        return llm.bind_tools([function], tool_choice=function["name"], strict=True)
+    raise ValueError(f"Unknown LLM output mode {mode!r}, expected one of {LLM_OUTPUT_MODES}")
+
+
+async def astream_structured_output(
+    chunks: AsyncIterator[AIMessageChunk], schema: Type[Model]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Parse streamed message chunks into progressively more complete dicts.
+
+    Partial JSON is parsed as it arrives (in the reply text or the tool call
+    arguments). The complete message goes through `parse_structured_output`,
+    so it gets the same local repair as non-streamed output.
+
+    Args:
+        chunks: Message chunks of a model bound with `bind_structured_output`
+        schema: Pydantic model of the output
+
+    Yields:
+        Partial dicts, then the validated result as a dict (last)
+
+    Raises:
+        OutputParserException: If the complete output can not be repaired
+    """
+    message: Optional[AIMessageChunk] = None
+    previous: Optional[Dict[str, Any]] = None
+    async for chunk in chunks:
+        message = chunk if message is None else cast(AIMessageChunk, message + chunk)
+        try:
+            parsed = parse_json_markdown(_message_text(message))
+        except ValueError:
+            continue
+        if isinstance(parsed, dict) and parsed != previous:
+            previous = parsed
+            yield parsed
+
+    if message is None:
+        raise OutputParserException(f"The model returned no {schema.__name__} output")
+    yield parse_structured_output(message, schema).model_dump()
@@ -0,0 +1,43 @@
+"""Token counting for prompt sizing."""
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English text, used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: Optional[str]) -> Any:
+    """Load the tiktoken encoding for a model, or None if it cannot be loaded."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model_name or "")
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # tiktoken downloads encodings on first use, which fails offline
+        logger.warning(f"Falling back to approximate token counts: {e}")
+        return None
+
+
+def count_tokens(text: str, model_name: Optional[str] = None) -> int:
+    """
+    Count the tokens of a text for the given model.
+
+    Args:
+        text: Text to measure
+        model_name: OpenAI model name (selects the tokenizer)
+
+    Returns:
+        Exact token count with tiktoken, otherwise an approximation
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        return max(1, len(text) // _CHARS_PER_TOKEN) if text else 0
+    return len(encoding.encode(text))
@@ -3,42 +3,125 @@ LinkedIn Profile Analyzer: Generates professional summaries and conversation poi
 from LinkedIn profiles through automated search and analysis.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Dict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 
-from connect_pro.agent.linkedin_profile_agent import LinkedInProfileAgent
 from connect_pro.config.settings import settings
-from connect_pro.llm.models import get_openai_llm
-from connect_pro.prompts.profile_analysis import profile_analysis_prompt
-from connect_pro.prompts.common_ground import common_ground_prompt
-from connect_pro.schemas.profile_insights import ProfileInsights, profile_parser
+from connect_pro.llm.insights_store import (
+    StoredInsights,
+    diff_fingerprints,
+    fingerprint_profile,
+    get_insights_store,
+)
+from connect_pro.llm.profile_compaction import compact_profile
+from connect_pro.llm.registry import (
+    get_combined_analysis_chain,
+    get_combined_analysis_stream_chain,
+    get_common_ground_chain,
+    get_insights_chain,
+    get_insights_stream_chain,
+    get_profile_agent,
+)
+from connect_pro.llm.response_cache import get_llm_response_cache
+from connect_pro.llm.routing import (
+    TASK_COMBINED_ANALYSIS,
+    TASK_COMMON_GROUND,
+    TASK_INSIGHTS,
+    RoutedCall,
+    get_model_router,
+)
+from connect_pro.llm.structured_output import astream_structured_output
+from connect_pro.prompts.combined_analysis import COMBINED_ANALYSIS_PROMPT_VERSION
+from connect_pro.prompts.common_ground import COMMON_GROUND_PROMPT_VERSION
+from connect_pro.prompts.profile_analysis import PROFILE_ANALYSIS_PROMPT_VERSION
+from connect_pro.schemas.profile_insights import ProfileAnalysis, ProfileInsights
+from connect_pro.scrapers.linkedin.cache import CachedLinkedInClient, get_profile_cache
 from connect_pro.scrapers.linkedin.proxycurl import ProxyCurlClient
-from connect_pro.scrapers.linkedin.selenium_scraper import SeleniumLinkedInScraper
+from connect_pro.utils.metrics import timed
+from connect_pro.utils.singleflight import AsyncSingleFlight
+from connect_pro.utils.text import normalize_query
 
+if TYPE_CHECKING:
+    from connect_pro.scrapers.linkedin.selenium_scraper import SeleniumLinkedInScraper
 
 logger = logging.getLogger(__name__)
 
+# Identical analyze jobs running at the same time share one pipeline run
+_analysis_flight = AsyncSingleFlight()
 
-def get_linkedin_client():
+# Sampling temperatures of the chains (part of the LLM cache key)
+INSIGHTS_TEMPERATURE = 0
+COMMON_GROUND_TEMPERATURE = 0.5
+COMBINED_ANALYSIS_TEMPERATURE = 0
+
+
+def get_linkedin_client() -> Union[
+    ProxyCurlClient, "SeleniumLinkedInScraper", CachedLinkedInClient
+]:
     """Get the appropriate LinkedIn client based on settings.
     
     Returns:
-        A LinkedIn client instance with compatible interface
+        A LinkedIn client instance with compatible interface, wrapped with the
+        shared profile cache when caching is enabled
     """
-    scraper_type = getattr(settings, "LINKEDIN_SCRAPER_TYPE", "proxycurl").lower()
-    
+    scraper_type = settings.LINKEDIN_SCRAPER_TYPE.lower()
+
+    client: Union[ProxyCurlClient, "SeleniumLinkedInScraper"]
     if scraper_type == "proxycurl":
         logger.info("Using ProxyCurl LinkedIn client")
-        return ProxyCurlClient()
+        client = ProxyCurlClient()
     elif scraper_type == "selenium":
+        # Selenium and webdriver_manager are only imported when configured
+        from connect_pro.scrapers.linkedin.selenium_scraper import (
+            SeleniumLinkedInScraper,
+        )
+
         logger.info("Using Selenium LinkedIn scraper")
-        return SeleniumLinkedInScraper()
+        client = SeleniumLinkedInScraper()
     else:
         logger.warning(f"Unknown scraper type: {scraper_type}, defaulting to Proxycurl")
-        return ProxyCurlClient()
-    
+        scraper_type = "proxycurl"
+        client = ProxyCurlClient()
+
+    profile_cache = get_profile_cache()
+    if profile_cache is None:
+        return client
+    return CachedLinkedInClient(client, cache=profile_cache, source=scraper_type)
+
+
+def prepare_profile_information(profile_data: Dict) -> Union[str, Dict]:
+    """
+    Turn scraped profile data into the `profile_information` prompt input.
+
+    With compaction enabled the profile is rendered as dense text that fits
+    `PROFILE_TOKEN_BUDGET`; otherwise the raw dict is passed through.
+
+    Args:
+        profile_data: Scraped LinkedIn profile data
+
+    Returns:
+        Compact profile text, or the profile dict if compaction is disabled
+    """
+    if not settings.PROFILE_COMPACTION_ENABLED:
+        return profile_data
+
+    compact = compact_profile(
+        profile_data,
+        token_budget=settings.PROFILE_TOKEN_BUDGET,
+        max_description_chars=settings.PROFILE_MAX_DESCRIPTION_CHARS,
+        model_name=settings.OPENAI_MODEL_NAME,
+    )
+    logger.info(
+        f"Profile prompt tokens: {compact.tokens_before} -> {compact.tokens_after}"
+        + (f" (truncated: {', '.join(compact.truncated_sections)})" if compact.truncated_sections else "")
+    )
+    return compact.text
+
 
 def generate_profile_insights(
     search_query: str, verbose: bool = False
@@ -55,7 +138,7 @@ def generate_profile_insights(
     """
     try:
         # Find LinkedIn profile
-        linkedin_agent = LinkedInProfileAgent(verbose=verbose)
+        linkedin_agent = get_profile_agent(verbose=verbose)
         profile_url = linkedin_agent.find_profile(search_query=search_query)
         if verbose:
             logger.info(f"Found LinkedIn profile: {profile_url}")
@@ -73,10 +156,7 @@ def generate_profile_insights(
             raise ValueError(f"Could not scrape profile data from {profile_url}")
 
         # Generate insights
-        llm = get_openai_llm(temperature=0)
-        chain = profile_analysis_prompt | llm | profile_parser
-
-        insights: ProfileInsights = chain.invoke(input={"profile_information": profile_data})
+        insights = generate_insights_from_profile(prepare_profile_information(profile_data))
 
         return {
             "profile_url": profile_url, 
@@ -113,16 +193,538 @@ def generate_common_ground(
             raise ValueError(f"Could not scrape profile data from {profile_url}")
 
         # Find out common ground
-        llm = get_openai_llm(temperature=0.5)        
-        chain = common_ground_prompt | llm
-        
-        common_ground = chain.invoke(
+        return generate_common_ground_from_profile(
+            prepare_profile_information(profile_data), user_information
+        )
+
+    except Exception as e:
+        if verbose:
+            logger.info(f"Error generating common ground: {str(e)}")
+        raise
+
+
+async def afind_profile_url(search_query: str, verbose: bool = False) -> Optional[str]:
+    """
+    Resolve a search query to a LinkedIn profile URL.
+
+    Args:
+        search_query: Search terms to find the person (name, company, position, etc.)
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        LinkedIn profile URL, or None if no profile was found
+    """
+    linkedin_agent = get_profile_agent(verbose=verbose)
+    profile_url = await linkedin_agent.afind_profile(search_query=search_query)
+    if verbose:
+        logger.info(f"Found LinkedIn profile: {profile_url}")
+    return profile_url
+
+
+@timed("fetch_profile")
+async def afetch_profile(profile_url: str, refresh: bool = False) -> Dict:
+    """
+    Scrape LinkedIn profile data with the configured client.
+
+    Args:
+        profile_url: LinkedIn profile URL
+        refresh: If True, bypass the profile cache and scrape the current profile
+
+    Returns:
+        Profile data dict
+
+    Raises:
+        ValueError: If the profile could not be scraped
+    """
+    linkedin_client = get_linkedin_client()
+    if refresh and isinstance(linkedin_client, CachedLinkedInClient):
+        profile_data = await linkedin_client.aget_profile(
+            linkedin_profile_url=profile_url, mock=False, refresh=True
+        )
+    else:
+        profile_data = await linkedin_client.aget_profile(
+            linkedin_profile_url=profile_url, mock=False
+        )
+    if not profile_data:
+        raise ValueError(f"Could not scrape profile data from {profile_url}")
+    return profile_data
+
+
+def _insights_cache_key(
+    profile_information: Union[str, Dict], model_name: str
+) -> Optional[str]:
+    llm_cache = get_llm_response_cache()
+    if llm_cache is None:
+        return None
+    return llm_cache.make_key(
+        "profile_insights",
+        model_name,
+        INSIGHTS_TEMPERATURE,
+        PROFILE_ANALYSIS_PROMPT_VERSION,
+        profile_information=profile_information,
+    )
+
+
+def _common_ground_cache_key(
+    profile_information: Union[str, Dict], user_information: str, model_name: str
+) -> Optional[str]:
+    llm_cache = get_llm_response_cache()
+    if llm_cache is None:
+        return None
+    return llm_cache.make_key(
+        "common_ground",
+        model_name,
+        COMMON_GROUND_TEMPERATURE,
+        COMMON_GROUND_PROMPT_VERSION,
+        profile_information=profile_information,
+        user_information=user_information.strip(),
+    )
+
+
+def _combined_analysis_cache_key(
+    profile_information: Union[str, Dict], user_information: str, model_name: str
+) -> Optional[str]:
+    llm_cache = get_llm_response_cache()
+    if llm_cache is None:
+        return None
+    return llm_cache.make_key(
+        "combined_analysis",
+        model_name,
+        COMBINED_ANALYSIS_TEMPERATURE,
+        COMBINED_ANALYSIS_PROMPT_VERSION,
+        profile_information=profile_information,
+        user_information=user_information.strip(),
+    )
+
+
+def _get_cached_llm_result(cache_key: Optional[str]) -> Optional[Any]:
+    llm_cache = get_llm_response_cache()
+    if llm_cache is None or not cache_key:
+        return None
+    return llm_cache.get(cache_key)
+
+
+def _get_cached_insights(cache_key: Optional[str]) -> Optional[ProfileInsights]:
+    cached = _get_cached_llm_result(cache_key)
+    return ProfileInsights(**cached) if cached is not None else None
+
+
+def _get_cached_common_ground(cache_key: Optional[str]) -> Optional[str]:
+    return _get_cached_llm_result(cache_key)
+
+
+def _get_cached_analysis(cache_key: Optional[str]) -> Optional[ProfileAnalysis]:
+    cached = _get_cached_llm_result(cache_key)
+    return ProfileAnalysis(**cached) if cached is not None else None
+
+
+def _store_llm_result(cache_key: Optional[str], result: Any) -> None:
+    llm_cache = get_llm_response_cache()
+    if llm_cache is not None and cache_key:
+        llm_cache.set(cache_key, result)
+
+
+@timed("llm_insights")
+def generate_insights_from_profile(profile_information: Union[str, Dict]) -> ProfileInsights:
+    """
+    Run the profile analysis chain on already scraped profile data.
+
+    The model is chosen by the model router (see `connect_pro.llm.routing`).
+    Results are served from the LLM response cache when the same profile was
+    analyzed before on the same route model and prompt version.
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+
+    Returns:
+        Parsed profile insights
+    """
+    routed = get_model_router().select(TASK_INSIGHTS, profile_information)
+    cache_key = _insights_cache_key(profile_information, routed.primary_model)
+    insights = _get_cached_insights(cache_key)
+    if insights is not None:
+        return insights
+
+    insights = routed.invoke(
+        lambda model_name, config: get_insights_chain(
+            temperature=INSIGHTS_TEMPERATURE, model_name=model_name
+        ).invoke(input={"profile_information": profile_information}, config=config)
+    )
+    _store_llm_result(cache_key, insights.to_dict())
+    return insights
+
+
+@timed("llm_common_ground")
+def generate_common_ground_from_profile(
+    profile_information: Union[str, Dict], user_information: str
+) -> str:
+    """
+    Run the common ground chain on already scraped profile data.
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+        user_information: Information provided by the user about themselves
+
+    Returns:
+        Common ground insights as a string
+    """
+    routed = get_model_router().select(TASK_COMMON_GROUND, profile_information)
+    cache_key = _common_ground_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    common_ground = _get_cached_common_ground(cache_key)
+    if common_ground is not None:
+        return common_ground
+
+    common_ground = routed.invoke(
+        lambda model_name, config: get_common_ground_chain(
+            temperature=COMMON_GROUND_TEMPERATURE, model_name=model_name
+        ).invoke(
             input={
-                "profile_information": profile_data,
+                "profile_information": profile_information,
                 "user_information": user_information
-            }
+            },
+            config=config,
+        )
+    )
+    _store_llm_result(cache_key, common_ground)
+    return common_ground
+
+
+@timed("llm_insights")
+async def agenerate_insights_from_profile(
+    profile_information: Union[str, Dict], routed: Optional[RoutedCall] = None
+) -> ProfileInsights:
+    """
+    Async variant of `generate_insights_from_profile`.
+
+    Pass `routed` to run on an already selected route; its `model` is the
+    model that produced the insights afterwards.
+    """
+    if routed is None:
+        routed = get_model_router().select(TASK_INSIGHTS, profile_information)
+    cache_key = _insights_cache_key(profile_information, routed.primary_model)
+    cached = await asyncio.to_thread(_get_cached_insights, cache_key)
+    if cached is not None:
+        return cached
+
+    insights = await routed.ainvoke(
+        lambda model_name, config: get_insights_chain(
+            temperature=INSIGHTS_TEMPERATURE, model_name=model_name
+        ).ainvoke(input={"profile_information": profile_information}, config=config)
+    )
+    await asyncio.to_thread(_store_llm_result, cache_key, insights.to_dict())
+    return insights
+
+
+@timed("llm_common_ground")
+async def agenerate_common_ground_from_profile(
+    profile_information: Union[str, Dict], user_information: str
+) -> str:
+    """Async variant of `generate_common_ground_from_profile`."""
+    routed = get_model_router().select(TASK_COMMON_GROUND, profile_information)
+    cache_key = _common_ground_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    cached = await asyncio.to_thread(_get_cached_common_ground, cache_key)
+    if cached is not None:
+        return cached
+
+    common_ground = await routed.ainvoke(
+        lambda model_name, config: get_common_ground_chain(
+            temperature=COMMON_GROUND_TEMPERATURE, model_name=model_name
+        ).ainvoke(
+            input={
+                "profile_information": profile_information,
+                "user_information": user_information
+            },
+            config=config,
+        )
+    )
+    await asyncio.to_thread(_store_llm_result, cache_key, common_ground)
+    return common_ground
+
+
+@timed("llm_combined")
+def generate_combined_analysis(
+    profile_information: Union[str, Dict], user_information: str
+) -> ProfileAnalysis:
+    """
+    Generate insights and common ground with a single LLM call.
+
+    Sends the profile once instead of once per chain (see `LLM_COMBINED_ANALYSIS`).
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+        user_information: Information provided by the user about themselves
+
+    Returns:
+        Parsed insights including common ground
+    """
+    routed = get_model_router().select(TASK_COMBINED_ANALYSIS, profile_information)
+    cache_key = _combined_analysis_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    analysis = _get_cached_analysis(cache_key)
+    if analysis is not None:
+        return analysis
+
+    analysis = routed.invoke(
+        lambda model_name, config: get_combined_analysis_chain(
+            temperature=COMBINED_ANALYSIS_TEMPERATURE, model_name=model_name
+        ).invoke(
+            input={
+                "profile_information": profile_information,
+                "user_information": user_information
+            },
+            config=config,
+        )
+    )
+    _store_llm_result(cache_key, analysis.model_dump())
+    return analysis
+
+
+@timed("llm_combined")
+async def agenerate_combined_analysis(
+    profile_information: Union[str, Dict], user_information: str
+) -> ProfileAnalysis:
+    """Async variant of `generate_combined_analysis`."""
+    routed = get_model_router().select(TASK_COMBINED_ANALYSIS, profile_information)
+    cache_key = _combined_analysis_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    cached = await asyncio.to_thread(_get_cached_analysis, cache_key)
+    if cached is not None:
+        return cached
+
+    analysis = await routed.ainvoke(
+        lambda model_name, config: get_combined_analysis_chain(
+            temperature=COMBINED_ANALYSIS_TEMPERATURE, model_name=model_name
+        ).ainvoke(
+            input={
+                "profile_information": profile_information,
+                "user_information": user_information
+            },
+            config=config,
+        )
+    )
+    await asyncio.to_thread(_store_llm_result, cache_key, analysis.model_dump())
+    return analysis
+
+
+async def agenerate_analysis(
+    profile_information: Union[str, Dict], user_information: str = ""
+) -> Tuple[ProfileInsights, Optional[str]]:
+    """
+    Generate insights and, with user information, common ground.
+
+    With `LLM_COMBINED_ANALYSIS` both come from one LLM call, otherwise the two
+    chains run concurrently.
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+        user_information: Optional information about the user for common ground
+
+    Returns:
+        Tuple of (insights, common ground or None)
+    """
+    if not user_information:
+        return await agenerate_insights_from_profile(profile_information), None
+
+    if settings.LLM_COMBINED_ANALYSIS:
+        analysis = await agenerate_combined_analysis(profile_information, user_information)
+        return analysis.to_insights(), analysis.common_ground
+
+    return await asyncio.gather(
+        agenerate_insights_from_profile(profile_information),
+        agenerate_common_ground_from_profile(profile_information, user_information),
+    )
+
+
+@timed("llm_insights")
+async def astream_insights_from_profile(
+    profile_information: Union[str, Dict]
+) -> AsyncIterator[Dict]:
+    """
+    Stream the profile analysis as progressively more complete insight dicts.
+
+    Partial JSON is parsed while the model generates it, so fields appear as
+    soon as they are written. The model is asked for the schema as
+    `LLM_OUTPUT_MODE` says, and the complete output is repaired and validated
+    against `ProfileInsights` like non-streamed output (a cached result is
+    yielded once, right away).
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+
+    Yields:
+        Partial insights dicts, the last one complete
+
+    Raises:
+        OutputParserException: If the complete output can not be repaired
+    """
+    routed = get_model_router().select(TASK_INSIGHTS, profile_information)
+    cache_key = _insights_cache_key(profile_information, routed.primary_model)
+    insights = await asyncio.to_thread(_get_cached_insights, cache_key)
+    if insights is not None:
+        yield insights.to_dict()
+        return
+
+    chain = get_insights_stream_chain(temperature=INSIGHTS_TEMPERATURE, model_name=routed.model)
+
+    # No retry on the fallback model once output has been streamed
+    partial: Dict = {}
+    with routed.track() as config:
+        async for partial in astream_structured_output(
+            chain.astream({"profile_information": profile_information}, config=config),
+            ProfileInsights,
+        ):
+            yield partial
+
+    await asyncio.to_thread(_store_llm_result, cache_key, partial)
+
+
+@timed("llm_combined")
+async def astream_combined_analysis(
+    profile_information: Union[str, Dict], user_information: str
+) -> AsyncIterator[Dict]:
+    """
+    Stream the combined analysis (see `LLM_COMBINED_ANALYSIS`) as progressively more complete dicts.
+
+    Like `astream_insights_from_profile`, with `common_ground` next to the insight fields.
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+        user_information: Information provided by the user about themselves
+
+    Yields:
+        Partial analysis dicts, the last one complete
+    """
+    routed = get_model_router().select(TASK_COMBINED_ANALYSIS, profile_information)
+    cache_key = _combined_analysis_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    analysis = await asyncio.to_thread(_get_cached_analysis, cache_key)
+    if analysis is not None:
+        yield analysis.model_dump()
+        return
+
+    chain = get_combined_analysis_stream_chain(
+        temperature=COMBINED_ANALYSIS_TEMPERATURE, model_name=routed.model
+    )
+
+    partial: Dict = {}
+    with routed.track() as config:
+        async for partial in astream_structured_output(
+            chain.astream(
+                {
+                    "profile_information": profile_information,
+                    "user_information": user_information
+                },
+                config=config,
+            ),
+            ProfileAnalysis,
+        ):
+            yield partial
+
+    await asyncio.to_thread(_store_llm_result, cache_key, partial)
+
+
+@timed("llm_common_ground")
+async def astream_common_ground_from_profile(
+    profile_information: Union[str, Dict], user_information: str
+) -> AsyncIterator[str]:
+    """
+    Stream the common ground text as it is generated.
+
+    Args:
+        profile_information: Prompt-ready profile (see `prepare_profile_information`)
+        user_information: Information provided by the user about themselves
+
+    Yields:
+        Text chunks; joined they form the full common ground text
+    """
+    routed = get_model_router().select(TASK_COMMON_GROUND, profile_information)
+    cache_key = _common_ground_cache_key(
+        profile_information, user_information, routed.primary_model
+    )
+    common_ground = await asyncio.to_thread(_get_cached_common_ground, cache_key)
+    if common_ground is not None:
+        yield common_ground
+        return
+
+    chain = get_common_ground_chain(
+        temperature=COMMON_GROUND_TEMPERATURE, model_name=routed.model
+    )
+
+    chunks = []
+    with routed.track() as config:
+        async for chunk in chain.astream(
+            {
+                "profile_information": profile_information,
+                "user_information": user_information
+            },
+            config=config,
+        ):
+            chunks.append(chunk)
+            yield chunk
+
+    await asyncio.to_thread(_store_llm_result, cache_key, "".join(chunks))
+
+
+async def agenerate_profile_insights(
+    search_query: str, verbose: bool = False
+) -> Optional[Dict[str, str]]:
+    """
+    Async variant of `generate_profile_insights` that never blocks the event loop.
+
+    Args:
+        search_query: Search terms to find the person (name, company, position, etc.)
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        Dict containing profile_url and insights
+    """
+    try:
+        profile_url = await afind_profile_url(search_query, verbose=verbose)
+        if not profile_url:
+            return None
+
+        profile_data = await afetch_profile(profile_url)
+        insights = await agenerate_insights_from_profile(
+            prepare_profile_information(profile_data)
+        )
+
+        return {
+            "profile_url": profile_url, 
+            "insights": insights.to_dict()
+        }
+
+    except Exception as e:
+        if verbose:
+            logger.info(f"Error generating profile insights: {str(e)}")
+        raise
+
+
+async def agenerate_common_ground(
+    profile_url: str, user_information: str, verbose: bool = False
+) -> str:
+    """
+    Async variant of `generate_common_ground` that never blocks the event loop.
+
+    Args:
+        profile_url: LinkedIn profile URL
+        user_information: Information provided by the user about themselves
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        Common ground insights as a string
+    """
+    try:
+        profile_data = await afetch_profile(profile_url)
+        return await agenerate_common_ground_from_profile(
+            prepare_profile_information(profile_data), user_information
         )
-        return common_ground.content
 
     except Exception as e:
         if verbose:
@@ -130,6 +732,165 @@ def generate_common_ground(
         raise
 
 
+async def arefresh_profile_insights(
+    profile_url: str, force: bool = False, verbose: bool = False
+) -> Dict:
+    """
+    Re-scrape a profile and regenerate its insights only if it materially changed.
+
+    The fresh profile is fingerprinted per section and compared with the
+    fingerprint stored at the last analysis. If no section the prompt uses has
+    changed (and the route's model and the prompt version are the same), the
+    stored insights are returned without an LLM call. A call served by a
+    fallback model does not count as a model change.
+
+    Args:
+        profile_url: LinkedIn profile URL
+        force: Regenerate even if nothing changed
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        Dict containing profile_url, insights, regenerated and changed_sections
+    """
+    try:
+        store = get_insights_store()
+        previous = await asyncio.to_thread(store.get, profile_url)
+
+        profile_data = await afetch_profile(profile_url, refresh=True)
+        fingerprint = fingerprint_profile(profile_data)
+        profile_information = prepare_profile_information(profile_data)
+        routed = get_model_router().select(TASK_INSIGHTS, profile_information)
+
+        if previous is None:
+            changed_sections = ["new"]
+        else:
+            changed_sections = diff_fingerprints(previous.fingerprint, fingerprint)
+            if previous.model_name != routed.primary_model:
+                changed_sections.append("model")
+            if previous.prompt_version != PROFILE_ANALYSIS_PROMPT_VERSION:
+                changed_sections.append("prompt")
+
+        if previous is not None and not changed_sections and not force:
+            if verbose:
+                logger.info(f"No material changes for {profile_url}, keeping insights")
+            return {
+                "profile_url": profile_url,
+                "insights": previous.insights,
+                "regenerated": False,
+                "changed_sections": [],
+            }
+
+        if verbose:
+            logger.info(
+                f"Regenerating insights for {profile_url} "
+                f"(changed: {', '.join(changed_sections) or 'forced'})"
+            )
+        insights = await agenerate_insights_from_profile(profile_information, routed)
+        await asyncio.to_thread(
+            store.set,
+            profile_url,
+            StoredInsights(
+                insights=insights.to_dict(),
+                fingerprint=fingerprint,
+                model_name=routed.primary_model,
+                prompt_version=PROFILE_ANALYSIS_PROMPT_VERSION,
+                changed_sections=changed_sections,
+            ),
+        )
+        return {
+            "profile_url": profile_url,
+            "insights": insights.to_dict(),
+            "regenerated": True,
+            "changed_sections": changed_sections,
+        }
+
+    except Exception as e:
+        if verbose:
+            logger.info(f"Error refreshing profile insights: {str(e)}")
+        raise
+
+
+def analysis_key(search_query: str, user_information: str = "") -> Tuple[str, str]:
+    """Identity of an analysis job: normalized query plus a hash of the user information."""
+    user_information_hash = hashlib.sha256(
+        user_information.strip().encode("utf-8")
+    ).hexdigest()
+    return normalize_query(search_query), user_information_hash
+
+
+async def aanalyze_profile(
+    search_query: str, user_information: str = "", verbose: bool = False
+) -> Optional[Dict]:
+    """
+    Run the full analysis pipeline for a search query.
+
+    Concurrent identical requests (same normalized query and user information)
+    attach to the same in-flight job and all receive its result.
+
+    Args:
+        search_query: Search terms to find the person (name, company, position, etc.)
+        user_information: Optional information about the user for common ground
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        Dict containing profile_url, insights and (optionally) common_ground,
+        or None if no profile was found
+    """
+    result = await _analysis_flight.do(
+        analysis_key(search_query, user_information),
+        _aanalyze_profile,
+        search_query,
+        user_information,
+        verbose,
+    )
+    return copy.deepcopy(result)
+
+
+async def _aanalyze_profile(
+    search_query: str, user_information: str = "", verbose: bool = False
+) -> Optional[Dict]:
+    """
+    Run the analysis pipeline once, without coalescing.
+
+    The profile is scraped and compacted once and shared by both chains;
+    insights and common ground are generated concurrently (or in one call,
+    see `agenerate_analysis`).
+
+    Args:
+        search_query: Search terms to find the person (name, company, position, etc.)
+        user_information: Optional information about the user for common ground
+        verbose: Whether to print detailed progress information
+
+    Returns:
+        Dict containing profile_url, insights and (optionally) common_ground,
+        or None if no profile was found
+    """
+    try:
+        profile_url = await afind_profile_url(search_query, verbose=verbose)
+        if not profile_url:
+            return None
+
+        profile_data = await afetch_profile(profile_url)
+        profile_information = prepare_profile_information(profile_data)
+
+        insights, common_ground = await agenerate_analysis(
+            profile_information, user_information
+        )
+
+        result = {
+            "profile_url": profile_url,
+            "insights": insights.to_dict(),
+        }
+        if common_ground is not None:
+            result["common_ground"] = common_ground
+        return result
+
+    except Exception as e:
+        if verbose:
+            logger.info(f"Error analyzing profile: {str(e)}")
+        raise
+
+
 def main():
     """Generate insights from LinkedIn profiles."""
     load_dotenv()
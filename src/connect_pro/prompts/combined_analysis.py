@@ -0,0 +1,51 @@
+"""Template for profile insights and common ground in a single LLM call."""
+
+from langchain.prompts.prompt import PromptTemplate
+
+from connect_pro.schemas.profile_insights import profile_analysis_parser
+
+# Bump whenever the template or its format instructions change (invalidates cached results)
+COMBINED_ANALYSIS_PROMPT_VERSION = "1"
+
+# Static instructions first and the profile next, so the prompt prefix is identical
+# across requests (and across readers of the same profile) for provider-side
+# prompt caching; only the reader's information at the end varies.
+COMBINED_ANALYSIS_TEMPLATE = """You analyze professional profiles and find meaningful connections between people.
+
+    Using the LinkedIn profile and the information about the reader below, provide:
+    1. Professional Summary (2-3 sentences highlighting their key achievements and role)
+    2. Personal Background (1-2 sentences about their background and journey)
+    3. Two Interesting Facts:
+        - First unique or surprising fact
+        - Second unique or surprising fact
+    4. Common Ground: 1-3 sentences with specific, factual points of common ground
+       (shared interests, experiences, or values) between the profile person and the reader
+
+    Focus on being concise yet informative and creative. Include specific details and achievements where available.
+    If certain information is not provided, focus on what is known rather than speculating.
+
+    For the common ground:
+    - Refer to the profile person by their full name initially, then by first name only
+    - Address the reader as "you" directly (never as "the user" or "the reader")
+    - Focus ONLY on concrete, specific connections (shared experiences, skills, education, interests, locations)
+    - Avoid vague statements like "you both seem interested in technology"
+    - Do NOT invent information - if there's insufficient data, reply "More information would be needed to identify specific common ground"
+
+    {format_instructions}
+
+    LinkedIn Profile Information:
+    {profile_information}
+
+    Information about the reader:
+    {user_information}
+    """
+
+combined_analysis_prompt = PromptTemplate(
+    input_variables=["profile_information", "user_information"],
+    template=COMBINED_ANALYSIS_TEMPLATE,
+    validate_template=True,  # ensure all input variables are present in the template
+    partial_variables={"format_instructions": profile_analysis_parser.get_format_instructions()},
+)
+
+# For native structured output modes: the schema is sent as a request parameter instead
+combined_analysis_structured_prompt = combined_analysis_prompt.partial(format_instructions="")
@@ -2,6 +2,9 @@
 
 from langchain.prompts.prompt import PromptTemplate
 
+# Bump whenever the template changes (invalidates cached results)
+COMMON_GROUND_PROMPT_VERSION = "1"
+
 COMMON_GROUND_TEMPLATE = """
     You are an expert at finding meaningful connections between people. 
     Your goal is to identify common ground between two people based on their professional profiles.
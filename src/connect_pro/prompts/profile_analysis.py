@@ -4,6 +4,9 @@ from langchain.prompts.prompt import PromptTemplate
 
 from connect_pro.schemas.profile_insights import profile_parser
 
+# Bump whenever the template or its format instructions change (invalidates cached results)
+PROFILE_ANALYSIS_PROMPT_VERSION = "1"
+
 PROFILE_ANALYSIS_TEMPLATE = """Based on the following information about a person:
     {profile_information}
     
@@ -27,3 +30,6 @@ profile_analysis_prompt = PromptTemplate(
     validate_template=True,  # ensure all input variables are present in the template
     partial_variables={"format_instructions": profile_parser.get_format_instructions()},
 )
+
+# For native structured output modes: the schema is sent as a request parameter instead
+profile_analysis_structured_prompt = profile_analysis_prompt.partial(format_instructions="")
@@ -32,3 +32,19 @@ class ProfileInsights(BaseModel):
 
 # Create parser instance
 profile_parser = PydanticOutputParser(pydantic_object=ProfileInsights)
+
+
+class ProfileAnalysis(ProfileInsights):
+    """Structured output of the combined analysis: insights plus common ground."""
+
+    common_ground: str = Field(
+        description="1-3 sentences on specific common ground between the person and the reader"
+    )
+
+    def to_insights(self) -> ProfileInsights:
+        """The insights part, without common ground."""
+        return ProfileInsights(**self.to_dict())
+
+
+# Parser for the combined (single-call) analysis
+profile_analysis_parser = PydanticOutputParser(pydantic_object=ProfileAnalysis)
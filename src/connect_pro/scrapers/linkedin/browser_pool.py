@@ -0,0 +1,369 @@
+"""Pool of warm, logged-in Chrome sessions for the Selenium scraper."""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from connect_pro.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedInLoginError(RuntimeError):
+    """Raised when a pooled browser cannot log in to LinkedIn."""
+
+
+# Assets we never read: images, fonts, media and tracking scripts
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*media.licdn.com*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+]
+
+
+@lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process."""
+    if settings.CHROMEDRIVER_PATH:
+        return settings.CHROMEDRIVER_PATH
+
+    # Use webdriver_manager to automatically download the correct driver
+    return ChromeDriverManager().install()
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """Create and configure a Chrome browser instance."""
+
+    options = Options()
+
+    # Run in headless mode (no visible browser window)
+    options.add_argument("--headless")
+
+    # Additional settings to make browser stable and realistic
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+
+    # Set a realistic window size to make the browser behave like a desktop browser
+    options.add_argument("--window-size=1920,1080")
+
+    # Use a realistic user agent (browser identification)
+    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+
+    # Return control once the DOM is ready instead of waiting for every subresource
+    options.page_load_strategy = settings.SELENIUM_PAGE_LOAD_STRATEGY
+
+    if settings.SELENIUM_BLOCK_RESOURCES:
+        # Don't download or decode images, and keep media silent
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+
+    service = Service(get_chromedriver_path())
+
+    # Create the browser instance
+    driver = webdriver.Chrome(service=service, options=options)
+
+    # No implicit wait: every lookup uses an explicit, condition-based wait instead
+    driver.implicitly_wait(0)
+
+    if settings.SELENIUM_BLOCK_RESOURCES:
+        # Block fonts, media and trackers at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {"urls": BLOCKED_URL_PATTERNS + settings.SELENIUM_EXTRA_BLOCKED_URLS},
+        )
+
+    return driver
+
+
+class _PooledDriver:
+    """A browser instance together with its pool bookkeeping."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.logged_in = False
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """Keeps a bounded number of logged-in Chrome instances warm for reuse.
+
+    Session cookies are persisted to disk so that new browsers (and restarted
+    processes) can skip the login form. Drivers are health-checked before reuse
+    and recycled after `max_pages_per_driver` pages or on any error.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        size: int = 1,
+        max_pages_per_driver: int = 50,
+        cookies_path: Optional[Path] = None,
+        acquire_timeout_sec: float = 300,
+        login_timeout_sec: float = 15,
+    ):
+        """Initialize the pool.
+
+        Args:
+            username: LinkedIn account username
+            password: LinkedIn account password
+            size: Max number of browser instances kept alive
+            max_pages_per_driver: Pages served before a browser is recycled
+            cookies_path: File to persist session cookies in (None disables it)
+            acquire_timeout_sec: Max seconds to wait for a free browser
+            login_timeout_sec: Max seconds to wait for each login step
+        """
+        self.username = username
+        self.password = password
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.cookies_path = cookies_path
+        self.acquire_timeout_sec = acquire_timeout_sec
+        self.login_timeout_sec = login_timeout_sec
+
+        self._idle: List[_PooledDriver] = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def session(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a healthy, logged-in browser for the duration of the block.
+
+        Raises:
+            LinkedInLoginError: If the browser could not log in
+            TimeoutError: If no browser became available in time
+        """
+        pooled = self._acquire()
+        discard = True
+        try:
+            if not self._is_healthy(pooled.driver):
+                logger.info("Recycling unhealthy browser")
+                self._quit(pooled.driver)
+                pooled = _PooledDriver(create_chrome_driver())
+
+            if not pooled.logged_in:
+                pooled.logged_in = self._login(pooled.driver)
+                if not pooled.logged_in:
+                    raise LinkedInLoginError(f"Login failed for {self.username}")
+
+            yield pooled.driver
+
+            pooled.pages_served += 1
+            discard = pooled.pages_served >= self.max_pages_per_driver
+        finally:
+            self._release(pooled, discard=discard)
+
+    def close(self) -> None:
+        """Quit all idle browsers; browsers in use are quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled.driver)
+
+    def _acquire(self) -> _PooledDriver:
+        deadline = time.monotonic() + self.acquire_timeout_sec
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise TimeoutError("Timed out waiting for a free browser")
+
+        try:
+            return _PooledDriver(create_chrome_driver())
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, pooled: _PooledDriver, discard: bool) -> None:
+        with self._cond:
+            if discard or self._closed:
+                self._created -= 1
+            else:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+        if discard or self._closed:
+            self._quit(pooled.driver)
+
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
+        """Check that the browser still responds."""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser: {e}")
+
+    def _login(self, driver: webdriver.Chrome) -> bool:
+        """Log in to LinkedIn, preferring persisted session cookies."""
+        if self._restore_cookies(driver):
+            logger.info(f"Restored LinkedIn session for {self.username}")
+            return True
+
+        try:
+            driver.get("https://www.linkedin.com/login")
+
+            # Enter email
+            email_field = WebDriverWait(driver, self.login_timeout_sec).until(
+                EC.presence_of_element_located((By.ID, "username"))
+            )
+            email_field.send_keys(self.username)
+
+            # Enter password
+            password_field = driver.find_element(By.ID, "password")
+            password_field.send_keys(self.password)
+
+            # Click sign in
+            signin_button = driver.find_element(By.XPATH, "//button[@type='submit']")
+            signin_button.click()
+
+            # Wait for login to complete (redirect away from the login form)
+            try:
+                WebDriverWait(driver, self.login_timeout_sec).until(
+                    lambda d: _is_logged_in_url(d.current_url)
+                )
+            except TimeoutException:
+                logger.warning(f"Login failed for {self.username}")
+                return False
+
+            logger.info(f"Successfully logged in as {self.username}")
+            self._save_cookies(driver)
+            return True
+
+        except (TimeoutException, NoSuchElementException) as e:
+            logger.error(f"Failed to login to LinkedIn: {str(e)}")
+            return False
+
+    def _restore_cookies(self, driver: webdriver.Chrome) -> bool:
+        """Load persisted cookies into the browser and check the session is valid."""
+        if not self.cookies_path or not self.cookies_path.exists():
+            return False
+
+        try:
+            cookies = json.loads(self.cookies_path.read_text())
+            # Cookies can only be set for the domain currently loaded
+            driver.get("https://www.linkedin.com/")
+            for cookie in cookies:
+                cookie.pop("sameSite", None)
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    continue
+
+            driver.get("https://www.linkedin.com/feed/")
+            if urlparse(driver.current_url).path.startswith("/feed"):
+                return True
+
+        except (ValueError, OSError, WebDriverException) as e:
+            logger.warning(f"Could not restore LinkedIn cookies: {e}")
+
+        logger.info("Persisted LinkedIn session expired, logging in again")
+        return False
+
+    def _save_cookies(self, driver: webdriver.Chrome) -> None:
+        """Persist the session cookies, readable only by the current user."""
+        if not self.cookies_path:
+            return
+
+        try:
+            self.cookies_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.cookies_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(driver.get_cookies(), f)
+        except (OSError, WebDriverException) as e:
+            logger.warning(f"Could not save LinkedIn cookies: {e}")
+
+
+def _is_logged_in_url(url: str) -> bool:
+    # Match the path only: login and authwall redirects carry the target page
+    # in their query string (e.g. `session_redirect=...%2Ffeed%2F`)
+    path = urlparse(url).path
+    return path.startswith(("/feed", "/checkpoint", "/in/"))
+
+
+_pools: Dict[str, BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(username: str, password: str) -> BrowserPool:
+    """Get the process-wide browser pool for a LinkedIn account."""
+    with _pools_lock:
+        pool = _pools.get(username)
+        if pool is None:
+            cookies_path = None
+            if settings.SELENIUM_PERSIST_COOKIES:
+                account_id = hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+                cookies_path = Path(settings.CACHE_DIR) / f"linkedin_cookies_{account_id}.json"
+
+            pool = BrowserPool(
+                username=username,
+                password=password,
+                size=settings.SELENIUM_POOL_SIZE,
+                max_pages_per_driver=settings.SELENIUM_MAX_PAGES_PER_DRIVER,
+                cookies_path=cookies_path,
+            )
+            _pools[username] = pool
+        return pool
+
+
+@atexit.register
+def close_browser_pools() -> None:
+    """Quit all pooled browsers."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,126 @@
+"""Shared profile cache for the LinkedIn clients."""
+
+import asyncio
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+from connect_pro.cache.sqlite_cache import SQLiteCache
+from connect_pro.config.settings import settings
+from connect_pro.utils.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+_PROFILE_SLUG_PATTERN = re.compile(r"/in/([^/?#]+)")
+
+
+def canonicalize_profile_url(linkedin_profile_url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL to `https://www.linkedin.com/in/<slug>`.
+
+    Trailing slashes, locale subdomains (e.g. `de.linkedin.com`), query strings
+    and fragments are dropped so equivalent URLs map to the same cache entry.
+
+    Args:
+        linkedin_profile_url: Any LinkedIn profile URL
+
+    Returns:
+        Canonical profile URL, or the stripped input if it has no `/in/<slug>` part
+    """
+    url = linkedin_profile_url.strip()
+    match = _PROFILE_SLUG_PATTERN.search(urlparse(url).path or url)
+    if not match:
+        return url
+
+    slug = unquote(match.group(1)).strip().lower()
+    return f"https://www.linkedin.com/in/{slug}"
+
+
+class CachedLinkedInClient:
+    """Wraps a LinkedIn client and serves repeat lookups from the profile cache."""
+
+    def __init__(self, client: Any, cache: SQLiteCache, source: str):
+        """Initialize the cached client.
+
+        Args:
+            client: ProxyCurlClient or SeleniumLinkedInScraper instance
+            cache: Cache store shared by all LinkedIn clients
+            source: Client name, used to keep differently shaped profiles apart
+        """
+        self.client = client
+        self.cache = cache
+        self.source = source
+
+    def _cache_key(self, linkedin_profile_url: str) -> str:
+        return f"{self.source}:{canonicalize_profile_url(linkedin_profile_url)}"
+
+    def get_cached_profile(self, linkedin_profile_url: str) -> Optional[Dict]:
+        """Return the cached profile for a URL without touching the network."""
+        return self.cache.get(self._cache_key(linkedin_profile_url))
+
+    def get_profile(
+        self, linkedin_profile_url: str, mock: bool = False, refresh: bool = False
+    ) -> Dict:
+        """Fetch LinkedIn profile data, using the cache when possible.
+
+        Args:
+            linkedin_profile_url: URL of the LinkedIn profile
+            mock: If True, return the client's mock data (never cached)
+            refresh: If True, bypass the cached entry and refetch the profile
+
+        Returns:
+            Dict containing profile data
+        """
+        if mock:
+            return self.client.get_profile(linkedin_profile_url, mock=True)
+
+        if not refresh:
+            cached = self.get_cached_profile(linkedin_profile_url)
+            record_cache_lookup("profile", cached is not None)
+            if cached is not None:
+                logger.info(f"Profile cache hit: {linkedin_profile_url}")
+                return cached
+
+        profile_data = self.client.get_profile(linkedin_profile_url, mock=False)
+        if profile_data:
+            self.cache.set(self._cache_key(linkedin_profile_url), profile_data)
+        return profile_data
+
+    async def aget_profile(
+        self, linkedin_profile_url: str, mock: bool = False, refresh: bool = False
+    ) -> Dict:
+        """Async variant of `get_profile`; cache reads and writes run off the event loop."""
+        if mock:
+            return await self.client.aget_profile(linkedin_profile_url, mock=True)
+
+        if not refresh:
+            cached = await asyncio.to_thread(self.get_cached_profile, linkedin_profile_url)
+            record_cache_lookup("profile", cached is not None)
+            if cached is not None:
+                logger.info(f"Profile cache hit: {linkedin_profile_url}")
+                return cached
+
+        profile_data = await self.client.aget_profile(linkedin_profile_url, mock=False)
+        if profile_data:
+            await asyncio.to_thread(
+                self.cache.set, self._cache_key(linkedin_profile_url), profile_data
+            )
+        return profile_data
+
+
+@lru_cache()
+def get_profile_cache() -> Optional[SQLiteCache]:
+    """Get the process-wide profile cache, or None if caching is disabled."""
+    if not settings.PROFILE_CACHE_ENABLED:
+        return None
+
+    return SQLiteCache(
+        path=str(Path(settings.CACHE_DIR) / "profiles.sqlite3"),
+        namespace="profiles",
+        ttl_sec=settings.PROFILE_CACHE_TTL_SEC,
+        max_entries=settings.PROFILE_CACHE_MAX_ENTRIES,
+        compress=settings.PROFILE_CACHE_COMPRESS,
+    )
@@ -1,250 +1,237 @@
-"""Functions for extracting data from LinkedIn profile pages."""
+"""Functions for extracting data from LinkedIn profile pages.
+
+Lookups never rely on the driver's implicit wait. Top-level fields poll their
+selectors with an explicit, per-field time budget; fields inside an already
+located section are looked up once without waiting.
+"""
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Union
 
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from connect_pro.scrapers.linkedin import profile_fields as fields
 
 logger = logging.getLogger(__name__)
 
-def extract_basic_info(driver: webdriver.Chrome) -> Dict:
-    """Extract basic profile information from the current page."""
-    profile_data = {}
-    
-    # Extract full name (the main profile heading)
+# Default time budget (seconds) for locating a top-level field or section
+DEFAULT_FIELD_TIMEOUT_SEC = 2.0
+
+SearchContext = Union[webdriver.Chrome, WebElement]
+
+
+def _find_element(
+    context: SearchContext, selectors: Sequence[str], timeout: float = 0.0
+) -> Optional[WebElement]:
+    """Return the first element matching any selector (in priority order).
+
+    Args:
+        context: Driver or element to search in
+        selectors: XPath selectors, most specific first
+        timeout: Seconds to keep polling if nothing matches yet (0 = no wait)
+
+    Returns:
+        The matching element, or None if the budget ran out
+    """
+
+    def _lookup(ctx: SearchContext) -> Optional[WebElement]:
+        for selector in selectors:
+            elements = ctx.find_elements(By.XPATH, selector)
+            if elements:
+                return elements[0]
+        return None
+
+    if timeout <= 0:
+        return _lookup(context)
+
     try:
+        return WebDriverWait(context, timeout, poll_frequency=0.1).until(_lookup)
+    except TimeoutException:
+        return None
+
+
+def _find_text(
+    context: SearchContext, selectors: Sequence[str], timeout: float = 0.0
+) -> str:
+    """Return the first non-empty text among the selectors (in priority order).
 
-        selectors = [
-            "//h1[contains(@class, 'inline') and contains(@class, 't-24')]",
-            "//h1[contains(@class, 'JtDmvATzwQtgDgNLDeDrrAGfeaVHRqsTx')]",
-            "//h1"  # Fallback to any h1 as a last resort
-        ]
+    Args:
+        context: Driver or element to search in
+        selectors: XPath selectors, most specific first
+        timeout: Seconds to keep polling if no selector has text yet (0 = no wait)
 
+    Returns:
+        Stripped element text, or "" if the budget ran out
+    """
+
+    def _lookup(ctx: SearchContext) -> Optional[str]:
         for selector in selectors:
-            try:
-                name_element = driver.find_element(By.XPATH, selector)
-                if name_element and name_element.text.strip():
-                    profile_data["full_name"] = name_element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-        
-        if "full_name" not in profile_data:
-            raise NoSuchElementException("No name element found with any selector")
-    
-    except NoSuchElementException:
-        profile_data["full_name"] = ""
+            for element in ctx.find_elements(By.XPATH, selector)[:1]:
+                text = element.text.strip()
+                if text:
+                    return text
+        return None
+
+    if timeout <= 0:
+        return _lookup(context) or ""
+
+    try:
+        return WebDriverWait(context, timeout, poll_frequency=0.1).until(_lookup) or ""
+    except TimeoutException:
+        return ""
+
+
+def extract_basic_info(
+    driver: webdriver.Chrome, timeout: float = DEFAULT_FIELD_TIMEOUT_SEC
+) -> Dict:
+    """Extract basic profile information from the current page.
+
+    Args:
+        driver: Browser with the profile page loaded
+        timeout: Time budget per field in seconds
+    """
+    profile_data: Dict[str, str] = {}
+
+    # Extract full name (the main profile heading)
+    profile_data["full_name"] = _find_text(driver, fields.NAME_SELECTORS, timeout=timeout)
+    if not profile_data["full_name"]:
         logger.warning("Could not find full name")
-        
+
     # Extract headline (job title/description that appears below the name)
-    try:
-        profile_data["headline"] = driver.find_element(
-            By.XPATH, "//div[contains(@class, 'text-body-medium')]"
-        ).text.strip()
-    except NoSuchElementException:
+    headline_element = _find_element(driver, fields.HEADLINE_SELECTORS, timeout=timeout)
+    if headline_element is not None:
+        profile_data["headline"] = headline_element.text.strip()
+    else:
         profile_data["headline"] = ""
         logger.warning("Could not find headline")
-    
+
     # Extract location (city/country information)
-    try:
-        location_selectors = [
-            "//span[contains(@class, 'text-body-small') and contains(@class, 'inline') and contains(@class, 't-black--light')]",
-            "//span[contains(@class, 'text-body-small')]"
-        ]
-
-        for selector in location_selectors:
-            try:
-                location_element = driver.find_element(By.XPATH, selector)
-                if location_element and location_element.text.strip():
-                    location_text = location_element.text.strip()
-                    
-                    # Split location into city and country if possible
-                    if "," in location_text:
-                        parts = [part.strip() for part in location_text.split(",")]
-                        profile_data["city"] = parts[0]
-                        profile_data["country"] = parts[1]
-                    else:
-                        profile_data["location"] = location_text
-                    break
-            except NoSuchElementException:
-                continue
-                
-    except NoSuchElementException:
+    location_text = _find_text(driver, fields.LOCATION_SELECTORS, timeout=timeout)
+    if location_text:
+        profile_data.update(fields.parse_location(location_text))
+    else:
         logger.warning("Could not find location")
 
-    
     # Extract about/summary section
-    try:
-        summary_selectors = [
-            "//div[contains(@class, 'inline-show-more-text--is-collapsed-with-line-clamp')]",
-            "//div[contains(@class, 'inline-show-more-text')]",
-            "//section[.//span[text()='About']]//div[contains(@class, 'break-words')]"
-        ]
-
-        for selector in summary_selectors:
-            try:
-                summary_element = driver.find_element(By.XPATH, selector)
-                if summary_element and summary_element.text.strip():
-                    profile_data["summary"] = summary_element.text.strip()
-                    break
-            except NoSuchElementException:
-                continue
-                
-        if "summary" not in profile_data:
-            # Try one more approach - find the About section and extract all text
-            try:
-                about_section = driver.find_element(By.XPATH, "//section[.//span[text()='About']]")
-                about_text = about_section.text
-                if "About" in about_text:
-                    # Remove the "About" heading
-                    about_text = about_text.replace("About", "", 1).strip()
-                profile_data["summary"] = about_text
-            except NoSuchElementException:
-                raise NoSuchElementException("No summary element found with any selector")
-                
-    except NoSuchElementException:
-        profile_data["summary"] = ""
-        logger.warning("Could not find summary section")
-    
+    summary = _find_text(driver, fields.SUMMARY_SELECTORS, timeout=timeout)
+    if not summary:
+        # Try one more approach - find the About section and extract all text
+        about_section = _find_element(driver, fields.ABOUT_SECTION_SELECTORS)
+        if about_section is not None:
+            summary = fields.strip_about_heading(about_section.text)
+        else:
+            logger.warning("Could not find summary section")
+
+    profile_data["summary"] = summary
+
     return profile_data
 
-def extract_experiences(driver: webdriver.Chrome) -> List[Dict]:
-    """Extract work experiences from the profile."""
-    experiences = []
-    
-    try:
-        # Find the experience section
-        exp_section = driver.find_element(
-            By.XPATH, "//div[./div/div/span/span[text()='Experience']]"
-        )
-        
-        # Find all experience entries (list items within this section)
-        exp_entries = exp_section.find_elements(
-            By.XPATH, ".//ul/li"
-        )
-        
-        for entry in exp_entries:
-            exp_data = {}
-            
-            # Extract job title
-            try:
-                exp_data["title"] = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 'mr1 t-bold')]"
-                ).text.strip()
-            except NoSuchElementException:
-                continue  # Skip if no title found (essential field)
-            
-            # Extract company name
-            try:
-                exp_data["company"] = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal')]"
-                ).text.strip()
-            except NoSuchElementException:
-                exp_data["company"] = ""
-            
-            # Extract dates
-            try:
-                date_range = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal t-black--light')]"
-                ).text.strip()
-                
-                # Parse date range like "Jan 2020 - Present"
-                dates = date_range.split(" · ")[0].split(" - ")
-                if len(dates) >= 2:
-                    exp_data["start_date"] = dates[0].strip()
-                    exp_data["end_date"] = dates[1].strip() if dates[1].lower() != "present" else "Present"
-            except NoSuchElementException:
-                pass
-            
-            # Extract location
-            try:
-                location_element = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal t-black--light')][2]"
-                )
-                exp_data["location"] = location_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract description
-            try:
-                desc = entry.find_element(
-                    By.XPATH, ".//div[contains(@class, 't-14 t-normal')]"
-                ).text.strip()
-                if desc:
-                    exp_data["description"] = desc
-            except NoSuchElementException:
-                pass
-            
-            experiences.append(exp_data)
-    
-    except NoSuchElementException:
+
+def extract_experiences(
+    driver: webdriver.Chrome, timeout: float = DEFAULT_FIELD_TIMEOUT_SEC
+) -> List[Dict]:
+    """Extract work experiences from the profile.
+
+    Args:
+        driver: Browser with the profile page loaded
+        timeout: Time budget for locating the Experience section in seconds
+    """
+    experiences: List[Dict] = []
+
+    # Find the experience section
+    exp_section = _find_element(driver, fields.EXPERIENCE_SECTION_SELECTORS, timeout=timeout)
+    if exp_section is None:
         logger.warning("No experience section found")
-    
+        return experiences
+
+    # Find all experience entries (list items within this section)
+    exp_entries = exp_section.find_elements(By.XPATH, fields.ENTRY_SELECTOR)
+
+    for entry in exp_entries:
+        exp_data: Dict[str, str] = {}
+
+        # Extract job title
+        title_element = _find_element(entry, fields.EXPERIENCE_TITLE_SELECTORS)
+        if title_element is None:
+            continue  # Skip if no title found (essential field)
+        exp_data["title"] = title_element.text.strip()
+
+        # Extract company name
+        company_element = _find_element(entry, fields.EXPERIENCE_COMPANY_SELECTORS)
+        exp_data["company"] = company_element.text.strip() if company_element is not None else ""
+
+        # Extract dates
+        date_element = _find_element(entry, fields.EXPERIENCE_DATES_SELECTORS)
+        if date_element is not None:
+            exp_data.update(fields.parse_experience_dates(date_element.text.strip()))
+
+        # Extract location
+        location_element = _find_element(entry, fields.EXPERIENCE_LOCATION_SELECTORS)
+        if location_element is not None:
+            exp_data["location"] = location_element.text.strip()
+
+        # Extract description
+        desc_element = _find_element(entry, fields.EXPERIENCE_DESCRIPTION_SELECTORS)
+        if desc_element is not None:
+            desc = desc_element.text.strip()
+            if desc:
+                exp_data["description"] = desc
+
+        experiences.append(exp_data)
+
     return experiences
 
-def extract_education(driver: webdriver.Chrome) -> List[Dict]:
-    """Extract education information from the profile."""
-    education = []
-    
-    try:
-        # Find the education section
-        edu_section = driver.find_element(
-            By.XPATH, "//div[./div/div/span/span[text()='Education']]"
-        )
-        
-        # Find all education entries
-        edu_entries = edu_section.find_elements(
-            By.XPATH, ".//ul/li"
-        )
-        
-        for entry in edu_entries:
-            edu_data = {}
-            
-            # Extract school name
-            try:
-                edu_data["school"] = entry.find_element(
-                    By.XPATH, ".//h3[contains(@class, 't-16')]"
-                ).text.strip()
-            except NoSuchElementException:
-                continue  # Skip if no school found (essential field)
-            
-            # Extract degree
-            try:
-                edu_data["degree"] = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal')]"
-                ).text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract dates
-            try:
-                date_range = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal t-black--light')]"
-                ).text.strip()
-                
-                dates = date_range.split(" - ")
-                if len(dates) >= 2:
-                    edu_data["start_date"] = dates[0].strip()
-                    edu_data["end_date"] = dates[1].strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract field of study (if separate from degree)
-            try:
-                field = entry.find_element(
-                    By.XPATH, ".//span[contains(@class, 't-14 t-normal')][2]"
-                ).text.strip()
-                if field and "field of study" in field.lower():
-                    edu_data["field_of_study"] = field.split("Field of study ")[1]
-            except NoSuchElementException:
-                pass
-            
-            education.append(edu_data)
-    
-    except NoSuchElementException:
+
+def extract_education(
+    driver: webdriver.Chrome, timeout: float = DEFAULT_FIELD_TIMEOUT_SEC
+) -> List[Dict]:
+    """Extract education information from the profile.
+
+    Args:
+        driver: Browser with the profile page loaded
+        timeout: Time budget for locating the Education section in seconds
+    """
+    education: List[Dict] = []
+
+    # Find the education section
+    edu_section = _find_element(driver, fields.EDUCATION_SECTION_SELECTORS, timeout=timeout)
+    if edu_section is None:
         logger.warning("No education section found")
-    
-    return education
+        return education
+
+    # Find all education entries
+    edu_entries = edu_section.find_elements(By.XPATH, fields.ENTRY_SELECTOR)
 
+    for entry in edu_entries:
+        edu_data: Dict[str, str] = {}
+
+        # Extract school name
+        school_element = _find_element(entry, fields.EDUCATION_SCHOOL_SELECTORS)
+        if school_element is None:
+            continue  # Skip if no school found (essential field)
+        edu_data["school"] = school_element.text.strip()
+
+        # Extract degree
+        degree_element = _find_element(entry, fields.EDUCATION_DEGREE_SELECTORS)
+        if degree_element is not None:
+            edu_data["degree"] = degree_element.text.strip()
+
+        # Extract dates
+        date_element = _find_element(entry, fields.EDUCATION_DATES_SELECTORS)
+        if date_element is not None:
+            edu_data.update(fields.parse_education_dates(date_element.text))
+
+        # Extract field of study (if separate from degree)
+        field_element = _find_element(entry, fields.EDUCATION_FIELD_SELECTORS)
+        if field_element is not None:
+            field_of_study = fields.parse_field_of_study(field_element.text.strip())
+            if field_of_study:
+                edu_data["field_of_study"] = field_of_study
+
+        education.append(edu_data)
+
+    return education
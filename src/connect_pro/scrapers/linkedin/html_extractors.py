@@ -0,0 +1,225 @@
+"""Single-pass extraction of LinkedIn profile data from page HTML.
+
+Parses `driver.page_source` in-process with lxml instead of issuing one
+WebDriver round trip per field. Produces the same dict shape as
+`extract_basic_info`, `extract_experiences` and `extract_education`, and works
+on saved HTML snapshots without a browser.
+"""
+
+import json
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from lxml import etree, html  # type: ignore[import-untyped]
+
+from connect_pro.scrapers.linkedin import profile_fields as fields
+
+logger = logging.getLogger(__name__)
+
+
+def _xpaths(selectors: Sequence[str]) -> List[etree.XPath]:
+    return [etree.XPath(selector) for selector in selectors]
+
+
+# Compiled once at import; same selectors as the WebDriver extractors
+_NAME = _xpaths(fields.NAME_SELECTORS)
+_HEADLINE = _xpaths(fields.HEADLINE_SELECTORS)
+_LOCATION = _xpaths(fields.LOCATION_SELECTORS)
+_SUMMARY = _xpaths(fields.SUMMARY_SELECTORS)
+_ABOUT_SECTION = _xpaths(fields.ABOUT_SECTION_SELECTORS)
+
+_EXPERIENCE_SECTION = _xpaths(fields.EXPERIENCE_SECTION_SELECTORS)
+_EDUCATION_SECTION = _xpaths(fields.EDUCATION_SECTION_SELECTORS)
+_ENTRIES = etree.XPath(fields.ENTRY_SELECTOR)
+
+_EXP_TITLE = _xpaths(fields.EXPERIENCE_TITLE_SELECTORS)
+_EXP_COMPANY = _xpaths(fields.EXPERIENCE_COMPANY_SELECTORS)
+_EXP_DATES = _xpaths(fields.EXPERIENCE_DATES_SELECTORS)
+_EXP_LOCATION = _xpaths(fields.EXPERIENCE_LOCATION_SELECTORS)
+_EXP_DESCRIPTION = _xpaths(fields.EXPERIENCE_DESCRIPTION_SELECTORS)
+
+_EDU_SCHOOL = _xpaths(fields.EDUCATION_SCHOOL_SELECTORS)
+_EDU_DEGREE = _xpaths(fields.EDUCATION_DEGREE_SELECTORS)
+_EDU_DATES = _xpaths(fields.EDUCATION_DATES_SELECTORS)
+_EDU_FIELD = _xpaths(fields.EDUCATION_FIELD_SELECTORS)
+
+# Elements whose text is not rendered to the user
+_HIDDEN_TAGS = {"script", "style", "noscript", "template"}
+
+
+def _text(element: Any) -> str:
+    """Approximate the rendered text of an element (like WebElement.text)."""
+    parts: List[str] = []
+
+    def _collect(node: Any) -> None:
+        if not isinstance(node.tag, str) or node.tag in _HIDDEN_TAGS:
+            return
+        if "visually-hidden" in (node.get("class") or ""):
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            _collect(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    _collect(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _first(context: Any, xpaths: Sequence[etree.XPath]) -> Optional[etree._Element]:
+    for xpath in xpaths:
+        elements = xpath(context)
+        if elements:
+            return elements[0]
+    return None
+
+
+def _first_text(context: Any, xpaths: Sequence[etree.XPath]) -> str:
+    for xpath in xpaths:
+        elements = xpath(context)
+        if elements:
+            text = _text(elements[0])
+            if text:
+                return text
+    return ""
+
+
+def extract_basic_info_from_tree(tree: Any) -> Dict:
+    """Extract basic profile information from a parsed profile page."""
+    profile_data: Dict[str, str] = {}
+
+    profile_data["full_name"] = _first_text(tree, _NAME)
+    if not profile_data["full_name"]:
+        logger.warning("Could not find full name")
+
+    headline_element = _first(tree, _HEADLINE)
+    if headline_element is not None:
+        profile_data["headline"] = _text(headline_element)
+    else:
+        profile_data["headline"] = ""
+        logger.warning("Could not find headline")
+
+    location_text = _first_text(tree, _LOCATION)
+    if location_text:
+        profile_data.update(fields.parse_location(location_text))
+    else:
+        logger.warning("Could not find location")
+
+    summary = _first_text(tree, _SUMMARY)
+    if not summary:
+        about_section = _first(tree, _ABOUT_SECTION)
+        if about_section is not None:
+            summary = fields.strip_about_heading(_text(about_section))
+        else:
+            logger.warning("Could not find summary section")
+
+    profile_data["summary"] = summary
+
+    return profile_data
+
+
+def extract_experiences_from_tree(tree: Any) -> List[Dict]:
+    """Extract work experiences from a parsed profile page."""
+    experiences: List[Dict] = []
+
+    exp_section = _first(tree, _EXPERIENCE_SECTION)
+    if exp_section is None:
+        logger.warning("No experience section found")
+        return experiences
+
+    for entry in _ENTRIES(exp_section):
+        exp_data: Dict[str, str] = {}
+
+        title_element = _first(entry, _EXP_TITLE)
+        if title_element is None:
+            continue  # Skip if no title found (essential field)
+        exp_data["title"] = _text(title_element)
+
+        company_element = _first(entry, _EXP_COMPANY)
+        exp_data["company"] = _text(company_element) if company_element is not None else ""
+
+        date_element = _first(entry, _EXP_DATES)
+        if date_element is not None:
+            exp_data.update(fields.parse_experience_dates(_text(date_element)))
+
+        location_element = _first(entry, _EXP_LOCATION)
+        if location_element is not None:
+            exp_data["location"] = _text(location_element)
+
+        desc_element = _first(entry, _EXP_DESCRIPTION)
+        if desc_element is not None:
+            desc = _text(desc_element)
+            if desc:
+                exp_data["description"] = desc
+
+        experiences.append(exp_data)
+
+    return experiences
+
+
+def extract_education_from_tree(tree: Any) -> List[Dict]:
+    """Extract education information from a parsed profile page."""
+    education: List[Dict] = []
+
+    edu_section = _first(tree, _EDUCATION_SECTION)
+    if edu_section is None:
+        logger.warning("No education section found")
+        return education
+
+    for entry in _ENTRIES(edu_section):
+        edu_data: Dict[str, str] = {}
+
+        school_element = _first(entry, _EDU_SCHOOL)
+        if school_element is None:
+            continue  # Skip if no school found (essential field)
+        edu_data["school"] = _text(school_element)
+
+        degree_element = _first(entry, _EDU_DEGREE)
+        if degree_element is not None:
+            edu_data["degree"] = _text(degree_element)
+
+        date_element = _first(entry, _EDU_DATES)
+        if date_element is not None:
+            edu_data.update(fields.parse_education_dates(_text(date_element)))
+
+        field_element = _first(entry, _EDU_FIELD)
+        if field_element is not None:
+            field_of_study = fields.parse_field_of_study(_text(field_element))
+            if field_of_study:
+                edu_data["field_of_study"] = field_of_study
+
+        education.append(edu_data)
+
+    return education
+
+
+def extract_profile_from_html(page_source: str) -> Dict:
+    """
+    Extract all profile data from the HTML of a LinkedIn profile page.
+
+    Args:
+        page_source: Full page HTML (e.g. `driver.page_source` or a saved snapshot)
+
+    Returns:
+        Dict containing basic info plus `experiences` and `education`
+    """
+    tree = html.fromstring(page_source)
+    profile_data = extract_basic_info_from_tree(tree)
+    profile_data["experiences"] = extract_experiences_from_tree(tree)
+    profile_data["education"] = extract_education_from_tree(tree)
+    return profile_data
+
+
+if __name__ == "__main__":
+    """
+    Re-parse saved profile snapshots offline, without a browser.
+
+    Usage:
+        python -m connect_pro.scrapers.linkedin.html_extractors snapshot.html [...]
+    """
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            print(json.dumps(extract_profile_from_html(f.read()), indent=2, ensure_ascii=False))
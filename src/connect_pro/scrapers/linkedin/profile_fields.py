@@ -0,0 +1,98 @@
+"""Selectors and parsing rules shared by the WebDriver and HTML profile extractors.
+
+Both extractors look fields up with these XPath selectors (most specific
+first) and turn the found texts into profile fields with these helpers, so a
+LinkedIn markup change only has to be handled here.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+Selectors = Tuple[str, ...]
+
+# Top-level fields
+NAME_SELECTORS: Selectors = (
+    "//h1[contains(@class, 'inline') and contains(@class, 't-24')]",
+    "//h1[contains(@class, 'JtDmvATzwQtgDgNLDeDrrAGfeaVHRqsTx')]",
+    "//h1",  # Fallback to any h1 as a last resort
+)
+HEADLINE_SELECTORS: Selectors = ("//div[contains(@class, 'text-body-medium')]",)
+LOCATION_SELECTORS: Selectors = (
+    "//span[contains(@class, 'text-body-small') and contains(@class, 'inline') and contains(@class, 't-black--light')]",
+    "//span[contains(@class, 'text-body-small')]",
+)
+SUMMARY_SELECTORS: Selectors = (
+    "//div[contains(@class, 'inline-show-more-text--is-collapsed-with-line-clamp')]",
+    "//div[contains(@class, 'inline-show-more-text')]",
+    "//section[.//span[text()='About']]//div[contains(@class, 'break-words')]",
+)
+ABOUT_SECTION_SELECTORS: Selectors = ("//section[.//span[text()='About']]",)
+
+# Sections and their entries
+EXPERIENCE_SECTION_SELECTORS: Selectors = ("//div[./div/div/span/span[text()='Experience']]",)
+EDUCATION_SECTION_SELECTORS: Selectors = ("//div[./div/div/span/span[text()='Education']]",)
+ENTRY_SELECTOR = ".//ul/li"
+
+# Fields of an experience entry
+EXPERIENCE_TITLE_SELECTORS: Selectors = (".//span[contains(@class, 'mr1 t-bold')]",)
+EXPERIENCE_COMPANY_SELECTORS: Selectors = (".//span[contains(@class, 't-14 t-normal')]",)
+EXPERIENCE_DATES_SELECTORS: Selectors = (
+    ".//span[contains(@class, 't-14 t-normal t-black--light')]",
+)
+EXPERIENCE_LOCATION_SELECTORS: Selectors = (
+    ".//span[contains(@class, 't-14 t-normal t-black--light')][2]",
+)
+EXPERIENCE_DESCRIPTION_SELECTORS: Selectors = (".//div[contains(@class, 't-14 t-normal')]",)
+
+# Fields of an education entry
+EDUCATION_SCHOOL_SELECTORS: Selectors = (".//h3[contains(@class, 't-16')]",)
+EDUCATION_DEGREE_SELECTORS: Selectors = (".//span[contains(@class, 't-14 t-normal')]",)
+EDUCATION_DATES_SELECTORS: Selectors = (
+    ".//span[contains(@class, 't-14 t-normal t-black--light')]",
+)
+EDUCATION_FIELD_SELECTORS: Selectors = (".//span[contains(@class, 't-14 t-normal')][2]",)
+
+_FIELD_OF_STUDY_PATTERN = re.compile(r"field of study\s*:?\s*", re.IGNORECASE)
+
+
+def parse_location(location_text: str) -> Dict[str, str]:
+    """Split a location like 'Berlin, Germany' into city and country if possible."""
+    if "," in location_text:
+        parts = [part.strip() for part in location_text.split(",")]
+        return {"city": parts[0], "country": parts[1]}
+    return {"location": location_text}
+
+
+def strip_about_heading(about_text: str) -> str:
+    """Remove the 'About' heading from the text of the About section."""
+    if "About" in about_text:
+        return about_text.replace("About", "", 1).strip()
+    return about_text
+
+
+def parse_experience_dates(dates_text: str) -> Dict[str, str]:
+    """Parse a date range like 'Jan 2020 - Present · 4 yrs' into start and end date."""
+    dates = dates_text.split(" · ")[0].split(" - ")
+    if len(dates) < 2:
+        return {}
+    end_date = dates[1].strip()
+    return {
+        "start_date": dates[0].strip(),
+        "end_date": "Present" if end_date.lower() == "present" else end_date,
+    }
+
+
+def parse_education_dates(dates_text: str) -> Dict[str, str]:
+    """Parse a date range like '2015 - 2019' into start and end date."""
+    dates = dates_text.strip().split(" - ")
+    if len(dates) < 2:
+        return {}
+    return {"start_date": dates[0].strip(), "end_date": dates[1].strip()}
+
+
+def parse_field_of_study(text: str) -> Optional[str]:
+    """Return the field from a text like 'Field of study Computer Science', if any."""
+    parts = _FIELD_OF_STUDY_PATTERN.split(text, maxsplit=1)
+    if len(parts) < 2:
+        return None
+    return parts[1].strip() or None
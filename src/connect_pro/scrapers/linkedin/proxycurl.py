@@ -1,36 +1,213 @@
-from typing import Dict, Optional
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from typing import Dict, NoReturn, Optional, Union
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from connect_pro.config.settings import settings
+from connect_pro.utils.metrics import UPSTREAM_RESPONSES, timed
+from connect_pro.utils.retry import RETRYABLE_STATUS_CODES, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+Response = Union[requests.Response, httpx.Response]
+
+_session = None
+_session_lock = threading.Lock()
+_request_slots: Optional[threading.BoundedSemaphore] = None
+
+# httpx async clients and asyncio semaphores are bound to the loop they are used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_request_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_session() -> requests.Session:
+    """Get the shared keep-alive session for ProxyCurl requests."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=settings.PROXYCURL_MAX_CONCURRENCY
+            )
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _get_request_slots() -> threading.BoundedSemaphore:
+    """Get the semaphore capping concurrent blocking ProxyCurl requests."""
+    global _request_slots
+    with _session_lock:
+        if _request_slots is None:
+            _request_slots = threading.BoundedSemaphore(settings.PROXYCURL_MAX_CONCURRENCY)
+        return _request_slots
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        limits = httpx.Limits(
+            max_connections=settings.PROXYCURL_MAX_CONCURRENCY,
+            max_keepalive_connections=settings.PROXYCURL_MAX_CONCURRENCY,
+        )
+        client = httpx.AsyncClient(limits=limits)
+        _async_clients[loop] = client
+    return client
+
+
+def _get_async_request_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _async_request_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(settings.PROXYCURL_MAX_CONCURRENCY)
+        _async_request_slots[loop] = slots
+    return slots
 
 
 class ProxyCurlClient:
-    """Client for interacting with LinkedIn API via ProxyCurl."""
+    """Client for interacting with LinkedIn API via ProxyCurl.
+
+    Requests share a pooled keep-alive connection, are capped at
+    PROXYCURL_MAX_CONCURRENCY in flight per process, and retry 429/5xx and
+    transport errors with jittered exponential backoff (or the server's
+    `Retry-After`) until PROXYCURL_DEADLINE_SEC runs out.
+    """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None) -> None:
         self.api_key = api_key or settings.PROXYCURL_API_KEY
-        self.api_endpoint = "https://nubela.co/proxycurl/api/v2/linkedin"
+        self.api_endpoint = settings.PROXYCURL_API_ENDPOINT
+        self.timeout_sec = settings.PROXYCURL_TIMEOUT_SEC
+        self.deadline_sec = settings.PROXYCURL_DEADLINE_SEC
+        self.max_retries = settings.PROXYCURL_MAX_RETRIES
 
+    @timed("proxycurl")
     def get_profile(self, linkedin_profile_url: str, mock: bool = False) -> Dict:
         """Fetch LinkedIn profile data."""
         if mock:
             return self._get_mock_profile()
 
+        deadline = time.monotonic() + self.deadline_sec
         headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = requests.get(
-            self.api_endpoint,
-            params={"url": linkedin_profile_url},
-            headers=headers,
-            timeout=10,
+        request_slots = _get_request_slots()
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            if not request_slots.acquire(timeout=max(0.0, remaining)):
+                raise TimeoutError("Timed out waiting for a free ProxyCurl request slot")
+
+            response: Optional[Response] = None
+            error: Optional[Exception] = None
+            try:
+                response = get_http_session().get(
+                    self.api_endpoint,
+                    params={"url": linkedin_profile_url},
+                    headers=headers,
+                    timeout=max(0.1, min(self.timeout_sec, deadline - time.monotonic())),
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    return self._clean_response(response.json())
+                error = None
+            finally:
+                request_slots.release()
+                _count_response(response, error)
+
+            delay = self._retry_delay(attempt, response, deadline)
+            if delay is None:
+                _give_up(attempt, response, error)
+
+            logger.warning(
+                f"ProxyCurl request failed ({_describe(response, error)}), "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries})"
+            )
+            time.sleep(delay)
+
+    @timed("proxycurl")
+    async def aget_profile(self, linkedin_profile_url: str, mock: bool = False) -> Dict:
+        """Fetch LinkedIn profile data without blocking the event loop."""
+        if mock:
+            return await asyncio.to_thread(self._get_mock_profile)
+
+        deadline = time.monotonic() + self.deadline_sec
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        request_slots = _get_async_request_slots()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with asyncio.timeout(max(0.0, deadline - time.monotonic())):
+                    await request_slots.acquire()
+            except TimeoutError:
+                raise TimeoutError("Timed out waiting for a free ProxyCurl request slot")
+
+            response: Optional[Response] = None
+            error: Optional[Exception] = None
+            try:
+                response = await _get_async_client().get(
+                    self.api_endpoint,
+                    params={"url": linkedin_profile_url},
+                    headers=headers,
+                    timeout=max(0.1, min(self.timeout_sec, deadline - time.monotonic())),
+                )
+            except httpx.TransportError as e:
+                response, error = None, e
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    return self._clean_response(response.json())
+                error = None
+            finally:
+                request_slots.release()
+                _count_response(response, error)
+
+            delay = self._retry_delay(attempt, response, deadline)
+            if delay is None:
+                _give_up(attempt, response, error)
+
+            logger.warning(
+                f"ProxyCurl request failed ({_describe(response, error)}), "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    def _retry_delay(
+        self, attempt: int, response: Optional[Response], deadline: float
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None if retries or time are exhausted."""
+        if attempt > self.max_retries:
+            return None
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        delay = backoff_delay(
+            attempt,
+            base_sec=settings.PROXYCURL_BACKOFF_BASE_SEC,
+            max_sec=settings.PROXYCURL_BACKOFF_MAX_SEC,
+            retry_after=retry_after,
         )
-        response.raise_for_status()
-        return self._clean_response(response.json())
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
 
     def _get_mock_profile(self) -> Dict:
         """Get mock profile data for testing."""
         mock_url = "https://gist.githubusercontent.com/wingedRuslan/11dc8d754273d853c39a14cb2be86d85/raw/b5e61b0defad5ff07317ad37fa22b1247fdfc1c1/ruslan-yermak-linkedin.json"
-        response = requests.get(mock_url, timeout=10)
+        response = get_http_session().get(mock_url, timeout=10)
         response.raise_for_status()
         return self._clean_response(response.json())
 
@@ -68,3 +245,23 @@ class ProxyCurlClient:
                 ]
 
         return cleaned_data
+
+
+def _give_up(attempt: int, response: Optional[Response], error: Optional[Exception]) -> NoReturn:
+    """Raise the final failure once retries or the deadline are exhausted."""
+    if response is not None:
+        response.raise_for_status()
+    if error is not None:
+        raise error
+    raise TimeoutError(f"ProxyCurl request did not succeed within {attempt} attempts")
+
+
+def _count_response(response: Optional[Response], error: Optional[Exception]) -> None:
+    if response is None and error is None:
+        return
+    status = str(response.status_code) if response is not None else "transport_error"
+    UPSTREAM_RESPONSES.labels("proxycurl", status).inc()
+
+
+def _describe(response: Optional[Response], error: Optional[Exception]) -> str:
+    return f"HTTP {response.status_code}" if response is not None else str(error)
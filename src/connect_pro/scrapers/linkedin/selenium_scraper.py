@@ -1,153 +1,213 @@
 """LinkedIn profile scraper using Selenium."""
 
+import asyncio
+import itertools
 import logging
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
 
 from connect_pro.config.settings import settings
+from connect_pro.scrapers.linkedin.browser_pool import (
+    LinkedInLoginError,
+    get_browser_pool,
+)
+from connect_pro.scrapers.linkedin.cache import canonicalize_profile_url
 from connect_pro.scrapers.linkedin.extractors import (
     extract_basic_info,
-    extract_experiences,
     extract_education,
+    extract_experiences,
 )
+from connect_pro.scrapers.linkedin.html_extractors import extract_profile_from_html
+from connect_pro.utils.metrics import SELENIUM_STEP_DURATION, timed
+from connect_pro.utils.rate_limiter import RateLimitTimeout, TokenBucketRateLimiter
+from connect_pro.utils.timing import StepTimer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Experience or Education section, rendered after the profile heading
+_SECTIONS_XPATH = (
+    "//div[./div/div/span/span[text()='Experience' or text()='Education']]"
+)
+
+# Shared, bounded pool for running blocking scrapes off the event loop
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_scraper_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor used for async Selenium scrapes."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.SELENIUM_MAX_WORKERS,
+                thread_name_prefix="selenium-scraper",
+            )
+        return _executor
+
+
+def _save_snapshot(page_source: str, linkedin_profile_url: str) -> None:
+    """Save the profile HTML so it can be re-parsed offline."""
+    try:
+        slug = canonicalize_profile_url(linkedin_profile_url).rsplit("/", 1)[-1] or "profile"
+        snapshot_dir = Path(settings.SELENIUM_SNAPSHOT_DIR)
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        (snapshot_dir / f"{slug}.html").write_text(page_source, encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not save profile snapshot: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(
+    cooldown_period_sec: float, burst: int
+) -> Optional[TokenBucketRateLimiter]:
+    """Get the node-wide scrape rate limiter for a per-account budget.
+
+    Returns None (no limit) when the cooldown is not positive.
+    """
+    if cooldown_period_sec <= 0:
+        return None
+    return TokenBucketRateLimiter(
+        path=str(Path(settings.CACHE_DIR) / "rate_limits.sqlite3"),
+        rate=1 / cooldown_period_sec,
+        capacity=burst,
+    )
+
+
+class _LinkedInAccount:
+    """A LinkedIn account with its own browser pool and scrape budget."""
+
+    def __init__(self, username: str, password: str, cooldown_period_sec: float) -> None:
+        self.username = username
+        self.password = password
+        self.rate_limit_key = f"linkedin:{username}"
+        self.rate_limiter = get_rate_limiter(
+            cooldown_period_sec, settings.LINKEDIN_RATE_LIMIT_BURST
+        )
+        # Warm, logged-in browsers shared by all scrapers using this account
+        self.browser_pool = get_browser_pool(username, password)
+
 
 class SeleniumLinkedInScraper:
-    """LinkedIn scraper using Selenium."""
-    
-    def __init__(self, username=None, password=None, cooldown_period_sec=120):
-        """Initialize the scraper with LinkedIn credentials."""
+    """LinkedIn scraper using Selenium.
 
-        self.username = username or settings.LINKEDIN_USERNAME
-        self.password = password or settings.LINKEDIN_PASSWORD
+    Scrapes are spread across one or more LinkedIn accounts. Each account is
+    throttled by a token bucket shared by all processes on the node, and
+    serves pages from its own pool of warm browsers.
+    """
 
-        if not self.username or not self.password:
-            raise ValueError("LinkedIn username and password are required")
-        
-        self.driver = None          # holds browser instance
-        self.is_logged_in = False
-
-        # Cooldown tracking
-        self.cooldown_period_sec = cooldown_period_sec
-        self.last_scrape_time = None
-        self.cooldown_file = Path(".linkedin_cooldown")
-        self._load_last_scrape_time()
-
-    def _load_last_scrape_time(self) -> None:
-        """Load the last scrape time from file."""
-        if self.cooldown_file.exists():
-            try:
-                timestamp = self.cooldown_file.read_text().strip()
-                self.last_scrape_time = datetime.fromisoformat(timestamp)
-                logger.info(f"Last scrape time: {self.last_scrape_time}")
-            except Exception as e:
-                logger.error(f"Error loading last scrape time: {e}")
-                self.last_scrape_time = None
-
-    def _save_last_scrape_time(self) -> None:
-        """Save the current time as the last scrape time."""
-        try:
-            self.last_scrape_time = datetime.now()
-            self.cooldown_file.write_text(self.last_scrape_time.isoformat())
-            logger.info(f"Updated last scrape time: {self.last_scrape_time}")
-        except Exception as e:
-            logger.error(f"Error saving last scrape time: {e}")
-    
-    def _respect_cooldown(self) -> None:
-        """Wait for cooldown period between requests to avoid rate limiting."""
-        if self.last_scrape_time:
-            elapsed_seconds = (datetime.now() - self.last_scrape_time).total_seconds()
-            if elapsed_seconds < self.cooldown_period_sec:
-                wait_time = self.cooldown_period_sec - elapsed_seconds
-                logger.info(f"Waiting {wait_time:.1f} seconds for cooldown...")
-                time.sleep(wait_time)
-    
-    def _setup_driver(self) -> None:
-        """Create and configure a Chrome browser instance."""
-
-        options = Options()
-
-        # Run in headless mode (no visible browser window)
-        options.add_argument("--headless")
-        
-        # Additional settings to make browser stable and realistic
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        
-        # Set a realistic window size to make the browser behave like a desktop browser
-        options.add_argument("--window-size=1920,1080")
-        
-        # Use a realistic user agent (browser identification)
-        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")        
+    # Round-robin start position, so concurrent scrapes spread across accounts
+    _rotation = itertools.count()
 
-        # Use webdriver_manager to automatically download the correct driver
-        service = Service(ChromeDriverManager().install())
-        
-        # Create the browser instance
-        self.driver = webdriver.Chrome(service=service, options=options)
-        
-        # Set implicit wait time (seconds to wait when looking for elements)
-        self.driver.implicitly_wait(10)
-
-    def _close_driver(self) -> None:
-        """Close the browser properly."""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-            self.is_logged_in = False
-
-    def _login(self) -> bool:
-        """Log in to LinkedIn."""
-        if self.is_logged_in:
-            return True
-        
-        try:
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(5)
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        cooldown_period_sec: Optional[float] = None,
+        accounts: Optional[List[Dict]] = None,
+    ):
+        """Initialize the scraper with LinkedIn credentials.
 
-            # Enter email
-            email_field = self.driver.find_element(By.ID, "username")
-            email_field.send_keys(self.username)
-            
-            # Enter password
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(self.password)
-            
-            # Click sign in
-            signin_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            signin_button.click()
-            
-            # Wait for login to complete
-            time.sleep(5)
-
-            # Check if login was successful
-            if "feed" in self.driver.current_url or "checkpoint" in self.driver.current_url or "/in/" in self.driver.current_url:
-                logger.info(f"Successfully logged in as {self.username}")
-                self.is_logged_in = True
-                return True
+        Args:
+            username: LinkedIn username (defaults to settings)
+            password: LinkedIn password (defaults to settings)
+            cooldown_period_sec: Average seconds between scrapes per account (<= 0 = no limit)
+            accounts: Optional list of {"username", "password", "cooldown_period_sec"}
+                      dicts to spread scrapes across (defaults to LINKEDIN_ACCOUNTS)
+        """
+        self.cooldown_period_sec = (
+            cooldown_period_sec
+            if cooldown_period_sec is not None
+            else settings.LINKEDIN_COOLDOWN_PERIOD_SEC
+        )
+
+        if accounts is None:
+            if username or password or not settings.LINKEDIN_ACCOUNTS:
+                accounts = [{
+                    "username": username or settings.LINKEDIN_USERNAME,
+                    "password": password or settings.LINKEDIN_PASSWORD,
+                }]
             else:
-                logger.warning(f"Login failed for {self.username}")
-                return False
-        
-        except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to login to LinkedIn: {str(e)}")
-            return False
+                accounts = settings.LINKEDIN_ACCOUNTS
+
+        self.accounts = []
+        for account in accounts:
+            if not account.get("username") or not account.get("password"):
+                raise ValueError("LinkedIn username and password are required")
+            self.accounts.append(
+                _LinkedInAccount(
+                    username=account["username"],
+                    password=account["password"],
+                    cooldown_period_sec=account.get(
+                        "cooldown_period_sec", self.cooldown_period_sec
+                    ),
+                )
+            )
+
+        self.username = self.accounts[0].username
+        self.password = self.accounts[0].password
 
+    def _try_acquire_account(self) -> Tuple[Optional[_LinkedInAccount], float]:
+        """Take a scrape token from the first account with budget left.
+
+        Returns:
+            Tuple of (account or None, seconds until the soonest account has budget)
+        """
+        start = next(self._rotation) % len(self.accounts)
+        waits = []
+        for account in self.accounts[start:] + self.accounts[:start]:
+            if account.rate_limiter is None:
+                return account, 0.0
+            wait = account.rate_limiter.try_acquire(account.rate_limit_key)
+            if wait == 0:
+                return account, 0.0
+            waits.append(wait)
+        return None, min(waits)
+
+    def _acquire_account(self) -> _LinkedInAccount:
+        """Take an account with scrape budget without waiting for one.
+
+        Blocking callers must not hold their thread while the budget refills;
+        `aget_profile` waits for it on the event loop instead.
+
+        Raises:
+            RateLimitTimeout: If every account is over its budget (with `retry_after`)
+        """
+        account, wait = self._try_acquire_account()
+        if account is None:
+            raise RateLimitTimeout(
+                f"All LinkedIn accounts are over their scrape budget; retry in {wait:.1f}s",
+                retry_after=wait,
+            )
+        return account
+
+    async def _aacquire_account(self) -> _LinkedInAccount:
+        """Wait for an account with scrape budget without blocking the event loop."""
+        deadline = time.monotonic() + settings.LINKEDIN_RATE_LIMIT_MAX_WAIT_SEC
+        while True:
+            # The token buckets live in SQLite; check them off the event loop
+            account, wait = await asyncio.to_thread(self._try_acquire_account)
+            if account:
+                return account
+            if time.monotonic() + wait > deadline:
+                raise RateLimitTimeout(
+                    "All LinkedIn accounts are over their scrape budget", retry_after=wait
+                )
+            logger.info(f"Waiting {wait:.1f} seconds for LinkedIn scrape budget...")
+            await asyncio.sleep(wait)
+
+    @timed("selenium")
     def get_profile(self, linkedin_profile_url: str, mock: bool = False) -> Dict:
         """Fetch LinkedIn profile data.
         
@@ -157,50 +217,135 @@ class SeleniumLinkedInScraper:
             
         Returns:
             Dict containing profile data
+
+        Raises:
+            RateLimitTimeout: If no account has scrape budget right now
         """
         if mock:
             return {"Full Name": "Test Test", "Status": "Success"}
 
-        # Respect the cooldown period
-        self._respect_cooldown()
+        account = self._acquire_account()
+        return self._scrape(linkedin_profile_url, account)
 
+    def _scrape(self, linkedin_profile_url: str, account: _LinkedInAccount) -> Dict:
+        """Scrape a profile with a pooled browser of the given account."""
+        timer = StepTimer()
         try:
-            # Set up the browser
-            if not self.driver:
-                self._setup_driver()
-
-            # Attempt login
-            if not self._login():
-                logger.error("Failed to log in to LinkedIn")
-                self._close_driver()
-                return {}
-            
-             # Navigate to the profile
-            self.driver.get(linkedin_profile_url)
-            time.sleep(5)
-            
-            # Wait for the profile to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//h1"))
-            )
+            # Borrow a warm, logged-in browser from the pool
+            acquire_started_at = time.perf_counter()
+            with account.browser_pool.session() as driver:
+                timer.record("acquire_browser", time.perf_counter() - acquire_started_at)
+
+                # Navigate to the profile
+                with timer.step("navigate"):
+                    driver.get(linkedin_profile_url)
 
-            # Extract Profile data
-            profile_data = extract_basic_info(self.driver)
-            profile_data["experiences"] = extract_experiences(self.driver)
-            profile_data["education"] = extract_education(self.driver)
+                # Wait for the profile to load
+                with timer.step("wait_for_profile"):
+                    WebDriverWait(driver, settings.SELENIUM_PAGE_LOAD_TIMEOUT_SEC).until(
+                        EC.presence_of_element_located((By.XPATH, "//h1"))
+                    )
 
-            # Update last scrape time
-            self._save_last_scrape_time()
+                # Extract Profile data
+                if settings.SELENIUM_EXTRACTION_MODE.lower() == "html":
+                    profile_data = self._extract_from_page_source(
+                        driver, linkedin_profile_url, timer
+                    )
+                else:
+                    profile_data = self._extract_with_webdriver(driver, timer)
+
+            logger.info(f"Scraped {linkedin_profile_url} as {account.username} ({timer.summary()})")
+            for step, duration in timer.steps.items():
+                SELENIUM_STEP_DURATION.labels(step).observe(duration)
 
             return profile_data
 
+        except LinkedInLoginError as e:
+            logger.error(f"Failed to log in to LinkedIn: {e}")
+            return {}
+
         except Exception as e:
             raise ValueError(f"Failed to scrape LinkedIn profile: {str(e)}")
+
+    @staticmethod
+    def _extract_with_webdriver(driver: webdriver.Chrome, timer: StepTimer) -> Dict:
+        """Extract profile data with one WebDriver lookup per field."""
+        field_timeout = settings.SELENIUM_FIELD_TIMEOUT_SEC
+        with timer.step("extract_basic_info"):
+            profile_data = extract_basic_info(driver, timeout=field_timeout)
+        with timer.step("extract_experiences"):
+            profile_data["experiences"] = extract_experiences(driver, timeout=field_timeout)
+        with timer.step("extract_education"):
+            profile_data["education"] = extract_education(driver, timeout=field_timeout)
+        return profile_data
+
+    @staticmethod
+    def _extract_from_page_source(
+        driver: webdriver.Chrome, linkedin_profile_url: str, timer: StepTimer
+    ) -> Dict:
+        """Extract profile data from a single `page_source` snapshot parsed with lxml."""
+        # Give the lazily rendered sections a chance to appear before the snapshot
+        with timer.step("wait_for_sections"):
+            try:
+                WebDriverWait(driver, settings.SELENIUM_FIELD_TIMEOUT_SEC).until(
+                    EC.presence_of_element_located((By.XPATH, _SECTIONS_XPATH))
+                )
+            except TimeoutException:
+                logger.warning("Profile sections did not render in time")
+
+        with timer.step("page_source"):
+            page_source = driver.page_source
+
+        if settings.SELENIUM_SNAPSHOT_DIR:
+            _save_snapshot(page_source, linkedin_profile_url)
+
+        with timer.step("parse_html"):
+            return extract_profile_from_html(page_source)
+
+    @timed("selenium")
+    async def aget_profile(self, linkedin_profile_url: str, mock: bool = False) -> Dict:
+        """Fetch LinkedIn profile data on the bounded scraper executor.
+        
+        Waiting for scrape budget happens on the event loop, so it never holds
+        an executor thread.
+        
+        Args:
+            linkedin_profile_url: URL of the LinkedIn profile to scrape
+            mock: If True, return mock data instead of scraping
             
-        finally:
-            self._close_driver()
+        Returns:
+            Dict containing profile data
+        """
+        if mock:
+            return self.get_profile(linkedin_profile_url, mock=True)
+
+        account = await self._aacquire_account()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_scraper_executor(),
+            partial(self._scrape, linkedin_profile_url, account),
+        )
+
+    async def aget_profiles(
+        self, linkedin_profile_urls: List[str]
+    ) -> List[Union[Dict, Exception]]:
+        """Scrape several profiles concurrently across accounts and pooled browsers.
 
-    def __del__(self) -> None:
-        """Ensure the driver is closed."""
-        self._close_driver()
+        Concurrency is bounded by the scraper executor (SELENIUM_MAX_WORKERS),
+        the browser pools (SELENIUM_POOL_SIZE per account) and each account's
+        rate limit.
+
+        Args:
+            linkedin_profile_urls: URLs of the LinkedIn profiles to scrape
+
+        Returns:
+            Profile data or the raised exception for each URL, in input order
+        """
+        return await asyncio.gather(
+            *(self.aget_profile(url) for url in linkedin_profile_urls),
+            return_exceptions=True,
+        )
 
+    def get_profiles(self, linkedin_profile_urls: List[str]) -> List[Union[Dict, Exception]]:
+        """Blocking variant of `aget_profiles`."""
+        return asyncio.run(self.aget_profiles(linkedin_profile_urls))
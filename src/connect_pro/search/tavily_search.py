@@ -1,39 +1,165 @@
+import asyncio
+import logging
+import threading
+import weakref
 from typing import Dict, List, Optional
-from tavily import TavilyClient
+
+from tavily import AsyncTavilyClient, TavilyClient
+
+from connect_pro.cache.memory_cache import TTLCache
 from connect_pro.config.settings import settings
+from connect_pro.utils.metrics import record_cache_lookup, timed
+from connect_pro.utils.singleflight import AsyncSingleFlight, SingleFlight
+from connect_pro.utils.text import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# Filtered results keyed by normalized query
+_search_cache: Optional[TTLCache] = None
+_search_cache_lock = threading.Lock()
+
+# Concurrent identical queries share one upstream request
+_search_flight = SingleFlight()
+_async_search_flight = AsyncSingleFlight()
+
+_client = None
+_client_lock = threading.Lock()
+# The async client holds an httpx pool bound to the event loop it was used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTavilyClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_search_cache() -> TTLCache:
+    """Get the shared search result cache."""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = TTLCache(
+                ttl_sec=settings.TAVILY_CACHE_TTL_SEC,
+                max_entries=settings.TAVILY_CACHE_MAX_ENTRIES,
+            )
+        return _search_cache
+
+
+def _client_kwargs() -> Dict:
+    # `api_base_url` is only accepted by tavily-python >= 0.7.10; pass it only when overridden
+    kwargs = {"api_key": settings.TAVILY_API_KEY}
+    if settings.TAVILY_API_BASE_URL:
+        kwargs["api_base_url"] = settings.TAVILY_API_BASE_URL
+    return kwargs
+
+
+def _get_client() -> TavilyClient:
+    """Get the shared Tavily client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = TavilyClient(**_client_kwargs())
+        return _client
+
+
+def _get_async_client() -> AsyncTavilyClient:
+    """Get the shared async Tavily client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncTavilyClient(**_client_kwargs())
+        _async_clients[loop] = client
+    return client
 
 
 def get_profile_data_search_tavily(search_query: str) -> Optional[List[Dict]]:
     """
     Search for a LinkedIn profile URL using Tavily's search API.
-    
+
     Args:
         search_query: search query incl. name of the person to search for
-    
+
     Returns:
         Optional[List[Dict]]: LinkedIn profile URLs if found, None otherwise
     """
-    client = TavilyClient(api_key=settings.TAVILY_API_KEY)
-    
+    cache_key = normalize_query(search_query)
+    cached = _get_search_cache().get(cache_key)
+    record_cache_lookup("tavily", cached is not None)
+    if cached is not None:
+        return _copy_results(cached)
+
     try:
-        search_query = f"{search_query} linkedin profile"
-        raw_results = client.search(
-            query=search_query,
-            search_depth="basic",
-            max_results=5
-        )
-
-        # Filter and keep only LinkedIn profile URLs with their titles
-        search_results = [
-            {
-                "url": result.get("url", "").strip(),
-                "title": result.get("title", "").strip()
-            }
-            for result in raw_results.get("results", [])
-            if "linkedin.com/in/" in result.get("url", "")
-        ]
-        return search_results
-    
+        # Followers of a coalesced search get the same list, so each caller gets a copy
+        return _copy_results(_search_flight.do(cache_key, _search, cache_key))
+
     except Exception as e:
-        print(f"Error searching Tavily: {e}")
+        logger.warning(f"Error searching Tavily: {e}")
         return None
+
+
+async def aget_profile_data_search_tavily(search_query: str) -> Optional[List[Dict]]:
+    """
+    Async variant of `get_profile_data_search_tavily`.
+
+    Args:
+        search_query: search query incl. name of the person to search for
+
+    Returns:
+        Optional[List[Dict]]: LinkedIn profile URLs if found, None otherwise
+    """
+    cache_key = normalize_query(search_query)
+    cached = _get_search_cache().get(cache_key)
+    record_cache_lookup("tavily", cached is not None)
+    if cached is not None:
+        return _copy_results(cached)
+
+    try:
+        # Followers of a coalesced search get the same list, so each caller gets a copy
+        return _copy_results(await _async_search_flight.do(cache_key, _asearch, cache_key))
+
+    except Exception as e:
+        logger.warning(f"Error searching Tavily: {e}")
+        return None
+
+
+@timed("tavily")
+def _search(normalized_query: str) -> List[Dict]:
+    """Run the upstream search and cache the filtered results."""
+    raw_results = _get_client().search(
+        query=f"{normalized_query} linkedin profile",
+        search_depth="basic",
+        max_results=5
+    )
+    search_results = _filter_linkedin_results(raw_results)
+    # Empty results may be a transient upstream hiccup; only cache real hits
+    if search_results:
+        _get_search_cache().set(normalized_query, search_results)
+    return search_results
+
+
+@timed("tavily")
+async def _asearch(normalized_query: str) -> List[Dict]:
+    """Async variant of `_search`."""
+    raw_results = await _get_async_client().search(
+        query=f"{normalized_query} linkedin profile",
+        search_depth="basic",
+        max_results=5
+    )
+    search_results = _filter_linkedin_results(raw_results)
+    if search_results:
+        _get_search_cache().set(normalized_query, search_results)
+    return search_results
+
+
+def _copy_results(search_results: List[Dict]) -> List[Dict]:
+    """Copy cached results so callers can not modify the cached entries."""
+    return [dict(result) for result in search_results]
+
+
+def _filter_linkedin_results(raw_results: Dict) -> List[Dict]:
+    """Filter and keep only LinkedIn profile URLs with their titles."""
+    return [
+        {
+            "url": result.get("url", "").strip(),
+            "title": result.get("title", "").strip()
+        }
+        for result in raw_results.get("results", [])
+        if "linkedin.com/in/" in result.get("url", "")
+    ]
@@ -0,0 +1,181 @@
+"""Progressive analysis results as a stream of events (served as Server-Sent Events)."""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Tuple, Union
+
+from langchain_core.exceptions import OutputParserException
+
+from connect_pro.config.settings import settings
+from connect_pro.main import (
+    afetch_profile,
+    afind_profile_url,
+    astream_combined_analysis,
+    astream_common_ground_from_profile,
+    astream_insights_from_profile,
+    get_linkedin_client,
+    prepare_profile_information,
+)
+from connect_pro.scrapers.linkedin.cache import CachedLinkedInClient
+from connect_pro.utils.metrics import record_cache_lookup
+from connect_pro.utils.retry import is_retryable_error
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[str, Dict[str, Any]]
+
+_STREAM_END = object()
+
+
+async def _afetch_profile_with_cache_status(profile_url: str) -> Tuple[Dict, bool]:
+    """Fetch a profile and report whether it came from the profile cache."""
+    linkedin_client = get_linkedin_client()
+    if isinstance(linkedin_client, CachedLinkedInClient):
+        cached = await asyncio.to_thread(linkedin_client.get_cached_profile, profile_url)
+        if cached is not None:
+            # Misses are counted by the cached client itself
+            record_cache_lookup("profile", True)
+            return cached, True
+    return await afetch_profile(profile_url), False
+
+
+async def astream_analysis(
+    search_query: str, user_information: str = ""
+) -> AsyncIterator[Event]:
+    """
+    Run the analysis pipeline and yield events as results become available.
+
+    Events, in order of appearance:
+        stage: {"stage": "resolving_url" | "url_resolved" | "profile_fetched" | "generating", ...}
+        not_found: no profile matched the query (last event)
+        insights_partial: {"insights": {...}} while the insights are generated
+        insights: {"insights": {...}} once complete
+        common_ground_delta: {"text": "..."} while common ground is generated
+        common_ground: {"text": "..."} once complete
+        done: the full result, same shape as the /api/analyze response (last event)
+        error: {"error": "invalid_output" | "upstream_unavailable" | "internal", "detail": "..."}
+            if the pipeline failed (last event)
+
+    With `LLM_COMBINED_ANALYSIS` and user information, insights and common
+    ground come from one streamed call; the events are the same.
+
+    Args:
+        search_query: Search terms to find the person (name, company, position, etc.)
+        user_information: Optional information about the user for common ground
+
+    Yields:
+        (event name, data) tuples
+    """
+    try:
+        yield "stage", {"stage": "resolving_url"}
+        profile_url = await afind_profile_url(search_query)
+        if not profile_url:
+            yield "not_found", {"detail": "Profile not found"}
+            return
+        yield "stage", {"stage": "url_resolved", "profile_url": profile_url}
+
+        profile_data, cache_hit = await _afetch_profile_with_cache_status(profile_url)
+        yield "stage", {"stage": "profile_fetched", "cache": "hit" if cache_hit else "miss"}
+
+        profile_information = prepare_profile_information(profile_data)
+        yield "stage", {"stage": "generating"}
+
+        result = {"profile_url": profile_url}
+        async for event in _amerge_llm_streams(profile_information, user_information):
+            name, data = event
+            if name == "insights":
+                result["insights"] = data["insights"]
+            elif name == "common_ground":
+                result["common_ground"] = data["text"]
+            yield event
+
+        yield "done", result
+
+    except Exception as e:
+        logger.warning(f"Streaming analysis failed: {e}")
+        yield "error", _error_data(e)
+
+
+def _error_data(error: Exception) -> Dict[str, Any]:
+    """Data of the `error` event: a machine-readable kind and a human-readable detail."""
+    if isinstance(error, OutputParserException):
+        kind = "invalid_output"
+    elif is_retryable_error(error):
+        kind = "upstream_unavailable"
+    else:
+        kind = "internal"
+    return {"error": kind, "detail": str(error)}
+
+
+def _insights_part(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in analysis.items() if key != "common_ground"}
+
+
+async def _amerge_llm_streams(
+    profile_information: Union[str, Dict], user_information: str
+) -> AsyncIterator[Event]:
+    """Run the insights and common ground streams concurrently and interleave their events."""
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def _insights() -> None:
+        insights = {}
+        async for insights in astream_insights_from_profile(profile_information):
+            await events.put(("insights_partial", {"insights": insights}))
+        await events.put(("insights", {"insights": insights}))
+
+    async def _common_ground() -> None:
+        chunks = []
+        async for chunk in astream_common_ground_from_profile(
+            profile_information, user_information
+        ):
+            chunks.append(chunk)
+            await events.put(("common_ground_delta", {"text": chunk}))
+        await events.put(("common_ground", {"text": "".join(chunks)}))
+
+    async def _combined() -> None:
+        analysis: Dict[str, Any] = {}
+        streamed = ""
+        async for analysis in astream_combined_analysis(profile_information, user_information):
+            await events.put(("insights_partial", {"insights": _insights_part(analysis)}))
+            # Partial strings only grow, so the new text is the delta
+            text = analysis.get("common_ground") or ""
+            if len(text) > len(streamed) and text.startswith(streamed):
+                await events.put(("common_ground_delta", {"text": text[len(streamed):]}))
+                streamed = text
+        await events.put(("insights", {"insights": _insights_part(analysis)}))
+        await events.put(("common_ground", {"text": analysis["common_ground"]}))
+
+    async def _run(producer: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await producer()
+        except Exception as e:
+            await events.put(e)
+        finally:
+            await events.put(_STREAM_END)
+
+    if not user_information:
+        producers = [_insights]
+    elif settings.LLM_COMBINED_ANALYSIS:
+        producers = [_combined]
+    else:
+        producers = [_insights, _common_ground]
+    tasks = [asyncio.create_task(_run(producer)) for producer in producers]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await events.get()
+            if item is _STREAM_END:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Serialize one event in the Server-Sent Events wire format."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -0,0 +1,195 @@
+"""Prometheus metrics and per-request stage timings for the Server-Timing header."""
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+from prometheus_client import Counter, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+STAGE_DURATION = Histogram(
+    "connect_pro_stage_duration_seconds",
+    "Duration of pipeline stages and upstream calls",
+    ["stage"],
+    buckets=_LATENCY_BUCKETS,
+)
+STAGE_ERRORS = Counter(
+    "connect_pro_stage_errors_total",
+    "Pipeline stages and upstream calls that raised",
+    ["stage"],
+)
+CACHE_LOOKUPS = Counter(
+    "connect_pro_cache_lookups_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+LLM_TOKENS = Counter(
+    "connect_pro_llm_tokens_total",
+    "LLM tokens used, by model and type (prompt/completion)",
+    ["model", "type"],
+)
+UPSTREAM_RESPONSES = Counter(
+    "connect_pro_upstream_responses_total",
+    "Upstream HTTP responses by service and status code",
+    ["service", "status"],
+)
+SELENIUM_STEP_DURATION = Histogram(
+    "connect_pro_selenium_step_duration_seconds",
+    "Duration of the steps of a Selenium profile scrape",
+    ["step"],
+    buckets=_LATENCY_BUCKETS,
+)
+STRUCTURED_OUTPUTS = Counter(
+    "connect_pro_llm_structured_outputs_total",
+    "Structured LLM outputs by schema and result (parsed/repaired/failed)",
+    ["schema", "result"],
+)
+LLM_ROUTE_CALLS = Counter(
+    "connect_pro_llm_route_calls_total",
+    "LLM calls by route, model and result (ok/error)",
+    ["route", "model", "result"],
+)
+LLM_ROUTE_DURATION = Histogram(
+    "connect_pro_llm_route_duration_seconds",
+    "Duration of LLM calls by route and model",
+    ["route", "model"],
+    buckets=_LATENCY_BUCKETS,
+)
+LLM_ROUTE_TOKENS = Counter(
+    "connect_pro_llm_route_tokens_total",
+    "LLM tokens used by route, model and type (prompt/completion)",
+    ["route", "model", "type"],
+)
+LLM_ROUTE_FALLBACKS = Counter(
+    "connect_pro_llm_route_fallbacks_total",
+    "LLM calls sent to a route's fallback model, by reason (degraded/error)",
+    ["route", "reason"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "connect_pro_http_request_duration_seconds",
+    "Duration of API requests until the response headers are sent",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+# Stage durations of the request being served (None outside of a request)
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def observe_stage(stage: str, duration: float) -> None:
+    """Record a stage duration in its histogram and in the current request's timings."""
+    STAGE_DURATION.labels(stage).observe(duration)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + duration
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed block as a stage and count it as failed if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.labels(stage).inc()
+        raise
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def timed(stage: str) -> Callable:
+    """Decorator form of `track_stage` for functions, coroutines and async generators."""
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def async_gen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                with track_stage(stage):
+                    async for item in fn(*args, **kwargs):
+                        yield item
+
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with track_stage(stage):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with track_stage(stage):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss."""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_structured_output(schema: str, result: str) -> None:
+    """Count a structured LLM output that parsed, needed local repair, or failed."""
+    STRUCTURED_OUTPUTS.labels(schema, result).inc()
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+    """Render durations (seconds) as a Server-Timing header value in milliseconds."""
+    return ", ".join(f"{name};dur={duration * 1000:.1f}" for name, duration in timings.items())
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding a per-request `Server-Timing` header and request metrics.
+
+    Stages timed while a request is served (see `track_stage`) show up as
+    separate entries, plus the request's `total`. For streaming responses the
+    header is sent before the body, so only stages finished by then appear.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                header = format_server_timing(
+                    {**timings, "total": time.perf_counter() - start}
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1")),
+                    (b"timing-allow-origin", b"*"),
+                ]
+                route = scope.get("route")
+                HTTP_REQUEST_DURATION.labels(
+                    scope["method"],
+                    getattr(route, "path", "unmatched"),
+                    str(message["status"]),
+                ).observe(time.perf_counter() - start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
@@ -0,0 +1,130 @@
+"""Token-bucket rate limiter shared across processes through a local SQLite store."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a token could not be acquired within the allowed wait."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds until a token will be available, if known
+        self.retry_after = retry_after
+
+
+class TokenBucketRateLimiter:
+    """Token bucket whose state lives in SQLite, so all workers on a node share it.
+
+    Each key (e.g. a LinkedIn account) has its own bucket that refills at `rate`
+    tokens per second up to `capacity`. Updates run in `BEGIN IMMEDIATE`
+    transactions, which serializes concurrent processes on the database lock.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float = 1):
+        """Initialize the limiter.
+
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            rate: Tokens added per second
+            capacity: Max tokens a bucket can hold (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.path = Path(path)
+        self.rate = rate
+        self.capacity = capacity
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    def try_acquire(self, key: str, tokens: float = 1) -> float:
+        """Take tokens from a bucket if available.
+
+        Args:
+            key: Bucket identity
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they will be available
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    available = self.capacity
+                else:
+                    stored_tokens, updated_at = row
+                    refill = max(0.0, now - updated_at) * self.rate
+                    available = min(self.capacity, stored_tokens + refill)
+
+                if available >= tokens:
+                    remaining, wait = available - tokens, 0.0
+                else:
+                    remaining, wait = available, (tokens - available) / self.rate
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (key, tokens, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, remaining, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def acquire(self, key: str, tokens: float = 1, timeout: Optional[float] = None) -> None:
+        """Block until tokens are taken from the bucket.
+
+        Raises:
+            RateLimitTimeout: If the tokens are not available within `timeout` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(key, tokens)
+            if wait == 0:
+                return
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout(
+                    f"Rate limit for {key} not available within {timeout}s", retry_after=wait
+                )
+            time.sleep(wait)
+
+    async def aacquire(
+        self, key: str, tokens: float = 1, timeout: Optional[float] = None
+    ) -> None:
+        """Async variant of `acquire` that waits without blocking the event loop."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # The buckets live in SQLite; check them off the event loop
+            wait = await asyncio.to_thread(self.try_acquire, key, tokens)
+            if wait == 0:
+                return
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout(
+                    f"Rate limit for {key} not available within {timeout}s", retry_after=wait
+                )
+            await asyncio.sleep(wait)
@@ -0,0 +1,84 @@
+"""Helpers for retrying upstream HTTP calls."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+import requests
+
+# Statuses worth retrying: rate limiting and transient upstream failures
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Timeouts and connection failures (builtin, httpx and requests)
+_TRANSIENT_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TransportError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    base_sec: float,
+    max_sec: float,
+    retry_after: Optional[str] = None,
+) -> float:
+    """Seconds to wait before the next attempt.
+
+    Honors the server's `Retry-After` when present, otherwise uses exponential
+    backoff with full jitter.
+
+    Args:
+        attempt: Number of the attempt that just failed (starting at 1)
+        base_sec: Backoff for the first retry
+        max_sec: Upper bound for the exponential backoff
+        retry_after: Raw `Retry-After` header value, if any
+    """
+    server_delay = parse_retry_after(retry_after)
+    if server_delay is not None:
+        return server_delay
+
+    return random.uniform(0, min(max_sec, base_sec * 2 ** (attempt - 1)))
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether an error (or one it was raised from) is transient.
+
+    Timeouts, connection failures and responses with a retryable status
+    (read from `status_code` or `response.status_code`) count as transient.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, _TRANSIENT_ERRORS):
+            return True
+        status = getattr(current, "status_code", None)
+        if status is None:
+            status = getattr(getattr(current, "response", None), "status_code", None)
+        if status in RETRYABLE_STATUS_CODES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
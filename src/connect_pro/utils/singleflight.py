@@ -0,0 +1,84 @@
+"""Coalesce concurrent identical calls into a single in-flight execution."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Thread-based single-flight: concurrent callers with the same key share one call."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run `fn` unless a call with the same key is in flight, then share its result.
+
+        Args:
+            key: Identity of the call
+            fn: Function to execute
+
+        Returns:
+            Result of the (possibly shared) call; exceptions propagate to all callers
+        """
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                future: Future = Future()
+                self._calls[key] = future
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            result = fn(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Asyncio single-flight: concurrent awaiters with the same key share one task."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, key: Hashable, coro_fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Await `coro_fn` unless a call with the same key is in flight, then share it.
+
+        A cancelled caller does not cancel the shared task for the other callers.
+
+        Args:
+            key: Identity of the call
+            coro_fn: Coroutine function to execute
+
+        Returns:
+            Result of the (possibly shared) call; exceptions propagate to all callers
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_fn(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,9 @@
+"""Text normalization helpers."""
+
+import unicodedata
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a free-text search query for use as a cache or coalescing key."""
+    normalized = unicodedata.normalize("NFKC", query).casefold()
+    return " ".join(normalized.split())
@@ -0,0 +1,36 @@
+"""Lightweight wall-clock timing of named pipeline steps."""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StepTimer:
+    """Collects wall-clock durations of named steps."""
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, float] = {}
+        self._started_at = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and add it to the named step."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, duration: float) -> None:
+        """Add an externally measured duration to the named step."""
+        self.steps[name] = self.steps.get(name, 0.0) + duration
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def summary(self) -> str:
+        """Render the breakdown, e.g. 'navigate=1.20s, extract_basic_info=0.31s, total=1.60s'."""
+        parts = [f"{name}={duration:.2f}s" for name, duration in self.steps.items()]
+        parts.append(f"total={self.total:.2f}s")
+        return ", ".join(parts)
@@ -0,0 +1,83 @@
+"""Optional startup warm-up, so the first request does not pay for lazy initialization."""
+
+import asyncio
+import logging
+import time
+
+from connect_pro.config.settings import settings
+from connect_pro.llm.insights_store import get_insights_store
+from connect_pro.llm.registry import (
+    get_combined_analysis_chain,
+    get_combined_analysis_stream_chain,
+    get_common_ground_chain,
+    get_insights_chain,
+    get_insights_stream_chain,
+    get_profile_agent,
+)
+from connect_pro.llm.response_cache import get_llm_response_cache
+from connect_pro.llm.routing import get_model_router
+from connect_pro.llm.tokens import count_tokens
+from connect_pro.main import (
+    COMBINED_ANALYSIS_TEMPERATURE,
+    COMMON_GROUND_TEMPERATURE,
+    INSIGHTS_TEMPERATURE,
+    get_linkedin_client,
+)
+from connect_pro.schemas.profile_insights import profile_parser
+from connect_pro.scrapers.linkedin import proxycurl
+from connect_pro.search import tavily_search
+
+logger = logging.getLogger(__name__)
+
+
+def _build_llm_objects() -> None:
+    """Build the shared chains and agent of the calling thread's scope (see the registry)."""
+    # Chains for every model the router can pick (just OPENAI_MODEL_NAME without routes)
+    for model_name in get_model_router().model_names():
+        get_insights_chain(temperature=INSIGHTS_TEMPERATURE, model_name=model_name)
+        get_insights_stream_chain(temperature=INSIGHTS_TEMPERATURE, model_name=model_name)
+        get_common_ground_chain(temperature=COMMON_GROUND_TEMPERATURE, model_name=model_name)
+        if settings.LLM_COMBINED_ANALYSIS:
+            get_combined_analysis_chain(
+                temperature=COMBINED_ANALYSIS_TEMPERATURE, model_name=model_name
+            )
+            get_combined_analysis_stream_chain(
+                temperature=COMBINED_ANALYSIS_TEMPERATURE, model_name=model_name
+            )
+    get_profile_agent()
+
+
+def warm_up() -> None:
+    """Import the lazily loaded dependencies and build the shared clients (blocking)."""
+    # LLM clients, chains and the agent stack (langchain_openai, openai, LangChain agents)
+    _build_llm_objects()
+
+    # LinkedIn client (imports Selenium if configured), search client and HTTP pools
+    get_linkedin_client()
+    proxycurl.get_http_session()
+    tavily_search._get_client()
+
+    # Parser format instructions, tokenizer and local caches
+    profile_parser.get_format_instructions()
+    count_tokens("warm-up", settings.OPENAI_MODEL_NAME)
+    get_llm_response_cache()
+    get_insights_store()
+
+
+async def awarm_up() -> None:
+    """Warm up without blocking the event loop, including the loop-bound async clients.
+
+    Failures are logged and never prevent startup: anything not warmed up is
+    initialized on first use as usual.
+    """
+    started_at = time.perf_counter()
+    try:
+        await asyncio.to_thread(warm_up)
+        # httpx async pools (and the objects using them) are bound to the serving event loop
+        _build_llm_objects()
+        proxycurl._get_async_client()
+        tavily_search._get_async_client()
+    except Exception as e:
+        logger.warning(f"Startup warm-up failed: {e}")
+        return
+    logger.info(f"Startup warm-up finished in {time.perf_counter() - started_at:.2f}s")
@@ -0,0 +1,22 @@
+import pytest
+
+from connect_pro.config.settings import get_settings
+
+_REQUIRED_SETTINGS = (
+    "OPENAI_API_KEY",
+    "PROXYCURL_API_KEY",
+    "TAVILY_API_KEY",
+    "LINKEDIN_USERNAME",
+    "LINKEDIN_PASSWORD",
+)
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch, tmp_path):
+    """Required settings for every test, with local caches in a temporary directory."""
+    for name in _REQUIRED_SETTINGS:
+        monkeypatch.setenv(name, "test")
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,56 @@
+import pytest
+from pydantic import ValidationError
+
+from connect_pro.api.schemas import BatchQuery, JobRequest
+from connect_pro.config.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _no_webhook_allow_list(monkeypatch):
+    monkeypatch.delenv("JOB_WEBHOOK_ALLOWED_HOSTS", raising=False)
+    get_settings.cache_clear()
+
+
+def test_public_webhook_url_is_accepted():
+    job_request = JobRequest(query="Jane Doe", webhook_url="https://hooks.example.com/done")
+    assert str(job_request.webhook_url) == "https://hooks.example.com/done"
+
+
+@pytest.mark.parametrize(
+    "webhook_url",
+    [
+        "ftp://example.com/done",
+        "file:///etc/passwd",
+        "http://localhost:8000/done",
+        "http://127.0.0.1/done",
+        "http://2130706433/done",
+        "http://[::1]/done",
+        "http://10.0.0.5/done",
+        "http://169.254.169.254/latest/meta-data",
+    ],
+)
+def test_local_or_non_http_webhook_url_is_rejected(webhook_url):
+    with pytest.raises(ValidationError):
+        JobRequest(query="Jane Doe", webhook_url=webhook_url)
+
+
+def test_webhook_allow_list(monkeypatch):
+    monkeypatch.setenv("JOB_WEBHOOK_ALLOWED_HOSTS", '["hooks.example.com"]')
+    get_settings.cache_clear()
+
+    JobRequest(query="Jane Doe", webhook_url="https://hooks.example.com/done")
+    JobRequest(query="Jane Doe", webhook_url="https://eu.hooks.example.com/done")
+    for webhook_url in ("https://example.org/done", "https://evilhooks.example.com/done"):
+        with pytest.raises(ValidationError):
+            JobRequest(query="Jane Doe", webhook_url=webhook_url)
+
+
+def test_batch_queries_are_stripped():
+    batch_query = BatchQuery(queries=["  Jane Doe Acme ", "John Smith\n"])
+    assert batch_query.queries == ["Jane Doe Acme", "John Smith"]
+
+
+@pytest.mark.parametrize("query", ["", "   ", "\t\n"])
+def test_blank_batch_query_is_rejected(query):
+    with pytest.raises(ValidationError, match="index 1"):
+        BatchQuery(queries=["Jane Doe", query])
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+
+import pytest
+
+from connect_pro import batch
+from connect_pro.batch import StageLimits, aanalyze_batch
+from connect_pro.cli import read_queries
+from connect_pro.schemas.profile_insights import ProfileInsights
+
+
+def test_reads_queries_from_jsonl(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    path.write_text('"Jane Doe Acme"\n\n{"query": " John Smith "}\n', encoding="utf-8")
+
+    assert read_queries(str(path)) == ["Jane Doe Acme", "John Smith"]
+
+
+def test_skips_malformed_jsonl_lines_with_their_line_number(tmp_path, caplog):
+    path = tmp_path / "queries.jsonl"
+    path.write_text(
+        "\n".join([
+            '"Jane Doe Acme"',
+            "42",
+            '["John Smith"]',
+            '{"query": 7}',
+            '{"name": "Ann Lee"}',
+            "not json",
+            '{"query": "Dan Kim Meta"}',
+        ]),
+        encoding="utf-8",
+    )
+
+    with caplog.at_level(logging.WARNING, logger="connect_pro.cli"):
+        queries = read_queries(str(path))
+
+    assert queries == ["Jane Doe Acme", "Dan Kim Meta"]
+    assert [record.getMessage().split(":")[0] for record in caplog.records] == [
+        f"Skipping line {line_number}" for line_number in (2, 3, 4, 5, 6)
+    ]
+
+
+def test_reads_queries_from_csv(tmp_path):
+    path = tmp_path / "queries.csv"
+    path.write_text("name,query\nJane,Jane Doe Acme\nBlank, \nJohn,John Smith\n", encoding="utf-8")
+
+    assert read_queries(str(path)) == ["Jane Doe Acme", "John Smith"]
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Replace the pipeline stages with fakes recording the analysis calls."""
+    calls = []
+
+    async def find_profile_url(search_query):
+        return None if search_query == "nobody" else f"https://www.linkedin.com/in/{search_query}"
+
+    async def fetch_profile(profile_url):
+        if profile_url.endswith("broken"):
+            raise ValueError("scrape failed")
+        return {"full_name": profile_url.rsplit("/", 1)[-1]}
+
+    async def generate_analysis(profile_information, user_information=""):
+        calls.append((profile_information, user_information))
+        insights = ProfileInsights(
+            professional_summary="Summary",
+            personal_background="Background",
+            interesting_facts=["Fact"],
+        )
+        return insights, ("Common ground" if user_information else None)
+
+    monkeypatch.setattr(batch, "afind_profile_url", find_profile_url)
+    monkeypatch.setattr(batch, "afetch_profile", fetch_profile)
+    monkeypatch.setattr(batch, "prepare_profile_information", lambda data: data["full_name"])
+    monkeypatch.setattr(batch, "agenerate_analysis", generate_analysis)
+    return calls
+
+
+def _run_batch(queries, user_information=""):
+    async def run():
+        limits = StageLimits(search=2, scrape=2, llm=1)
+        rows = [row async for row in aanalyze_batch(queries, user_information, limits)]
+        return sorted(rows, key=lambda row: row["index"])
+
+    return asyncio.run(run())
+
+
+def test_batch_rows_use_the_shared_analysis(pipeline):
+    rows = _run_batch(["jane", "nobody", "broken", "jane"], user_information="About me")
+
+    assert [row["status"] for row in rows] == ["ok", "not_found", "error", "ok"]
+    assert rows[0]["result"] == {
+        "profile_url": "https://www.linkedin.com/in/jane",
+        "insights": {
+            "professional_summary": "Summary",
+            "personal_background": "Background",
+            "interesting_facts": ["Fact"],
+        },
+        "common_ground": "Common ground",
+    }
+    assert rows[2]["error"] == "scrape failed"
+    # Duplicate queries are analyzed once
+    assert pipeline == [("jane", "About me")]
+
+
+def test_batch_rows_without_user_information_have_no_common_ground(pipeline):
+    rows = _run_batch(["jane"])
+
+    assert "common_ground" not in rows[0]["result"]
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from connect_pro.scrapers.linkedin.html_extractors import extract_profile_from_html
+from connect_pro.scrapers.linkedin.profile_fields import parse_field_of_study
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_extracts_profile_from_snapshot():
+    page_source = (FIXTURES / "linkedin_profile.html").read_text(encoding="utf-8")
+
+    assert extract_profile_from_html(page_source) == {
+        "full_name": "Jane Doe",
+        "headline": "Staff Engineer at Acme",
+        "city": "Berlin",
+        "country": "Germany",
+        "summary": "Building distributed systems.",
+        "experiences": [
+            {
+                "title": "Staff Engineer",
+                "company": "Acme · Full-time",
+                "start_date": "Jan 2020",
+                "end_date": "Present",
+                "location": "Berlin, Germany",
+                "description": "Led the platform team.",
+            },
+            {
+                "title": "Software Engineer",
+                "company": "Initech",
+                "start_date": "Jun 2016",
+                "end_date": "Dec 2019",
+            },
+        ],
+        "education": [
+            {
+                "school": "Technical University of Munich",
+                "degree": "Master of Science",
+                "start_date": "2014",
+                "end_date": "2016",
+                "field_of_study": "Computer Science",
+            },
+            {
+                "school": "University of Vienna",
+                "degree": "Bachelor of Science",
+                "field_of_study": "Mathematics",
+            },
+            {
+                "school": "Online Academy",
+                "degree": "Certificate",
+            },
+        ],
+    }
+
+
+def test_empty_page_yields_empty_fields():
+    assert extract_profile_from_html("<html><body></body></html>") == {
+        "full_name": "",
+        "headline": "",
+        "summary": "",
+        "experiences": [],
+        "education": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Field of study Computer Science", "Computer Science"),
+        ("FIELD OF STUDY Physics", "Physics"),
+        ("field of study: Mathematics", "Mathematics"),
+        ("Field of study", None),
+        ("Data Engineering", None),
+        ("", None),
+    ],
+)
+def test_parse_field_of_study(text, expected):
+    assert parse_field_of_study(text) == expected
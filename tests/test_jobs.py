@@ -0,0 +1,217 @@
+import asyncio
+import socket
+
+import httpx
+import pytest
+import requests
+
+from connect_pro.jobs import queue as job_queue
+from connect_pro.jobs import webhooks, worker
+from connect_pro.jobs.queue import FAILED, QUEUED, SUCCEEDED, JobQueue
+from connect_pro.jobs.worker import JobWorkerPool
+from connect_pro.utils.retry import is_retryable_error
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(job_queue.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"), max_attempts=3)
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://upstream.test")
+    return httpx.HTTPStatusError(
+        "upstream error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def test_duplicate_submissions_keep_every_webhook(queue):
+    job, created = queue.submit("key", {"query": "Jane Doe"}, "https://a.example.com/hook")
+    duplicate, duplicate_created = queue.submit("key", {"query": "Jane Doe"}, "https://b.example.com/hook")
+    queue.submit("key", {"query": "Jane Doe"}, "https://a.example.com/hook")
+    queue.submit("key", {"query": "Jane Doe"})
+
+    assert created and not duplicate_created
+    assert duplicate.id == job.id
+    assert queue.get(job.id).webhook_urls == [
+        "https://a.example.com/hook",
+        "https://b.example.com/hook",
+    ]
+
+
+def test_retried_job_is_claimed_after_its_delay(queue, clock):
+    job, _ = queue.submit("key", {"query": "Jane Doe"})
+    claimed = queue.claim()
+    queue.retry(claimed.id, "HTTP 503", delay_sec=30)
+
+    retried = queue.get(job.id)
+    assert (retried.status, retried.error, retried.attempts) == (QUEUED, "HTTP 503", 1)
+    assert queue.claim() is None
+
+    clock.now += 30
+    assert queue.claim().attempts == 2
+
+
+def test_purge_drops_webhooks_of_deleted_jobs(queue, clock):
+    job, _ = queue.submit("key", {"query": "Jane Doe"}, "https://a.example.com/hook")
+    queue.claim()
+    queue.complete(job.id, {"profile_url": "https://www.linkedin.com/in/jane-doe"})
+
+    clock.now += 100
+    assert queue.purge(older_than_sec=10) == 1
+
+    new_job, created = queue.submit("key", {"query": "Jane Doe"})
+    assert created
+    assert new_job.webhook_urls == []
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (_status_error(429), True),
+        (_status_error(503), True),
+        (_status_error(404), False),
+        (asyncio.TimeoutError(), True),
+        (httpx.ConnectError("refused"), True),
+        (requests.ConnectionError("reset"), True),
+        (ValueError("Could not scrape profile"), False),
+    ],
+)
+def test_is_retryable_error(error, retryable):
+    assert is_retryable_error(error) is retryable
+
+
+def test_wrapped_errors_are_retryable():
+    try:
+        try:
+            raise _status_error(502)
+        except httpx.HTTPStatusError:
+            raise ValueError("Failed to scrape LinkedIn profile")
+    except ValueError as e:
+        assert is_retryable_error(e)
+
+
+@pytest.fixture
+def pool(queue, monkeypatch):
+    monkeypatch.setenv("JOB_RETRY_BACKOFF_BASE_SEC", "1")
+    monkeypatch.setenv("JOB_RETRY_BACKOFF_MAX_SEC", "1")
+    delivered = []
+
+    async def deliver(client, url, payload):
+        delivered.append((url, payload["status"]))
+
+    monkeypatch.setattr(worker, "deliver_webhook", deliver)
+    pool = JobWorkerPool(queue)
+    pool.delivered = delivered
+    return pool
+
+
+def _run_claimed(pool, queue, monkeypatch, outcome):
+    async def analyze(search_query, user_information=""):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(worker, "aanalyze_profile", analyze)
+
+    async def run():
+        await pool.start()
+        try:
+            await pool._run(queue.claim())
+        finally:
+            await pool.stop()
+
+    asyncio.run(run())
+
+
+def test_worker_requeues_transient_failures_until_max_attempts(pool, queue, clock, monkeypatch):
+    job, _ = queue.submit("key", {"query": "Jane Doe"}, "https://a.example.com/hook")
+
+    for attempt in (1, 2):
+        _run_claimed(pool, queue, monkeypatch, _status_error(503))
+        retried = queue.get(job.id)
+        assert (retried.status, retried.attempts) == (QUEUED, attempt)
+        assert pool.delivered == []
+        clock.now += 1
+
+    _run_claimed(pool, queue, monkeypatch, _status_error(503))
+    failed = queue.get(job.id)
+    assert (failed.status, failed.attempts) == (FAILED, 3)
+    assert pool.delivered == [("https://a.example.com/hook", FAILED)]
+
+
+def test_worker_fails_permanent_errors_right_away(pool, queue, monkeypatch):
+    job, _ = queue.submit("key", {"query": "Jane Doe"})
+
+    _run_claimed(pool, queue, monkeypatch, _status_error(404))
+
+    assert queue.get(job.id).status == FAILED
+
+
+def test_worker_notifies_every_webhook(pool, queue, monkeypatch):
+    job, _ = queue.submit("key", {"query": "Jane Doe"}, "https://a.example.com/hook")
+    queue.submit("key", {"query": "Jane Doe"}, "https://b.example.com/hook")
+
+    _run_claimed(pool, queue, monkeypatch, {"profile_url": "https://www.linkedin.com/in/jane-doe"})
+
+    assert queue.get(job.id).status == SUCCEEDED
+    assert pool.delivered == [
+        ("https://a.example.com/hook", SUCCEEDED),
+        ("https://b.example.com/hook", SUCCEEDED),
+    ]
+
+
+def _resolve_to(monkeypatch, address):
+    def getaddrinfo(host, port, *args, **kwargs):
+        family = socket.AF_INET6 if ":" in address else socket.AF_INET
+        return [(family, socket.SOCK_STREAM, 6, "", (address, port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+
+
+@pytest.mark.parametrize("address", ["127.0.0.1", "10.1.2.3", "169.254.169.254", "::ffff:127.0.0.1"])
+def test_webhook_host_resolving_to_a_private_address_is_refused(monkeypatch, address):
+    _resolve_to(monkeypatch, address)
+
+    with pytest.raises(ValueError, match="non-public"):
+        asyncio.run(webhooks.acheck_webhook_address("hooks.example.com", 443))
+
+
+def test_webhook_is_not_posted_to_a_private_address(monkeypatch):
+    _resolve_to(monkeypatch, "192.168.0.10")
+    requests_sent = []
+    transport = httpx.MockTransport(lambda request: requests_sent.append(request) or httpx.Response(200))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            await webhooks.deliver_webhook(client, "https://hooks.example.com/done", {"job_id": "1"})
+
+    asyncio.run(run())
+    assert requests_sent == []
+
+
+def test_webhook_is_posted_to_a_public_address(monkeypatch):
+    _resolve_to(monkeypatch, "93.184.215.14")
+    requests_sent = []
+    transport = httpx.MockTransport(lambda request: requests_sent.append(request) or httpx.Response(200))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            await webhooks.deliver_webhook(client, "https://hooks.example.com/done", {"job_id": "1"})
+
+    asyncio.run(run())
+    assert [str(request.url) for request in requests_sent] == ["https://hooks.example.com/done"]
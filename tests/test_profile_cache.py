@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from connect_pro.cache import sqlite_cache
+from connect_pro.cache.sqlite_cache import SQLiteCache
+from connect_pro.scrapers.linkedin.cache import (
+    CachedLinkedInClient,
+    canonicalize_profile_url,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_profile(self, linkedin_profile_url, mock=False):
+        self.calls.append(linkedin_profile_url)
+        return {"full_name": "Jane Doe", "fetch": len(self.calls)}
+
+    async def aget_profile(self, linkedin_profile_url, mock=False):
+        return self.get_profile(linkedin_profile_url, mock=mock)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(sqlite_cache.time, "time", clock)
+    return clock
+
+
+def _cache(tmp_path, **kwargs) -> SQLiteCache:
+    return SQLiteCache(path=str(tmp_path / "cache.sqlite3"), **kwargs)
+
+
+def test_roundtrip_with_compression(tmp_path):
+    cache = _cache(tmp_path, compress=True)
+    cache.set("key", {"name": "Jane", "skills": ["Python", "SQL"]})
+    assert cache.get("key") == {"name": "Jane", "skills": ["Python", "SQL"]}
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = _cache(tmp_path, ttl_sec=60)
+    cache.set("key", "value")
+
+    clock.now += 59
+    assert cache.get("key") == "value"
+    clock.now += 2
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = _cache(tmp_path, max_entries=2)
+    cache.set("a", 1)
+    clock.now += 1
+    cache.set("b", 2)
+    clock.now += 1
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    clock.now += 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_namespaces_share_a_file_but_not_entries(tmp_path):
+    profiles = _cache(tmp_path, namespace="profiles")
+    insights = _cache(tmp_path, namespace="insights")
+    profiles.set("key", "profile")
+
+    assert insights.get("key") is None
+    insights.clear()
+    assert profiles.get("key") == "profile"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.linkedin.com/in/jane-doe",
+        "https://www.linkedin.com/in/jane-doe/",
+        "http://linkedin.com/in/Jane-Doe?trk=public_profile",
+        "https://de.linkedin.com/in/jane-doe#experience",
+        "  https://www.linkedin.com/in/jane%2Ddoe/  ",
+    ],
+)
+def test_equivalent_profile_urls_are_canonicalized(url):
+    assert canonicalize_profile_url(url) == "https://www.linkedin.com/in/jane-doe"
+
+
+def test_non_profile_urls_are_kept():
+    assert canonicalize_profile_url(" https://example.com/jane ") == "https://example.com/jane"
+
+
+def test_cached_client_serves_equivalent_urls_from_one_entry(tmp_path):
+    client = _FakeClient()
+    cached_client = CachedLinkedInClient(client, _cache(tmp_path), source="proxycurl")
+
+    first = cached_client.get_profile("https://www.linkedin.com/in/jane-doe/")
+    second = asyncio.run(cached_client.aget_profile("https://de.linkedin.com/in/Jane-Doe?x=1"))
+    refreshed = cached_client.get_profile("https://www.linkedin.com/in/jane-doe", refresh=True)
+
+    assert first == second == {"full_name": "Jane Doe", "fetch": 1}
+    assert refreshed["fetch"] == 2
+    assert len(client.calls) == 2
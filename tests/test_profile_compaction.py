@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from connect_pro.llm.profile_compaction import compact_profile
+from connect_pro.llm.tokens import count_tokens
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+PROFILE_PATHS = sorted(DATA_DIR.glob("example_linkedin_profile_*.json"))
+
+
+@pytest.mark.parametrize("path", PROFILE_PATHS, ids=lambda path: path.name)
+@pytest.mark.parametrize("token_budget", [300, 600, 1000, 1500])
+def test_compacted_text_fits_the_budget(path, token_budget):
+    profile = json.loads(path.read_text(encoding="utf-8"))
+    compact = compact_profile(profile, token_budget=token_budget)
+
+    assert compact.tokens_after == count_tokens(compact.text)
+    assert compact.tokens_after <= token_budget
+
+
+def test_unlimited_budget_keeps_every_section():
+    profile = json.loads(PROFILE_PATHS[0].read_text(encoding="utf-8"))
+    compact = compact_profile(profile, token_budget=None)
+
+    assert compact.truncated_sections == []
+    assert compact.text.startswith("Name: ")
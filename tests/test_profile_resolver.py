@@ -0,0 +1,101 @@
+from connect_pro.agent.profile_resolver import (
+    MISMATCH_MAX_SCORE,
+    ResolverStats,
+    resolve_profile_url,
+    score_candidate,
+)
+
+THRESHOLD = 0.75
+
+
+def _candidate(title: str, slug: str) -> dict:
+    return {"title": f"{title} | LinkedIn", "url": f"https://www.linkedin.com/in/{slug}"}
+
+
+def test_exact_match_with_company_is_accepted():
+    candidate = _candidate("John Smith - Engineer - Google", "john-smith")
+    url, confidence = resolve_profile_url("John Smith Google", [candidate], THRESHOLD)
+    assert url == candidate["url"]
+    assert confidence > 0.9
+
+
+def test_name_only_query_is_accepted():
+    candidate = _candidate("Jane Doe - Product Manager - Acme", "jane-doe-1a2b3c")
+    url, _ = resolve_profile_url("Jane Doe", [candidate], THRESHOLD)
+    assert url == candidate["url"]
+
+
+def test_accents_and_prefixes_match():
+    candidate = _candidate("Anna Müller - Consultant - SAP", "anna-mueller")
+    assert score_candidate("Anna Muller SAP", candidate) >= THRESHOLD
+
+
+def test_wrong_company_is_rejected():
+    candidate = _candidate("John Smith - Engineer - Microsoft", "john-smith")
+    url, confidence = resolve_profile_url("John Smith Google", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_missing_surname_is_rejected():
+    candidate = _candidate("Anna - SAP", "anna-4711")
+    url, confidence = resolve_profile_url("Anna Müller SAP", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_surname_in_slug_covers_name():
+    candidate = _candidate("Anna - SAP", "anna-mueller")
+    assert score_candidate("Anna Müller SAP", candidate) >= THRESHOLD
+
+
+def test_different_surname_at_same_company_is_rejected():
+    candidate = _candidate("John Brown - Engineer - Google", "john-brown")
+    url, confidence = resolve_profile_url("John Smith Google", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_ambiguous_candidates_defer_to_agent():
+    candidates = [
+        _candidate("John Smith - Engineer - Google", "john-smith"),
+        _candidate("John Smith - Designer - Google", "john-smith-2"),
+    ]
+    url, confidence = resolve_profile_url("John Smith Google", candidates, THRESHOLD)
+    assert url is None
+    assert confidence >= THRESHOLD
+
+
+def test_non_profile_urls_are_ignored():
+    candidates = [{"title": "Google | LinkedIn", "url": "https://www.linkedin.com/company/google"}]
+    assert resolve_profile_url("John Smith Google", candidates, THRESHOLD) == (None, 0.0)
+
+
+def test_surname_prefix_does_not_cover_the_name():
+    candidate = _candidate("John Smithson - Engineer - Google", "john-smithson")
+    url, confidence = resolve_profile_url("John Smith Google", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_name_prefixes_in_slug_are_rejected():
+    candidate = _candidate("Annabelle Leeds", "annabelle-leeds")
+    url, confidence = resolve_profile_url("Ann Lee", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_first_and_last_name_prefixes_are_rejected():
+    candidate = _candidate("Daniel Kimball - Engineer - Meta", "daniel-kimball")
+    url, confidence = resolve_profile_url("Dan Kim Meta", [candidate], THRESHOLD)
+    assert url is None
+    assert confidence <= MISMATCH_MAX_SCORE
+
+
+def test_hit_rate():
+    stats = ResolverStats()
+    assert stats.hit_rate == 0.0
+    for hit in (True, True, False, True):
+        stats.record(hit)
+    assert stats.hit_rate == 0.75
+    assert stats.snapshot() == {"fast_path_hits": 3, "agent_fallbacks": 1, "hit_rate": 0.75}
@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+
+from connect_pro.scrapers.linkedin import proxycurl
+from connect_pro.scrapers.linkedin.proxycurl import ProxyCurlClient
+from connect_pro.utils import retry
+
+PROFILE_URL = "https://www.linkedin.com/in/jane-doe"
+
+
+def _response(status: int, body=None, retry_after=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://proxycurl.test/linkedin"
+    response._content = json.dumps(body if body is not None else {}).encode()
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+class _FakeSession:
+    """Returns (or raises) the scripted outcomes in order."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(proxycurl.time, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def _install(outcomes):
+        fake = _FakeSession(outcomes)
+        monkeypatch.setattr(proxycurl, "get_http_session", lambda: fake)
+        return fake
+
+    return _install
+
+
+@pytest.fixture
+def max_backoff(monkeypatch):
+    """Make the jittered backoff deterministic by always picking its upper bound."""
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+
+
+def test_retries_transient_failures_until_success(session, sleeps, max_backoff):
+    fake = session([
+        _response(503),
+        requests.ConnectionError("reset"),
+        _response(200, {"full_name": "Jane Doe", "profile_pic_url": "x", "summary": ""}),
+    ])
+
+    assert ProxyCurlClient().get_profile(PROFILE_URL) == {"full_name": "Jane Doe"}
+    assert fake.calls == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_backoff_grows_exponentially_up_to_the_cap(monkeypatch, session, sleeps, max_backoff):
+    monkeypatch.setenv("PROXYCURL_MAX_RETRIES", "5")
+    monkeypatch.setenv("PROXYCURL_BACKOFF_MAX_SEC", "3")
+    monkeypatch.setenv("PROXYCURL_DEADLINE_SEC", "60")
+    session([_response(500)] * 5 + [_response(200, {"full_name": "Jane Doe"})])
+
+    ProxyCurlClient().get_profile(PROFILE_URL)
+
+    assert sleeps == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_honors_retry_after(session, sleeps):
+    session([_response(429, retry_after="2"), _response(200, {"full_name": "Jane Doe"})])
+
+    ProxyCurlClient().get_profile(PROFILE_URL)
+
+    assert sleeps == [2.0]
+
+
+def test_does_not_retry_client_errors(session, sleeps):
+    fake = session([_response(404)])
+
+    with pytest.raises(requests.HTTPError):
+        ProxyCurlClient().get_profile(PROFILE_URL)
+    assert fake.calls == 1
+    assert sleeps == []
+
+
+def test_gives_up_after_max_retries(session, sleeps, max_backoff):
+    fake = session([_response(502)] * 4)
+
+    with pytest.raises(requests.HTTPError):
+        ProxyCurlClient().get_profile(PROFILE_URL)
+    assert fake.calls == 4
+    assert len(sleeps) == 3
+
+
+def test_gives_up_when_retry_after_exceeds_the_deadline(session, sleeps):
+    fake = session([_response(429, retry_after="120")])
+
+    with pytest.raises(requests.HTTPError):
+        ProxyCurlClient().get_profile(PROFILE_URL)
+    assert fake.calls == 1
+    assert sleeps == []
+
+
+def test_raises_the_last_transport_error(session, sleeps, max_backoff):
+    session([requests.Timeout("slow")] * 4)
+
+    with pytest.raises(requests.Timeout):
+        ProxyCurlClient().get_profile(PROFILE_URL)
+
+
+def test_give_up_without_response_or_error_raises_timeout():
+    with pytest.raises(TimeoutError):
+        proxycurl._give_up(3, None, None)
+
+
+def test_async_retries_with_retry_after(monkeypatch):
+    statuses = iter([503, 429, 200])
+    delays = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == 200:
+            return httpx.Response(200, json={"full_name": "Jane Doe"})
+        return httpx.Response(status, headers={"Retry-After": "0.25"})
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(proxycurl, "_get_async_client", lambda: client)
+        monkeypatch.setattr(proxycurl.asyncio, "sleep", fake_sleep)
+        try:
+            return await ProxyCurlClient().aget_profile(PROFILE_URL)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == {"full_name": "Jane Doe"}
+    assert delays == [0.25, 0.25]
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from connect_pro.scrapers.linkedin import selenium_scraper
+from connect_pro.utils import rate_limiter
+from connect_pro.utils.rate_limiter import RateLimitTimeout, TokenBucketRateLimiter
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    return clock
+
+
+def test_bucket_refills_at_rate(tmp_path, clock):
+    limiter = TokenBucketRateLimiter(str(tmp_path / "limits.sqlite3"), rate=0.5)
+
+    assert limiter.try_acquire("account") == 0
+    assert limiter.try_acquire("account") == pytest.approx(2.0)
+
+    clock.now += 1
+    assert limiter.try_acquire("account") == pytest.approx(1.0)
+
+    clock.now += 1
+    assert limiter.try_acquire("account") == 0
+
+
+def test_bucket_holds_at_most_capacity(tmp_path, clock):
+    limiter = TokenBucketRateLimiter(str(tmp_path / "limits.sqlite3"), rate=1, capacity=3)
+
+    assert [limiter.try_acquire("account") for _ in range(3)] == [0, 0, 0]
+    assert limiter.try_acquire("account") == pytest.approx(1.0)
+
+    # A long idle period refills no more than the burst size
+    clock.now += 3600
+    assert [limiter.try_acquire("account") for _ in range(3)] == [0, 0, 0]
+    assert limiter.try_acquire("account") > 0
+
+
+def test_buckets_are_per_key(tmp_path, clock):
+    limiter = TokenBucketRateLimiter(str(tmp_path / "limits.sqlite3"), rate=0.1)
+
+    assert limiter.try_acquire("a") == 0
+    assert limiter.try_acquire("b") == 0
+    assert limiter.try_acquire("a") > 0
+
+
+def test_limiters_on_the_same_store_share_buckets(tmp_path, clock):
+    path = str(tmp_path / "limits.sqlite3")
+    first = TokenBucketRateLimiter(path, rate=0.1)
+    second = TokenBucketRateLimiter(path, rate=0.1)
+
+    assert first.try_acquire("account") == 0
+    assert second.try_acquire("account") == pytest.approx(10.0)
+
+
+def test_buckets_are_shared_across_processes(tmp_path):
+    path = str(tmp_path / "limits.sqlite3")
+    script = textwrap.dedent(
+        f"""
+        from connect_pro.utils.rate_limiter import TokenBucketRateLimiter
+        print(TokenBucketRateLimiter({path!r}, rate=0.001).try_acquire("account"))
+        """
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    waits = [
+        float(subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+        ).stdout)
+        for _ in range(2)
+    ]
+
+    assert waits[0] == 0
+    assert waits[1] > 0
+
+
+def test_acquire_gives_up_when_the_wait_exceeds_the_timeout(tmp_path):
+    limiter = TokenBucketRateLimiter(str(tmp_path / "limits.sqlite3"), rate=0.01)
+    limiter.acquire("account", timeout=0)
+
+    with pytest.raises(RateLimitTimeout) as exc_info:
+        limiter.acquire("account", timeout=1)
+    assert exc_info.value.retry_after == pytest.approx(100, rel=0.01)
+
+    with pytest.raises(RateLimitTimeout):
+        asyncio.run(limiter.aacquire("account", timeout=1))
+
+
+def test_rate_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(str(tmp_path / "limits.sqlite3"), rate=0)
+
+
+@pytest.mark.parametrize("cooldown", [0, -1])
+def test_non_positive_cooldown_disables_the_limit(cooldown):
+    selenium_scraper.get_rate_limiter.cache_clear()
+    try:
+        assert selenium_scraper.get_rate_limiter(cooldown, 1) is None
+
+        scraper = selenium_scraper.SeleniumLinkedInScraper(cooldown_period_sec=cooldown)
+        assert scraper.cooldown_period_sec == cooldown
+        assert all(scraper._acquire_account() for _ in range(5))
+    finally:
+        selenium_scraper.get_rate_limiter.cache_clear()
+
+
+def test_sync_acquire_does_not_wait_for_budget(monkeypatch):
+    selenium_scraper.get_rate_limiter.cache_clear()
+    monkeypatch.setattr(selenium_scraper.time, "sleep", pytest.fail)
+    try:
+        scraper = selenium_scraper.SeleniumLinkedInScraper(cooldown_period_sec=3600)
+        scraper._acquire_account()
+
+        with pytest.raises(RateLimitTimeout) as exc_info:
+            scraper._acquire_account()
+        assert exc_info.value.retry_after == pytest.approx(3600, rel=0.01)
+    finally:
+        selenium_scraper.get_rate_limiter.cache_clear()
@@ -0,0 +1,52 @@
+import pytest
+
+from connect_pro import main
+from connect_pro.config.settings import get_settings
+from connect_pro.llm.response_cache import LLMResponseCache, get_llm_response_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache():
+    get_llm_response_cache.cache_clear()
+    yield
+    get_llm_response_cache.cache_clear()
+
+
+def _key(**inputs):
+    return LLMResponseCache.make_key("profile_insights", "gpt-4o-mini", 0, "v1", **inputs)
+
+
+def test_key_is_stable_for_the_same_inputs():
+    assert _key(profile_information="profile") == _key(profile_information="profile")
+    assert _key(profile_information="profile") != _key(profile_information="other")
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [("LLM_OUTPUT_MODE", "native"), ("LLM_COMBINED_ANALYSIS", "true")],
+)
+def test_key_covers_output_settings(monkeypatch, name, value):
+    default_key = _key(profile_information="profile")
+
+    monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+
+    assert _key(profile_information="profile") != default_key
+
+
+def test_results_round_trip_through_the_cache():
+    key = main._common_ground_cache_key("profile", " about me ", "gpt-4o-mini")
+
+    assert main._get_cached_common_ground(key) is None
+    main._store_llm_result(key, "common ground")
+    assert main._get_cached_common_ground(key) == "common ground"
+
+
+def test_disabled_cache_is_skipped(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+
+    key = main._common_ground_cache_key("profile", "about me", "gpt-4o-mini")
+    main._store_llm_result(key, "common ground")
+
+    assert key is None
+    assert main._get_cached_common_ground(key) is None
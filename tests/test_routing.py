@@ -0,0 +1,134 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from connect_pro.llm import routing
+from connect_pro.llm.routing import (
+    TASK_COMMON_GROUND,
+    TASK_INSIGHTS,
+    ModelRouter,
+    Route,
+    _RouteHealth,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(routing.time, "monotonic", clock)
+    return clock
+
+
+def _router(**kwargs):
+    options = {"max_error_rate": 0.5, "health_window": 4, "min_samples": 2, "cooldown_sec": 60}
+    options.update(kwargs)
+    return ModelRouter(
+        routes=[],
+        default_route=Route(
+            name="default", model="gpt-4o", fallback_model="gpt-4o-mini", latency_slo_sec=2.0
+        ),
+        **options,
+    )
+
+
+def _record(health, duration, ok, latency_slo_sec=2.0):
+    return health.record(
+        duration, ok, latency_slo_sec, max_error_rate=0.5, min_samples=2, cooldown_sec=60
+    )
+
+
+def test_route_matches_task_and_profile_size():
+    route = Route(name="small", model="gpt-4o-mini", tasks=(TASK_INSIGHTS,), max_profile_tokens=500)
+
+    assert route.matches(TASK_INSIGHTS, 200)
+    assert not route.matches(TASK_INSIGHTS, 800)
+    assert not route.matches(TASK_COMMON_GROUND, 200)
+    # A size-based route never matches an unmeasured profile
+    assert not route.matches(TASK_INSIGHTS, None)
+    assert Route(name="any", model="gpt-4o").matches(TASK_COMMON_GROUND, None)
+
+
+def test_route_health_degrades_on_errors_until_the_cooldown_ends(clock):
+    health = _RouteHealth(samples=deque(maxlen=4))
+
+    assert _record(health, 0.5, False) is None  # below min_samples
+    assert _record(health, 0.5, False) == "error rate 100%"
+    assert health.is_degraded()
+
+    clock.now += 59
+    assert health.is_degraded()
+    clock.now += 1
+    assert not health.is_degraded()
+    # Judged on fresh samples after the cooldown
+    assert _record(health, 0.5, True) is None
+
+
+def test_route_health_degrades_on_p95_latency(clock):
+    health = _RouteHealth(samples=deque(maxlen=4))
+
+    _record(health, 0.5, True)
+    assert _record(health, 3.0, True).startswith("p95 latency 3.00s")
+    assert health.is_degraded()
+
+
+def test_degraded_route_selects_its_fallback_model(clock):
+    router = _router()
+    for _ in range(2):
+        routed = router.select(TASK_INSIGHTS, "profile")
+        with pytest.raises(RuntimeError):
+            with routed.track():
+                raise RuntimeError("upstream 503")
+
+    degraded = router.select(TASK_INSIGHTS, "profile")
+    assert (degraded.model, degraded.primary_model) == ("gpt-4o-mini", "gpt-4o")
+
+    clock.now += 60
+    assert router.select(TASK_INSIGHTS, "profile").model == "gpt-4o"
+
+
+def test_failed_call_is_retried_once_on_the_fallback_model():
+    routed = _router().select(TASK_INSIGHTS, "profile")
+    calls = []
+
+    def call(model_name, config):
+        calls.append(model_name)
+        if model_name == "gpt-4o":
+            raise RuntimeError("upstream 503")
+        return "insights"
+
+    assert routed.invoke(call) == "insights"
+    assert calls == ["gpt-4o", "gpt-4o-mini"]
+    assert (routed.model, routed.primary_model) == ("gpt-4o-mini", "gpt-4o")
+
+
+def test_fallback_failure_is_raised():
+    routed = _router().select(TASK_INSIGHTS, "profile")
+
+    async def call(model_name, config):
+        raise RuntimeError(f"{model_name} down")
+
+    with pytest.raises(RuntimeError, match="gpt-4o-mini down"):
+        asyncio.run(routed.ainvoke(call))
+
+
+def test_route_without_fallback_raises_right_away():
+    router = ModelRouter(routes=[], default_route=Route(name="default", model="gpt-4o"))
+    routed = router.select(TASK_INSIGHTS, "profile")
+    calls = []
+
+    def call(model_name, config):
+        calls.append(model_name)
+        raise RuntimeError("upstream 503")
+
+    with pytest.raises(RuntimeError):
+        routed.invoke(call)
+    assert calls == ["gpt-4o"]
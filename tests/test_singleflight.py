@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from connect_pro.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", work)
+        started.wait(5)
+        followers = [executor.submit(flight.do, "key", work) for _ in range(3)]
+        release.set()
+        results = [leader.result(5)] + [follower.result(5) for follower in followers]
+
+    assert calls == [1]
+    assert all(result == {"value": 42} for result in results)
+
+
+def test_exceptions_propagate_to_followers():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        started.wait(5)
+        follower = executor.submit(flight.do, "key", fail)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="boom"):
+                future.result(5)
+
+    # The failed call is forgotten, so the next one runs again
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_async_concurrent_calls_share_one_task():
+    async def run():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(*(flight.do("key", work, 7) for _ in range(5)))
+        return calls, results, flight.in_flight()
+
+    calls, results, in_flight = asyncio.run(run())
+    assert calls == [7]
+    assert results == [7] * 5
+    assert in_flight == 0
+
+
+def test_async_exceptions_propagate_to_followers():
+    async def run():
+        flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        return await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+def test_cancelled_leader_does_not_cancel_the_shared_task():
+    async def run():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return leader, await follower
+
+    leader, result = asyncio.run(run())
+    assert leader.cancelled()
+    assert result == "done"
+
+
+def test_shared_task_finishes_when_every_caller_is_cancelled():
+    async def run():
+        flight = AsyncSingleFlight()
+        finished = asyncio.Event()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            finished.set()
+            return "done"
+
+        caller = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(finished.wait(), 1)
+        await asyncio.sleep(0)
+        return flight.in_flight()
+
+    assert asyncio.run(run()) == 0
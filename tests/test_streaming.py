@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessageChunk
+
+from connect_pro import streaming
+from connect_pro.llm.structured_output import astream_structured_output
+from connect_pro.schemas.profile_insights import ProfileInsights
+
+
+async def _chunks(*texts):
+    for text in texts:
+        yield AIMessageChunk(content=text)
+
+
+def _collect(chunks, schema=ProfileInsights):
+    async def run():
+        return [item async for item in astream_structured_output(chunks, schema)]
+
+    return asyncio.run(run())
+
+
+def test_partials_grow_and_the_last_item_is_validated():
+    items = _collect(_chunks(
+        '{"professional_summary": "Data',
+        ' scientist", "personal_background": "Berlin",',
+        ' "interesting_facts": ["Runs"]}',
+    ))
+
+    assert items[0] == {"professional_summary": "Data"}
+    assert items[-1] == {
+        "professional_summary": "Data scientist",
+        "personal_background": "Berlin",
+        "interesting_facts": ["Runs"],
+    }
+
+
+def test_complete_output_is_repaired_like_non_streamed_output():
+    items = _collect(_chunks(
+        "Here you go:\n```json\n",
+        '{"professional_summary": "Data scientist", "personal_background": "Berlin",',
+        ' "interesting_facts": "Runs marathons",}\n```',
+    ))
+
+    assert items[-1]["interesting_facts"] == ["Runs marathons"]
+
+
+def test_unrepairable_output_raises_a_parser_error():
+    with pytest.raises(OutputParserException):
+        _collect(_chunks('{"professional_summary": "Data scientist"}'))
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    async def find_profile_url(search_query):
+        return "https://www.linkedin.com/in/jane-doe"
+
+    async def fetch_profile(profile_url):
+        return {"full_name": "Jane Doe"}, False
+
+    monkeypatch.setattr(streaming, "afind_profile_url", find_profile_url)
+    monkeypatch.setattr(streaming, "_afetch_profile_with_cache_status", fetch_profile)
+    monkeypatch.setattr(streaming, "prepare_profile_information", lambda data: data["full_name"])
+
+
+def _events(search_query="Jane Doe", user_information=""):
+    async def run():
+        return [event async for event in streaming.astream_analysis(search_query, user_information)]
+
+    return asyncio.run(run())
+
+
+def test_invalid_model_output_ends_the_stream_with_an_error_event(pipeline, monkeypatch):
+    async def insights(profile_information):
+        yield {"professional_summary": "Data scientist"}
+        raise OutputParserException("Could not parse ProfileInsights from the model output")
+
+    monkeypatch.setattr(streaming, "astream_insights_from_profile", insights)
+
+    events = _events()
+
+    name, data = events[-1]
+    assert events[-2][0] == "insights_partial"
+    assert (name, data["error"]) == ("error", "invalid_output")
+    assert data["detail"].startswith("Could not parse ProfileInsights")
+
+
+def test_combined_analysis_streams_insights_and_common_ground(pipeline, monkeypatch):
+    monkeypatch.setenv("LLM_COMBINED_ANALYSIS", "true")
+    insights = {
+        "professional_summary": "Data scientist",
+        "personal_background": "Berlin",
+        "interesting_facts": ["Runs"],
+    }
+
+    async def combined(profile_information, user_information):
+        yield {**insights, "common_ground": "You both"}
+        yield {**insights, "common_ground": "You both like ML."}
+
+    monkeypatch.setattr(streaming, "astream_combined_analysis", combined)
+
+    events = _events(user_information="I like ML")
+
+    assert [data["text"] for name, data in events if name == "common_ground_delta"] == [
+        "You both",
+        " like ML.",
+    ]
+    assert events[-1] == (
+        "done",
+        {
+            "profile_url": "https://www.linkedin.com/in/jane-doe",
+            "insights": insights,
+            "common_ground": "You both like ML.",
+        },
+    )
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+from pydantic import ValidationError
+
+from connect_pro.llm.structured_output import (
+    coerce_to_schema,
+    parse_structured_output,
+    repair_json,
+)
+from connect_pro.schemas.profile_insights import ProfileAnalysis, ProfileInsights
+
+INSIGHTS = {
+    "professional_summary": "Data scientist at Acme.",
+    "personal_background": "Grew up in Berlin.",
+    "interesting_facts": ["Runs marathons", "Speaks four languages"],
+}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        f"```json\n{json.dumps(INSIGHTS)}\n```",
+        f"```\n{json.dumps(INSIGHTS)}\n```",
+        f"Here are the insights:\n{json.dumps(INSIGHTS)}\nLet me know if you need more.",
+    ],
+)
+def test_repair_json_strips_code_fences_and_prose(text):
+    assert repair_json(text) == INSIGHTS
+
+
+def test_repair_json_drops_trailing_commas():
+    text = '{"interesting_facts": ["Runs marathons",], "personal_background": "Berlin",}'
+
+    assert repair_json(text) == {
+        "interesting_facts": ["Runs marathons"],
+        "personal_background": "Berlin",
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"professional_summary": "Data scien', {"professional_summary": "Data scien"}),
+        (
+            '{"professional_summary": "Data scientist", "interesting_facts": ["Runs", "Spe',
+            {"professional_summary": "Data scientist", "interesting_facts": ["Runs", "Spe"]},
+        ),
+        ('```json\n{"personal_background": "Berlin", ', {"personal_background": "Berlin"}),
+    ],
+)
+def test_repair_json_closes_truncated_output(text, expected):
+    assert repair_json(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "I could not analyze this profile.", "[1, 2, 3]"])
+def test_repair_json_without_an_object_raises(text):
+    with pytest.raises(ValueError):
+        repair_json(text)
+
+
+def test_coerce_ignores_extra_keys():
+    insights = coerce_to_schema({**INSIGHTS, "confidence": 0.9, "notes": ["x"]}, ProfileInsights)
+
+    assert insights.to_dict() == INSIGHTS
+
+
+def test_coerce_unwraps_a_single_enclosing_key():
+    assert coerce_to_schema({"insights": INSIGHTS}, ProfileInsights).to_dict() == INSIGHTS
+
+
+def test_coerce_fixes_list_and_string_drift():
+    insights = coerce_to_schema(
+        {**INSIGHTS, "personal_background": ["Grew up", "in Berlin."], "interesting_facts": "Runs"},
+        ProfileInsights,
+    )
+
+    assert insights.personal_background == "Grew up in Berlin."
+    assert insights.interesting_facts == ["Runs"]
+
+
+def test_coerce_trims_lists_to_the_maximum_length():
+    facts = [f"Fact {number}" for number in range(8)]
+
+    insights = coerce_to_schema({**INSIGHTS, "interesting_facts": facts}, ProfileInsights)
+
+    assert insights.interesting_facts == facts[:5]
+
+
+def test_coerce_rejects_lists_below_the_minimum_length():
+    with pytest.raises(ValidationError):
+        coerce_to_schema({**INSIGHTS, "interesting_facts": []}, ProfileInsights)
+
+
+def test_coerce_rejects_missing_fields():
+    with pytest.raises(ValidationError):
+        coerce_to_schema({"professional_summary": "Data scientist"}, ProfileAnalysis)
+
+
+def test_parse_structured_output_repairs_the_reply_text():
+    message = AIMessage(content=f"```json\n{json.dumps(INSIGHTS)[:-1]},}}\n```")
+
+    assert parse_structured_output(message, ProfileInsights).to_dict() == INSIGHTS
+
+
+def test_parse_structured_output_reads_tool_call_arguments():
+    message = AIMessage(
+        content="",
+        tool_calls=[{"name": "ProfileInsights", "args": INSIGHTS, "id": "call_1"}],
+    )
+
+    assert parse_structured_output(message, ProfileInsights).to_dict() == INSIGHTS
+
+
+def test_parse_structured_output_raises_a_retryable_error():
+    with pytest.raises(OutputParserException):
+        parse_structured_output(AIMessage(content="Sorry, I can't help."), ProfileInsights)
@@ -0,0 +1,60 @@
+import pytest
+
+from connect_pro.search import tavily_search
+
+PROFILE_RESULT = {"url": "https://www.linkedin.com/in/jane-doe ", "title": "Jane Doe - Acme "}
+
+
+class _FakeTavilyClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def search(self, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return {"results": response}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(tavily_search, "_search_cache", None)
+
+    def install(*responses):
+        fake = _FakeTavilyClient(responses)
+        monkeypatch.setattr(tavily_search, "_get_client", lambda: fake)
+        return fake
+
+    return install
+
+
+def test_results_are_filtered_and_cached(client):
+    fake = client(
+        [PROFILE_RESULT, {"url": "https://www.linkedin.com/company/acme", "title": "Acme"}]
+    )
+    expected = [{"url": "https://www.linkedin.com/in/jane-doe", "title": "Jane Doe - Acme"}]
+
+    assert tavily_search.get_profile_data_search_tavily("Jane  Doe Acme") == expected
+    assert tavily_search.get_profile_data_search_tavily("jane doe acme") == expected
+    assert fake.calls == 1
+
+
+def test_callers_can_not_modify_the_cached_results(client):
+    client([PROFILE_RESULT])
+    results = tavily_search.get_profile_data_search_tavily("Jane Doe Acme")
+    results[0]["url"] = "changed"
+    results.clear()
+
+    cached = tavily_search.get_profile_data_search_tavily("Jane Doe Acme")
+    assert cached[0]["url"] == "https://www.linkedin.com/in/jane-doe"
+
+
+def test_empty_and_failed_searches_are_not_cached(client):
+    fake = client([], RuntimeError("upstream down"), [PROFILE_RESULT])
+
+    assert tavily_search.get_profile_data_search_tavily("Jane Doe Acme") == []
+    assert tavily_search.get_profile_data_search_tavily("Jane Doe Acme") is None
+    assert len(tavily_search.get_profile_data_search_tavily("Jane Doe Acme")) == 1
+    assert fake.calls == 3